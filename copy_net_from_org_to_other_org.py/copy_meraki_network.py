@@ -30,15 +30,47 @@ creating duplicates. Unsupported or read‑only fields are skipped gracefully.
 Author  : Jose Rosa
 Updated : 2025‑06‑24
 
-Run from CLI or import `clone_network()`.
+Run from CLI or import `clone_network()` / `clone_network_async()`;
+bulk migrations use `--manifest` / `clone_networks()`.
 """
 
 import argparse
+import asyncio
+import contextlib
+import contextvars
+import copy
+import csv
+import functools
+import hashlib
+import ipaddress
+import json
 import logging
+import math
+import os
+import sqlite3
+import sys
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zlib
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from difflib import SequenceMatcher
 from typing import Any, Dict, List, Mapping
+from urllib.parse import urlsplit
 
 import meraki
-from meraki.exceptions import APIError
+import meraki.aio
+from meraki.exceptions import APIError, AsyncAPIError
+
+try:  # optional: export trace spans to an OTLP collector
+    from opentelemetry import trace as otel_trace
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+except ImportError:  # pragma: no cover
+    otel_trace = None
 
 # ----------------------------
 # Logging Setup
@@ -53,319 +85,1749 @@ def setup_logging(level: str = "INFO") -> None:
 
 log = logging.getLogger("meraki-cloner")
 
+# Meraki allows ~10 requests/s per organisation; a handful of concurrent
+# workers keeps the pipe full without living in 429 back-off.
+DEFAULT_WORKERS = 4
+DEFAULT_PARALLEL_CLONES = 4
+# Bulk mode: clones writing to one org at once, so one busy org can't take
+# every slot.
+DEFAULT_PER_ORG_CLONES = 2
+# Client-side request budget, shared by every call on one session (one per
+# organisation in bulk mode).
+DEFAULT_RATE = 10.0
+MAX_RETRIES = 8
+# --cache-dir entries are refetched after an hour.
+DEFAULT_CACHE_TTL = 3600
+
+# ----------------------------
+# Dashboard wrappers
+# ----------------------------
+
+class DashboardProxy:
+    """Route every endpoint call on a (Async)DashboardAPI through ``_call``.
+
+    Subclasses override ``_call`` (blocking) and ``_acall`` (meraki.aio) to
+    add behaviour around API calls. Proxies stack; ``db.batch`` and session
+    internals pass straight through untouched.
+    """
+
+    _SECTIONS = frozenset({
+        "administered", "organizations", "networks", "devices", "appliance", "camera",
+        "cellularGateway", "insight", "licensing", "sensor", "sm", "switch", "wireless",
+    })
+
+    def __init__(self, db, *, asynchronous=None):
+        self._db = db
+        if asynchronous is None:
+            asynchronous = (db._asynchronous if isinstance(db, DashboardProxy)
+                            else isinstance(db, meraki.aio.AsyncDashboardAPI))
+        self._asynchronous = asynchronous
+
+    def __getattr__(self, name):
+        attr = getattr(self._db, name)
+        if name in self._SECTIONS:
+            return _ProxySection(self, name, attr)
+        return attr
+
+    def _call(self, endpoint, fn, args, kwargs):
+        return fn(*args, **kwargs)
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        return await fn(*args, **kwargs)
+
+
+class _ProxySection:
+    def __init__(self, proxy, name, section):
+        self._proxy = proxy
+        self._name = name
+        self._section = section
+
+    def __getattr__(self, name):
+        fn = getattr(self._section, name)
+        if name.startswith("_") or not callable(fn):
+            return fn
+        proxy, endpoint = self._proxy, f"{self._name}.{name}"
+
+        if proxy._asynchronous:
+            async def call(*args, **kwargs):
+                return await proxy._acall(endpoint, fn, args, kwargs)
+        else:
+            def call(*args, **kwargs):
+                return proxy._call(endpoint, fn, args, kwargs)
+        call.__name__ = name
+        return call
+
+
+class TokenBucket:
+    """Thread-safe token bucket: *rate* requests/s with bursts up to *burst*.
+
+    Callers reserve a token up front and sleep off any deficit, so waiting
+    callers are served in arrival order. Wait time is tracked for reporting.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+
+    def reserve(self):
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.calls += 1
+            if wait:
+                self.throttled += 1
+                self.wait_seconds += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait:
+            with TRACER.span("client throttle", "rate_limit", wait=round(wait, 3)):
+                time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait:
+            with TRACER.span("client throttle", "rate_limit", wait=round(wait, 3)):
+                await asyncio.sleep(wait)
+
+    def stats(self):
+        return {"calls": self.calls, "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3), "max_wait": round(self.max_wait, 3)}
+
+
+class RateLimitedDashboard(DashboardProxy):
+    """Hold every API call until *bucket* has a token for it."""
+
+    def __init__(self, db, bucket, **kwargs):
+        super().__init__(db, **kwargs)
+        self.bucket = bucket
+
+    def _call(self, endpoint, fn, args, kwargs):
+        self.bucket.acquire()
+        return fn(*args, **kwargs)
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        await self.bucket.acquire_async()
+        return await fn(*args, **kwargs)
+
+    def budgets(self):
+        """(org id or None, bucket) pairs, for reporting."""
+        return [(None, self.bucket)]
+
+
+# Organisation a bulk-mode clone writes to; calls not otherwise attributable
+# to an org are charged to it.
+_ORG = contextvars.ContextVar("meraki_clone_org", default=None)
+
+
+class OrgRateLimitedDashboard(RateLimitedDashboard):
+    """Give every organisation its own *rate*/*burst* bucket, as the Dashboard does.
+
+    A call is charged to the org its scope id belongs to (see :meth:`assign`;
+    ``organizations.*`` calls to the org they name), else to the org of the
+    clone it runs in (``_ORG``), else to a shared fallback bucket.
+    """
+
+    def __init__(self, db, rate, burst=None, **kwargs):
+        super().__init__(db, TokenBucket(rate, burst), **kwargs)
+        self.rate, self.burst = rate, burst
+        self.buckets = {}
+        self._owner = {}
+        self._lock = threading.Lock()
+
+    def assign(self, scope, org):
+        """Charge calls about *scope* (a network id or serial) to *org*."""
+        self._owner[str(scope)] = str(org)
+
+    def _bucket(self, endpoint, args, kwargs):
+        scope = _scope(args, kwargs)
+        if endpoint.startswith("organizations.") and scope is not None:
+            org = str(scope)
+        else:
+            org = self._owner.get(str(scope)) or _ORG.get()
+        if org is None:
+            return self.bucket
+        with self._lock:
+            bucket = self.buckets.get(org)
+            if bucket is None:
+                bucket = self.buckets[org] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def _call(self, endpoint, fn, args, kwargs):
+        self._bucket(endpoint, args, kwargs).acquire()
+        return fn(*args, **kwargs)
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        await self._bucket(endpoint, args, kwargs).acquire_async()
+        return await fn(*args, **kwargs)
+
+    def budgets(self):
+        with self._lock:
+            per_org = sorted(self.buckets.items())
+        return per_org + ([(None, self.bucket)] if self.bucket.calls else [])
+
+
+_SCOPE_KWARGS = ("networkId", "serial", "organizationId")
+
+
+def _scope(args, kwargs):
+    """The object a call is about: its first id argument (network, device or org)."""
+    if args:
+        return args[0]
+    return next((kwargs[k] for k in _SCOPE_KWARGS if k in kwargs), None)
+
+
+# Reads whose answer changes without any write from us; never cached.
+_VOLATILE_ENDPOINTS = frozenset({
+    "organizations.getOrganizationActionBatch",
+    "organizations.getOrganizationActionBatches",
+})
+
+
+class CachedDashboard(DashboardProxy):
+    """Per-run read-through cache for ``get*`` calls.
+
+    Entries are keyed by (endpoint, scope id, args). Any other call (update,
+    create, delete…) invalidates every entry cached for the id it writes to,
+    so destination reads after a write always go back to the API. Reads that
+    race a write to the same id are not stored. Polled status endpoints
+    (``_VOLATILE_ENDPOINTS``) always go to the API.
+    """
+
+    def __init__(self, db, **kwargs):
+        super().__init__(db, **kwargs)
+        self._entries = {}
+        self._generation = Counter()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(endpoint, args, kwargs):
+        return endpoint, _scope(args, kwargs), json.dumps([args, kwargs], sort_keys=True, default=str)
+
+    def invalidate(self, scope=None):
+        """Drop cached reads for *scope* (a network/device/org id), or everything."""
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[1] == scope]:
+                    del self._entries[key]
+            self._generation[scope] += 1
+
+    def _lookup(self, key):
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return True, copy.deepcopy(self._entries[key]), None
+            self.misses += 1
+            return False, None, (self._generation[key[1]], self._generation[None])
+
+    def _store(self, key, generation, value):
+        with self._lock:
+            if generation == (self._generation[key[1]], self._generation[None]):
+                self._entries[key] = copy.deepcopy(value)
+
+    def _call(self, endpoint, fn, args, kwargs):
+        if endpoint in _VOLATILE_ENDPOINTS:
+            return fn(*args, **kwargs)
+        if not endpoint.split(".", 1)[1].startswith("get"):
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.invalidate(_scope(args, kwargs))
+        key = self._key(endpoint, args, kwargs)
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        value = fn(*args, **kwargs)
+        self._store(key, generation, value)
+        return value
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        if endpoint in _VOLATILE_ENDPOINTS:
+            return await fn(*args, **kwargs)
+        if not endpoint.split(".", 1)[1].startswith("get"):
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                self.invalidate(_scope(args, kwargs))
+        key = self._key(endpoint, args, kwargs)
+        hit, value, generation = self._lookup(key)
+        if hit:
+            return value
+        value = await fn(*args, **kwargs)
+        self._store(key, generation, value)
+        return value
+
+class ResponseStore:
+    """SQLite file of zlib-compressed JSON responses, shared across runs.
+
+    Entries older than *ttl* seconds are treated as absent (``0`` keeps them
+    until invalidated). Safe to share between threads.
+    """
+
+    FILENAME = "responses.sqlite3"
+
+    def __init__(self, directory, ttl=DEFAULT_CACHE_TTL):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.FILENAME)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, "
+                           "scope TEXT, stored REAL NOT NULL, body BLOB NOT NULL)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_scope ON responses (scope)")
+
+    def get(self, key):
+        """Return ``(found, value)`` for *key*, ignoring expired entries."""
+        oldest = time.time() - self.ttl if self.ttl else 0
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM responses WHERE key = ? AND stored >= ?", (key, oldest)).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(zlib.decompress(row[0]))
+
+    def put(self, key, endpoint, scope, value):
+        body = zlib.compress(json.dumps(value, separators=(",", ":")).encode())
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                               (key, endpoint, None if scope is None else str(scope), time.time(), body))
+
+    def invalidate(self, scope=None):
+        """Drop entries for *scope* (a network/device/org id), or everything; returns how many."""
+        with self._lock:
+            if scope is None:
+                return self._conn.execute("DELETE FROM responses").rowcount
+            return self._conn.execute("DELETE FROM responses WHERE scope = ?", (str(scope),)).rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+# Cleared by _fresh_reads(); reads made meanwhile skip the on-disk store.
+_PERSIST_READS = contextvars.ContextVar("meraki_clone_persist_reads", default=True)
+
+
+@contextlib.contextmanager
+def _fresh_reads():
+    """Send reads inside the block (and threads submitted in its context) past the on-disk store."""
+    token = _PERSIST_READS.set(False)
+    try:
+        yield
+    finally:
+        _PERSIST_READS.reset(token)
+
+
+class PersistentCachedDashboard(CachedDashboard):
+    """:class:`CachedDashboard` whose entries live in a :class:`ResponseStore` and outlive the run.
+
+    Only reads about an id in *scopes* (the source networks and their orgs)
+    are stored or served; destination reads, and any read inside
+    :func:`_fresh_reads`, always go to the API, since the destination can
+    change between runs without us writing to it. Same keys, write
+    invalidation and volatile endpoints; a write also drops the stored
+    entries for its id, so later runs never see them.
+    """
+
+    def __init__(self, db, store, scopes=(), **kwargs):
+        super().__init__(db, **kwargs)
+        self.store = store
+        self.scopes = {str(scope) for scope in scopes}
+
+    def _bypass(self, endpoint, args, kwargs):
+        """True for reads that must not touch the store."""
+        if not endpoint.split(".", 1)[1].startswith("get"):
+            return False
+        return not _PERSIST_READS.get() or str(_scope(args, kwargs)) not in self.scopes
+
+    def _call(self, endpoint, fn, args, kwargs):
+        if self._bypass(endpoint, args, kwargs):
+            return fn(*args, **kwargs)
+        return super()._call(endpoint, fn, args, kwargs)
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        if self._bypass(endpoint, args, kwargs):
+            return await fn(*args, **kwargs)
+        return await super()._acall(endpoint, fn, args, kwargs)
+
+    @staticmethod
+    def _store_key(key):
+        endpoint, _, params = key
+        return hashlib.sha256(f"{endpoint}\0{params}".encode()).hexdigest()
+
+    def invalidate(self, scope=None):
+        with self._lock:
+            self.store.invalidate(scope)
+            self._generation[scope] += 1
+
+    def _lookup(self, key):
+        found, value = self.store.get(self._store_key(key))
+        with self._lock:
+            if found:
+                self.hits += 1
+                return True, value, None
+            self.misses += 1
+            return False, None, (self._generation[key[1]], self._generation[None])
+
+    def _store(self, key, generation, value):
+        with self._lock:
+            if generation == (self._generation[key[1]], self._generation[None]):
+                self.store.put(self._store_key(key), key[0], key[1], value)
+
+
+def _invalidate(db, scope=None):
+    """Drop cached reads for *scope* from every cache layer of *db*."""
+    while isinstance(db, DashboardProxy):
+        if isinstance(db, CachedDashboard):
+            db.invalidate(scope)
+        db = db._db
+
+
+def _persist_scope(db, scope):
+    """Let the on-disk cache of *db* (if any) keep reads about *scope*, e.g. a source org."""
+    disk = _find_proxy(db, PersistentCachedDashboard)
+    if disk is not None:
+        disk.scopes.add(str(scope))
+
+# ----------------------------
+# Tracing
+# ----------------------------
+#
+# Spans cover the clone, each sync stage, each object pushed by _upsert /
+# _clone_optional, every HTTP attempt and every wait on a rate limit. They are
+# kept as Chrome trace events (open the file in Perfetto or chrome://tracing)
+# and/or exported to an OTLP collector. Threads and asyncio tasks each get
+# their own track, so overlapping work shows up side by side.
+
+class Tracer:
+    """Collect spans as Chrome trace events and optionally forward them over OTLP.
+
+    Disabled until :meth:`start`; until then ``span()`` is a no-op.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._events = []
+        self._tracks = {}
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._otel = None
+        self._provider = None
+
+    def start(self, otlp_endpoint=None):
+        """Start recording; with *otlp_endpoint* (e.g. ``http://localhost:4318/v1/traces``) also export over OTLP."""
+        if otlp_endpoint:
+            if otel_trace is None:
+                raise RuntimeError("OTLP export needs the optional 'opentelemetry-sdk' and "
+                                   "'opentelemetry-exporter-otlp-proto-http' packages")
+            self._provider = TracerProvider(resource=Resource.create({"service.name": "meraki-cloner"}))
+            self._provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=otlp_endpoint)))
+            self._otel = self._provider.get_tracer("copy_meraki_network")
+        self._t0 = time.perf_counter()
+        self.enabled = True
+
+    def span(self, name, cat, **attrs):
+        """Context manager timing *name*; it yields a dict of attributes the body may add to."""
+        if not self.enabled:
+            return contextlib.nullcontext(attrs)
+        return self._span(name, cat, attrs)
+
+    def _track(self):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = ("task", id(task)) if task else ("thread", threading.get_ident())
+        with self._lock:
+            if key not in self._tracks:
+                label = task.get_name() if task else threading.current_thread().name
+                self._tracks[key] = len(self._tracks) + 1
+                self._events.append({"name": "thread_name", "ph": "M", "pid": 1,
+                                     "tid": self._tracks[key], "args": {"name": label}})
+            return self._tracks[key]
+
+    @contextlib.contextmanager
+    def _span(self, name, cat, attrs):
+        with contextlib.ExitStack() as stack:
+            otel_span = None
+            if self._otel:
+                otel_span = stack.enter_context(self._otel.start_as_current_span(name))
+            tid, started = self._track(), time.perf_counter()
+            try:
+                yield attrs
+            except BaseException as exc:
+                attrs["error"] = f"{type(exc).__name__}: {exc}"
+                raise
+            finally:
+                ended = time.perf_counter()
+                if otel_span is not None:
+                    otel_span.set_attributes({"category": cat, **{k: v if isinstance(v, (str, bool, int, float)) else str(v)
+                                                                  for k, v in attrs.items()}})
+                with self._lock:
+                    self._events.append({"name": name, "cat": cat, "ph": "X", "pid": 1, "tid": tid,
+                                         "ts": round((started - self._t0) * 1e6, 1),
+                                         "dur": round((ended - started) * 1e6, 1), "args": attrs})
+
+    def write(self, path):
+        """Write the spans recorded so far as a Chrome trace JSON file."""
+        with self._lock:
+            events = list(self._events)
+        with open(path, "w") as fh:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fh)
+        log.info("Trace with %d spans written to %s", sum(e["ph"] == "X" for e in events), path)
+
+    def shutdown(self):
+        """Flush pending OTLP exports and stop recording."""
+        if self._provider:
+            self._provider.shutdown()
+        self.enabled = False
+
+
+TRACER = Tracer()
+
+
+def _http_span_name(method, url):
+    return f"{method} {urlsplit(str(url)).path.removeprefix('/api/v1')}"
+
+# ----------------------------
+# Instrumentation
+# ----------------------------
+#
+# Every API call is attributed to the sync stage it was made from (the
+# innermost function decorated with @_stage) and to its endpoint. Calls made
+# outside any stage (network lookup, create, action-batch polling) land in
+# the "clone" stage.
+
+_STAGE = contextvars.ContextVar("meraki_clone_stage", default="clone")
+_CALL = contextvars.ContextVar("meraki_clone_call", default=None)
+_PERCENTILES = (0.5, 0.9, 0.99)
+
+
+def _stage(name):
+    """Attribute API calls made inside the decorated function (sync or async) to stage *name*.
+
+    The function's first argument must be the dashboard; the stage's wall time
+    is recorded on its :class:`InstrumentedDashboard`, if it has one.
+    """
+    def decorate(fn):
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def run(db, *args, **kwargs):
+                token, started = _STAGE.set(name), time.perf_counter()
+                try:
+                    with TRACER.span(name, "stage"):
+                        return await fn(db, *args, **kwargs)
+                finally:
+                    _record_stage(db, name, time.perf_counter() - started)
+                    _STAGE.reset(token)
+        else:
+            @functools.wraps(fn)
+            def run(db, *args, **kwargs):
+                token, started = _STAGE.set(name), time.perf_counter()
+                try:
+                    with TRACER.span(name, "stage"):
+                        return fn(db, *args, **kwargs)
+                finally:
+                    _record_stage(db, name, time.perf_counter() - started)
+                    _STAGE.reset(token)
+        return run
+    return decorate
+
+
+def _record_stage(db, name, seconds):
+    inst = _find_proxy(db, InstrumentedDashboard)
+    if inst:
+        inst.metrics.stage(name, seconds)
+
+
+def _submit_in_context(pool):
+    """``pool.submit`` that runs each task in a copy of the caller's context, stage included."""
+    return lambda fn, *args: pool.submit(contextvars.copy_context().run, fn, *args)
+
+
+def _percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class CallMetrics:
+    """Thread-safe call statistics keyed by (stage, endpoint).
+
+    Per key: calls, errors, latencies, SDK retries, 429 responses and the
+    seconds the SDK slept before retrying. Per stage: wall time and runs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._stages = {}
+
+    def _entry(self, key):
+        entry = self._calls.get(key)
+        if entry is None:
+            entry = self._calls[key] = {"calls": 0, "errors": 0, "latencies": [],
+                                        "retries": 0, "rate_limited": 0, "wait_seconds": 0.0}
+        return entry
+
+    def call(self, key, seconds, ok):
+        with self._lock:
+            entry = self._entry(key)
+            entry["calls"] += 1
+            entry["errors"] += not ok
+            entry["latencies"].append(seconds)
+
+    def response(self, key, status):
+        if status == 429:
+            with self._lock:
+                self._entry(key or (_STAGE.get(), "-"))["rate_limited"] += 1
+
+    def retry(self, key, seconds):
+        with self._lock:
+            entry = self._entry(key or (_STAGE.get(), "-"))
+            entry["retries"] += 1
+            entry["wait_seconds"] += seconds
+
+    def stage(self, name, seconds):
+        with self._lock:
+            st = self._stages.setdefault(name, {"runs": 0, "seconds": 0.0})
+            st["runs"] += 1
+            st["seconds"] += seconds
+
+    def rows(self):
+        """One summary dict per (stage, endpoint), grouped by stage, slowest endpoints first."""
+        with self._lock:
+            items = [(key, dict(entry, latencies=sorted(entry["latencies"]))) for key, entry in self._calls.items()]
+        order = {}
+        for (stage, _), _ in items:
+            order.setdefault(stage, len(order))
+        items.sort(key=lambda kv: (order[kv[0][0]], -sum(kv[1]["latencies"])))
+        rows = []
+        for (stage, endpoint), entry in items:
+            lat = entry.pop("latencies")
+            rows.append({"stage": stage, "endpoint": endpoint, **entry,
+                         "wait_seconds": round(entry["wait_seconds"], 3),
+                         "seconds": round(sum(lat), 3),
+                         **{f"p{round(q * 100)}": round(_percentile(lat, q), 4) for q in _PERCENTILES},
+                         "max": round(lat[-1], 4) if lat else 0.0})
+        return rows
+
+    def stages(self):
+        with self._lock:
+            return {name: {"runs": st["runs"], "seconds": round(st["seconds"], 3)} for name, st in self._stages.items()}
+
+    def table(self):
+        """The summary as aligned text lines, with a total line per stage."""
+        cols = ("stage", "endpoint", "calls", "errors", "p50", "p90", "p99", "max", "retries", "rate_limited", "wait_seconds")
+        heads = ("stage", "endpoint", "calls", "err", "p50 ms", "p90 ms", "p99 ms", "max ms", "retries", "429s", "wait s")
+        stages = self.stages()
+        lines, last = [], None
+        for row in self.rows():
+            if row["stage"] != last:
+                last = row["stage"]
+                wall = stages.get(last)
+                lines.append([last, f"(stage wall {wall['seconds']:.1f}s)" if wall else "", *[""] * 9])
+            cells = [""]
+            for col in cols[1:]:
+                value = row[col]
+                if col in ("p50", "p90", "p99", "max"):
+                    value = f"{value * 1000:.0f}"
+                elif col == "wait_seconds":
+                    value = f"{value:.1f}"
+                cells.append(str(value))
+            lines.append(cells)
+        widths = [max([len(h), *(len(cells[i]) for cells in lines)]) for i, h in enumerate(heads)]
+        fmt = lambda cells: "  ".join(c.ljust(w) if i < 2 else c.rjust(w)
+                                      for i, (c, w) in enumerate(zip(cells, widths))).rstrip()
+        return [fmt(heads), fmt(["-" * w for w in widths]), *(fmt(cells) for cells in lines)]
+
+    def write_json(self, path):
+        with open(path, "w") as fh:
+            json.dump({"generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                       "stages": self.stages(), "endpoints": self.rows()}, fh, indent=2)
+
+    def write_prometheus(self, path):
+        """Write a node_exporter textfile-collector file (written aside, then renamed into place)."""
+        rows, out = self.rows(), []
+
+        def metric(name, kind, help_text, samples):
+            out.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"])
+            for labels, value in samples:
+                rendered = ",".join(f'{k}="{v}"' for k, v in labels.items())
+                out.append(f"{name}{{{rendered}}} {value}")
+
+        def per_row(field):
+            return [({"stage": r["stage"], "endpoint": r["endpoint"]}, r[field]) for r in rows]
+
+        metric("meraki_clone_api_calls_total", "counter", "Dashboard API calls.", per_row("calls"))
+        metric("meraki_clone_api_errors_total", "counter", "Dashboard API calls that raised.", per_row("errors"))
+        metric("meraki_clone_api_retries_total", "counter", "Requests the SDK retried.", per_row("retries"))
+        metric("meraki_clone_api_rate_limited_total", "counter", "HTTP 429 responses.", per_row("rate_limited"))
+        metric("meraki_clone_api_retry_wait_seconds_total", "counter", "Seconds the SDK slept before retries.",
+               per_row("wait_seconds"))
+        latency = []
+        for r in rows:
+            labels = {"stage": r["stage"], "endpoint": r["endpoint"]}
+            latency += [({**labels, "quantile": str(q)}, r[f"p{round(q * 100)}"]) for q in _PERCENTILES]
+        metric("meraki_clone_api_latency_seconds", "summary", "Dashboard API call latency, retries included.", latency)
+        out += [f'meraki_clone_api_latency_seconds_sum{{stage="{r["stage"]}",endpoint="{r["endpoint"]}"}} {r["seconds"]}'
+                for r in rows]
+        out += [f'meraki_clone_api_latency_seconds_count{{stage="{r["stage"]}",endpoint="{r["endpoint"]}"}} {r["calls"]}'
+                for r in rows]
+        metric("meraki_clone_stage_seconds", "gauge", "Wall time spent in each sync stage.",
+               [({"stage": name}, st["seconds"]) for name, st in self.stages().items()])
+
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as fh:
+            fh.write("\n".join(out) + "\n")
+        os.replace(tmp, path)
+
+
+class InstrumentedDashboard(DashboardProxy):
+    """Time every API call and count the SDK's retries and 429s into *metrics*.
+
+    Keep it innermost (under the limiter and cache) so latencies are the
+    SDK's own: cache hits and client-side throttling are not included. Retries
+    and 429s are counted by hooking the session's per-attempt send and its
+    back-off sleep; SDK versions without those hooks report calls only.
+    """
+
+    def __init__(self, db, metrics=None, **kwargs):
+        super().__init__(db, **kwargs)
+        self.metrics = metrics or CallMetrics()
+        raw = db
+        while isinstance(raw, DashboardProxy):
+            raw = raw._db
+        session = getattr(raw, "_session", None)
+        if hasattr(session, "_send_request") and hasattr(session, "_sleep"):
+            self._hook_session(session)
+
+    def _hook_session(self, session):
+        send, sleep, metrics = session._send_request, session._sleep, self.metrics
+        if self._asynchronous:
+            async def send_hooked(method, url, **kwargs):
+                with TRACER.span(_http_span_name(method, url), "http") as span:
+                    response = await send(method, url, **kwargs)
+                    span["status"] = response.status_code
+                metrics.response(_CALL.get(), response.status_code)
+                return response
+
+            async def sleep_hooked(seconds):
+                metrics.retry(_CALL.get(), seconds)
+                with TRACER.span("retry back-off", "rate_limit", wait=seconds):
+                    await sleep(seconds)
+        else:
+            def send_hooked(method, url, **kwargs):
+                with TRACER.span(_http_span_name(method, url), "http") as span:
+                    response = send(method, url, **kwargs)
+                    span["status"] = response.status_code
+                metrics.response(_CALL.get(), response.status_code)
+                return response
+
+            def sleep_hooked(seconds):
+                metrics.retry(_CALL.get(), seconds)
+                with TRACER.span("retry back-off", "rate_limit", wait=seconds):
+                    sleep(seconds)
+        session._send_request, session._sleep = send_hooked, sleep_hooked
+
+    def _call(self, endpoint, fn, args, kwargs):
+        key = (_STAGE.get(), endpoint)
+        token, started, ok = _CALL.set(key), time.perf_counter(), False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            self.metrics.call(key, time.perf_counter() - started, ok)
+            _CALL.reset(token)
+
+    async def _acall(self, endpoint, fn, args, kwargs):
+        key = (_STAGE.get(), endpoint)
+        token, started, ok = _CALL.set(key), time.perf_counter(), False
+        try:
+            result = await fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            self.metrics.call(key, time.perf_counter() - started, ok)
+            _CALL.reset(token)
+
+
+def _find_proxy(db, kind):
+    while isinstance(db, DashboardProxy):
+        if isinstance(db, kind):
+            return db
+        db = db._db
+    return None
+
+
+def _log_session_stats(db, metrics_json=None, metrics_prom=None):
+    cache = _find_proxy(db, CachedDashboard)
+    if cache:
+        log.info("Read cache: %d hits, %d misses", cache.hits, cache.misses)
+    disk = _find_proxy(db, PersistentCachedDashboard)
+    if disk:
+        log.info("Disk cache: %d hits, %d misses (%s)", disk.hits, disk.misses, disk.store.path)
+    limiter = _find_proxy(db, RateLimitedDashboard)
+    if limiter:
+        for org, bucket in limiter.budgets():
+            st = bucket.stats()
+            log.info("Rate limiter%s: %d calls, %d throttled, %.1fs waiting (max %.2fs)", f" (org {org})" if org else "",
+                     st["calls"], st["throttled"], st["wait_seconds"], st["max_wait"])
+    inst = _find_proxy(db, InstrumentedDashboard)
+    if inst:
+        log.info("API calls by stage:")
+        for line in inst.metrics.table():
+            log.info("  %s", line)
+        if metrics_json:
+            inst.metrics.write_json(metrics_json)
+            log.info("Call metrics written to %s", metrics_json)
+        if metrics_prom:
+            inst.metrics.write_prometheus(metrics_prom)
+            log.info("Call metrics written to %s", metrics_prom)
+
 # ----------------------------
 # Utilities
 # ----------------------------
 
-def _upsert(src, dst, id_key, create_cb, update_cb, label):
+def _matches(desired, current, normalize=None):
+    """True when *current* already holds every field of *desired*.
+
+    Fields the destination returns but the source body doesn't carry
+    (read-only ids, computed values) are ignored. With *normalize*, both
+    sides are compared in that canonical form.
+    """
+    if current is None:
+        return False
+    if normalize:
+        desired, current = normalize(desired), normalize(current)
+    return all(current.get(k) == v for k, v in desired.items())
+
+
+def _upsert(src, dst, id_key, create_cb, update_cb, label, *, body=None, reconcile=False, batcher=None, normalize=None):
+    """Create or update each *src* object on the destination.
+
+    With *reconcile*, objects whose ``body(obj)`` already matches the
+    destination copy (after *normalize*, if given) are left alone. With a *batcher*, the callbacks return
+    ``db.batch`` actions which are queued instead of logged; their outcomes
+    are counted when the batcher is flushed. Returns a Counter of outcomes.
+    """
     idx = {d[id_key]: d for d in dst}
+    outcome = Counter()
     for obj in src:
         ident = obj[id_key]
-        try:
-            if ident in idx:
-                update_cb(ident, obj)
-                log.info("  • %s %s updated", label, ident)
-            else:
-                create_cb(obj)
-                log.info("  • %s %s created", label, ident)
-        except APIError as exc:
-            log.error("  ✗ %s %s – %s", label, ident, exc)
-
-
-def _clone_optional(getter, setter, src_net, dst_net, num, label):
+        with TRACER.span(f"{label} {ident}", "object"):
+            try:
+                if ident in idx:
+                    if reconcile and _matches(body(obj), idx[ident], normalize):
+                        log.debug("  = %s %s unchanged", label, ident)
+                        outcome["unchanged"] += 1
+                        continue
+                    verb = "updated"
+                    result = update_cb(ident, obj)
+                else:
+                    verb = "created"
+                    result = create_cb(obj)
+                if batcher:
+                    batcher.add(result, label, ident, verb)
+                else:
+                    log.info("  • %s %s %s", label, ident, verb)
+                    outcome[verb] += 1
+            except APIError as exc:
+                log.error("  ✗ %s %s – %s", label, ident, exc)
+                outcome["failed"] += 1
+    return outcome
+
+
+def _clone_optional(getter, setter, src_net, dst_net, num, label, reconcile=False):
     try:
-        body = getter(src_net, num)
-        setter(dst_net, num, **body)
+        with TRACER.span(label, "object"):
+            body = getter(src_net, num)
+            if reconcile and _matches(body, getter(dst_net, num)):
+                log.debug("    = %s unchanged", label)
+                return "unchanged"
+            setter(dst_net, num, **body)
         log.info("    ↳ %s synced", label)
+        return "updated"
     except APIError:
-        pass
+        return "skipped"
+
+# ----------------------------
+# Action batches
+# ----------------------------
+
+# Synchronous batches run at most 20 actions, async ones 100; an org may only
+# have a handful of async batches pending at once.
+ACTION_BATCH_SYNC_LIMIT = 20
+ACTION_BATCH_ASYNC_LIMIT = 100
+ACTION_BATCH_MAX_PENDING = 5
+ACTION_BATCH_POLL_SECONDS = 2.0
+
+
+class ActionBatcher:
+    """Queue ``db.batch.*`` actions and submit them as org action batches.
+
+    Each queued action carries the label/ident of the object it writes, so
+    the outcome is logged on the usual "• label ident verb" / "✗ label ident"
+    lines. Batches are atomic: when one fails, every action in it is
+    reported with the batch's errors.
+    """
+
+    def __init__(self, db, org_id, *, synchronous=True):
+        self.db = db
+        self.org_id = org_id
+        self.synchronous = synchronous
+        self._queue = []
+
+    def add(self, action, label, ident, verb):
+        self._queue.append((action, label, ident, verb))
+
+    def flush(self):
+        """Submit everything queued, wait for completion and return a Counter of outcomes."""
+        queue, self._queue = self._queue, []
+        size = ACTION_BATCH_SYNC_LIMIT if self.synchronous else ACTION_BATCH_ASYNC_LIMIT
+        outcome = Counter()
+        pending = []
+
+        def settle(chunk, status):
+            failed = status.get("failed") or not status.get("completed")
+            error = "; ".join(map(str, status.get("errors") or [])) or "action batch failed"
+            for _, label, ident, verb in chunk:
+                if failed:
+                    log.error("  ✗ %s %s – %s", label, ident, error)
+                    outcome["failed"] += 1
+                else:
+                    log.info("  • %s %s %s", label, ident, verb)
+                    outcome[verb] += 1
+
+        def wait_for(chunk, batch_id):
+            # getOrganizationActionBatch is in _VOLATILE_ENDPOINTS, so every
+            # poll reaches the API even through the cache layers.
+            while True:
+                status = self.db.organizations.getOrganizationActionBatch(self.org_id, batch_id)["status"]
+                if status.get("completed") or status.get("failed"):
+                    return settle(chunk, status)
+                time.sleep(ACTION_BATCH_POLL_SECONDS)
+
+        for i in range(0, len(queue), size):
+            chunk = queue[i:i + size]
+            if len(pending) >= ACTION_BATCH_MAX_PENDING:
+                wait_for(*pending.pop(0))
+            try:
+                batch = self.db.organizations.createOrganizationActionBatch(
+                    self.org_id, actions=[a for a, *_ in chunk], confirmed=True, synchronous=self.synchronous)
+            except APIError as exc:
+                settle(chunk, {"failed": True, "errors": [exc]})
+                continue
+            status = batch.get("status", {})
+            if status.get("completed") or status.get("failed"):
+                settle(chunk, status)
+            else:
+                pending.append((chunk, batch["id"]))
+
+        for item in pending:
+            wait_for(*item)
+
+        # Batched writes bypass the per-call cache invalidation.
+        for net_id in {a["resource"].split("/")[2] for a, *_ in queue if a["resource"].startswith("/networks/")}:
+            _invalidate(self.db, net_id)
+        return outcome
 
 # ----------------------------
 # Wireless SSID sync
 # ----------------------------
 
-def sync_ssids(db, src_net, dst_net):
-    for s in db.wireless.getNetworkWirelessSsids(src_net):
-        num = s["number"]
-        core = {k: v for k, v in s.items() if k not in {"number", "networkId", "ssidAdminAccessible"}}
+# Per-SSID sub-settings cloned after the core SSID object. Each entry is
+# (endpoint suffix, label, rules_only); rules_only endpoints only accept the
+# "rules" list back on update.
+_SSID_SUBSETTINGS = (
+    ("TrafficShapingRules", "traffic-shaping rules", False),
+    ("FirewallL3FirewallRules", "L3 firewall rules", True),
+    ("FirewallL7FirewallRules", "L7 firewall rules", True),
+    ("BonjourForwarding", "Bonjour forwarding", False),
+    ("Vpn", "SSID VPN settings", False),
+)
+
+
+def _ssid_core(s):
+    return {k: v for k, v in s.items() if k not in {"number", "networkId", "ssidAdminAccessible"}}
+
+
+def _ssid_setter(section, suffix, rules_only):
+    setter = getattr(section, f"updateNetworkWirelessSsid{suffix}")
+    if rules_only:
+        return lambda n, i, **body: setter(n, i, rules=body["rules"])
+    return setter
+
+
+def _run_now(fn, *args):
+    return fn(*args)
+
+
+def _sync_ssid(db, s, src_net, dst_net, submit=_run_now, current=None, reconcile=False):
+    """Push one SSID's core object, then hand its sub-settings to *submit*.
+
+    Sub-settings depend on the core object existing, so they are only
+    scheduled once the core update has landed. Returns the core outcome and
+    whatever *submit* returned for each sub-setting (futures on a pool).
+    """
+    num = s["number"]
+    core = _ssid_core(s)
+    if reconcile and _matches(core, current):
+        log.debug("  = SSID %d '%s' core unchanged", num, core.get("name"))
+        outcome = "unchanged"
+    else:
         try:
             db.wireless.updateNetworkWirelessSsid(dst_net, num, **core)
             log.info("  • SSID %d '%s' core synced", num, core.get("name"))
+            outcome = "updated"
         except APIError as exc:
             log.error("  ✗ SSID %d core – %s", num, exc)
-            continue
+            return "failed", []
+
+    return outcome, [
+        submit(_clone_optional,
+               getattr(db.wireless, f"getNetworkWirelessSsid{suffix}"),
+               _ssid_setter(db.wireless, suffix, rules_only),
+               src_net, dst_net, num, f"SSID {num} {label}", reconcile)
+        for suffix, label, rules_only in _SSID_SUBSETTINGS
+    ]
+
+
+@_stage("sync_ssids")
+def sync_ssids(db, src_net, dst_net, *, workers=1, reconcile=False):
+    """Mirror every SSID and its sub-settings from *src_net* to *dst_net*.
+
+    With ``workers > 1`` SSIDs are synced in parallel on a bounded thread
+    pool, and each SSID's sub-settings are queued on the same pool as soon as
+    its core object is in place, so at most *workers* requests are in flight.
+    Returns a Counter of outcomes.
+    """
+    ssids = db.wireless.getNetworkWirelessSsids(src_net)
+    current = {}
+    if reconcile:
+        current = {d["number"]: d for d in db.wireless.getNetworkWirelessSsids(dst_net)}
+
+    outcome = Counter()
+    if workers <= 1:
+        for s in ssids:
+            core, subs = _sync_ssid(db, s, src_net, dst_net, current=current.get(s["number"]), reconcile=reconcile)
+            outcome.update([core, *subs])
+        return outcome
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ssid") as pool:
+        submit = _submit_in_context(pool)
+        pending = [submit(_sync_ssid, db, s, src_net, dst_net, submit, current.get(s["number"]), reconcile)
+                   for s in ssids]
+        for fut in pending:
+            core, subs = fut.result()
+            outcome.update([core, *(sub.result() for sub in subs)])
+    return outcome
 
-        _clone_optional(db.wireless.getNetworkWirelessSsidTrafficShapingRules,
-                        db.wireless.updateNetworkWirelessSsidTrafficShapingRules,
-                        src_net, dst_net, num, "traffic-shaping rules")
+# ----------------------------
+# VLANs + DHCP + Static Routes
+# ----------------------------
 
-        _clone_optional(db.wireless.getNetworkWirelessSsidFirewallL3FirewallRules,
-                        lambda n, i, **body: db.wireless.updateNetworkWirelessSsidFirewallL3FirewallRules(n, i, rules=body["rules"]),
-                        src_net, dst_net, num, "L3 firewall rules")
+def _vlan_body(v, include_id=False):
+    drop = {"networkId"} if include_id else {"networkId", "id"}
+    return {k: val for k, val in v.items() if k not in drop}
 
-        _clone_optional(db.wireless.getNetworkWirelessSsidFirewallL7FirewallRules,
-                        lambda n, i, **body: db.wireless.updateNetworkWirelessSsidFirewallL7FirewallRules(n, i, rules=body["rules"]),
-                        src_net, dst_net, num, "L7 firewall rules")
 
-        _clone_optional(db.wireless.getNetworkWirelessSsidBonjourForwarding,
-                        db.wireless.updateNetworkWirelessSsidBonjourForwarding,
-                        src_net, dst_net, num, "Bonjour forwarding")
+# What the API reports for VLAN fields that were never set, so an absent
+# field and its default compare equal.
+_VLAN_DEFAULTS = {
+    "dhcpHandling": "Run a DHCP server",
+    "dhcpLeaseTime": "1 day",
+    "dnsNameservers": "upstream_dns",
+    "dhcpBootOptionsEnabled": False,
+    "dhcpOptions": [],
+    "dhcpRelayServerIps": [],
+    "reservedIpRanges": [],
+    "fixedIpAssignments": {},
+}
+# Only meaningful while the MX itself runs the DHCP server.
+_DHCP_SERVER_FIELDS = (
+    "dhcpLeaseTime", "dnsNameservers", "dhcpBootOptionsEnabled", "dhcpBootNextServer", "dhcpBootFilename",
+    "dhcpOptions", "reservedIpRanges", "fixedIpAssignments", "mandatoryDhcp",
+)
+_DNS_KEYWORDS = {"upstream_dns", "google_dns", "opendns"}
 
-        _clone_optional(db.wireless.getNetworkWirelessSsidVpn,
-                        db.wireless.updateNetworkWirelessSsidVpn,
-                        src_net, dst_net, num, "SSID VPN settings")
 
-# ----------------------------
-# VLANs + DHCP + Static Routes
-# ----------------------------
+def _strip(value):
+    return value.strip() if isinstance(value, str) else value
+
+
+def _norm_network(value):
+    try:
+        return str(ipaddress.ip_network(str(value).strip(), strict=False))
+    except ValueError:
+        return _strip(value)
+
+
+def _norm_address(value):
+    try:
+        return str(ipaddress.ip_address(str(value).strip()))
+    except ValueError:
+        return _strip(value)
+
+
+def _ip_sort_key(value):
+    try:
+        return 0, int(ipaddress.ip_address(str(value).strip()))
+    except ValueError:
+        return 1, str(value)
+
 
-def sync_addressing(db, src_net, dst_net):
+def _norm_nameservers(value):
+    """Keyword (``upstream_dns``…) or custom servers, one per line; server order is kept."""
+    text = str(value).strip()
+    if text.lower() in _DNS_KEYWORDS:
+        return text.lower()
+    return "\n".join(_norm_address(ns) for ns in text.replace(",", " ").split())
+
+
+def _norm_dhcp_options(options):
+    """Options sorted by code, with code as a string and the type lower-cased."""
+    norm = [{"code": str(o.get("code", "")).strip(), "type": str(o.get("type", "")).strip().lower(),
+             "value": str(o.get("value", "")).strip()} for o in options or []]
+    return sorted(norm, key=lambda o: (int(o["code"]) if o["code"].isdigit() else 0, o["code"], o["value"]))
+
+
+def _norm_reserved_ranges(ranges):
+    norm = [{"start": _norm_address(r.get("start")), "end": _norm_address(r.get("end")),
+             "comment": _strip(r.get("comment")) or ""} for r in ranges or []]
+    return sorted(norm, key=lambda r: (_ip_sort_key(r["start"]), _ip_sort_key(r["end"])))
+
+
+def _norm_fixed_ips(assignments):
+    return {str(mac).strip().lower(): {"ip": _norm_address(a.get("ip")), "name": _strip(a.get("name")) or ""}
+            for mac, a in (assignments or {}).items()}
+
+
+_VLAN_NORMALIZERS = {
+    "name": _strip,
+    "subnet": _norm_network,
+    "applianceIp": _norm_address,
+    "dnsNameservers": _norm_nameservers,
+    "dhcpOptions": _norm_dhcp_options,
+    "dhcpRelayServerIps": lambda ips: sorted((_norm_address(ip) for ip in ips or []), key=_ip_sort_key),
+    "reservedIpRanges": _norm_reserved_ranges,
+    "fixedIpAssignments": _norm_fixed_ips,
+    "dhcpBootNextServer": _strip,
+    "dhcpBootFilename": _strip,
+}
+
+
+def _normalize_vlan(v):
+    """Canonical copy of a VLAN body, for comparison only (never sent to the API).
+
+    Absent fields take their API default, whitespace, order and case that the
+    Dashboard ignores are normalised, and DHCP-server (or relay) settings are
+    dropped when the VLAN doesn't run a DHCP server (or relay).
+    """
+    norm = {**_VLAN_DEFAULTS, **{k: val for k, val in v.items() if val is not None}}
+    for field, fn in _VLAN_NORMALIZERS.items():
+        if field in norm:
+            norm[field] = fn(norm[field])
+    if norm["dhcpHandling"] != "Run a DHCP server":
+        for field in _DHCP_SERVER_FIELDS:
+            norm.pop(field, None)
+    if norm["dhcpHandling"] != "Relay DHCP to another server":
+        norm.pop("dhcpRelayServerIps", None)
+    return norm
+
+
+_ROUTE_DEFAULTS = {"enabled": True, "fixedIpAssignments": {}, "reservedIpRanges": []}
+_ROUTE_NORMALIZERS = {
+    "name": _strip,
+    "subnet": _norm_network,
+    "gatewayIp": _norm_address,
+    "reservedIpRanges": _norm_reserved_ranges,
+    "fixedIpAssignments": _norm_fixed_ips,
+}
+
+
+def _normalize_route(r):
+    """Canonical copy of a static route body, for comparison only."""
+    norm = {**_ROUTE_DEFAULTS, **{k: val for k, val in r.items() if val is not None}}
+    for field, fn in _ROUTE_NORMALIZERS.items():
+        if field in norm:
+            norm[field] = fn(norm[field])
+    return norm
+
+
+def _route_body(r):
+    return {k: v for k, v in r.items() if k not in {"id", "routeId", "networkId"}}
+
+
+def _route_id(r):
+    # v1 returns "id"; older responses carried "routeId".
+    return r.get("id") or r["routeId"]
+
+
+def _policy_body(p):
+    return {k: v for k, v in p.items() if k not in {"groupPolicyId", "networkId"}}
+
+
+@_stage("sync_addressing")
+def sync_addressing(db, src_net, dst_net, *, reconcile=False, batcher=None):
     src_set = db.appliance.getNetworkApplianceVlansSettings(src_net)
     dst_set = db.appliance.getNetworkApplianceVlansSettings(dst_net)
+    outcome = Counter()
 
     if src_set.get("vlansEnabled"):
         if not dst_set.get("vlansEnabled"):
             db.appliance.updateNetworkApplianceVlansSettings(dst_net, vlansEnabled=True)
-        _sync_vlans(db, src_net, dst_net)
+        outcome += _sync_vlans(db, src_net, dst_net, reconcile=reconcile, batcher=batcher)
     else:
         if dst_set.get("vlansEnabled"):
             db.appliance.updateNetworkApplianceVlansSettings(dst_net, vlansEnabled=False)
-        lan = db.appliance.getNetworkApplianceSingleLan(src_net)
-        db.appliance.updateNetworkApplianceSingleLan(dst_net, **{k: v for k, v in lan.items() if k != "networkId"})
-        log.info("  • Single-LAN settings mirrored")
+        lan = {k: v for k, v in db.appliance.getNetworkApplianceSingleLan(src_net).items() if k != "networkId"}
+        if reconcile and _matches(lan, db.appliance.getNetworkApplianceSingleLan(dst_net)):
+            log.debug("  = Single-LAN settings unchanged")
+            outcome["unchanged"] += 1
+        else:
+            db.appliance.updateNetworkApplianceSingleLan(dst_net, **lan)
+            log.info("  • Single-LAN settings mirrored")
+            outcome["updated"] += 1
 
-    _sync_static_routes(db, src_net, dst_net)
+    outcome += _sync_static_routes(db, src_net, dst_net, reconcile=reconcile)
+    return outcome
 
 
-def _sync_vlans(db, src_net, dst_net):
+def _sync_vlans(db, src_net, dst_net, *, reconcile=False, batcher=None):
     src_vlans = db.appliance.getNetworkApplianceVlans(src_net)
     try:
         dst_vlans = db.appliance.getNetworkApplianceVlans(dst_net)
     except APIError as exc:
         dst_vlans = [] if exc.status == 404 else (_ for _ in ()).throw(exc)
 
-    def body(v, include_id=False):
-        drop = {"networkId"} if include_id else {"networkId", "id"}
-        return {k: v for k, v in v.items() if k not in drop}
-
-    _upsert(
+    api = db.batch if batcher else db
+    outcome = _upsert(
         src_vlans,
         dst_vlans,
         "id",
-        lambda vlan: db.appliance.createNetworkApplianceVlan(dst_net, **body(vlan, include_id=True)),
-        lambda vid, vlan: db.appliance.updateNetworkApplianceVlan(dst_net, vid, **body(vlan)),
-        "VLAN"
+        lambda vlan: api.appliance.createNetworkApplianceVlan(dst_net, **_vlan_body(vlan, include_id=True)),
+        lambda vid, vlan: api.appliance.updateNetworkApplianceVlan(dst_net, vid, **_vlan_body(vlan)),
+        "VLAN",
+        body=_vlan_body,
+        reconcile=reconcile,
+        batcher=batcher,
+        normalize=_normalize_vlan,
     )
+    # Static routes point into these subnets, so the VLANs must land first.
+    return outcome + batcher.flush() if batcher else outcome
 
 
-def _sync_static_routes(db, src_net, dst_net):
+@_stage("_sync_static_routes")
+def _sync_static_routes(db, src_net, dst_net, *, reconcile=False):
     src_routes = db.appliance.getNetworkApplianceStaticRoutes(src_net)
     dst_routes = db.appliance.getNetworkApplianceStaticRoutes(dst_net)
     idx = {r["name"]: r for r in dst_routes}
+    outcome = Counter()
 
     for r in src_routes:
         name = r["name"]
-        body = {k: v for k, v in r.items() if k not in {"routeId", "networkId"}}
+        body = _route_body(r)
         if name in idx:
-            db.appliance.updateNetworkApplianceStaticRoute(dst_net, idx[name]["routeId"], **body)
+            if reconcile and _matches(body, idx[name], _normalize_route):
+                log.debug("  = Static route '%s' unchanged", name)
+                outcome["unchanged"] += 1
+                continue
+            db.appliance.updateNetworkApplianceStaticRoute(dst_net, _route_id(idx[name]), **body)
             log.info("  • Static route '%s' updated", name)
+            outcome["updated"] += 1
         else:
             db.appliance.createNetworkApplianceStaticRoute(dst_net, **body)
             log.info("  • Static route '%s' created", name)
+            outcome["created"] += 1
+    return outcome
 
 # ----------------------------
 # Firewall + Group Policies
 # ----------------------------
 
-def sync_l3_fw(db, src_net, dst_net):
+@_stage("sync_l3_fw")
+def sync_l3_fw(db, src_net, dst_net, *, reconcile=False):
     rules = db.appliance.getNetworkApplianceFirewallL3FirewallRules(src_net)
+    if reconcile and rules["rules"] == db.appliance.getNetworkApplianceFirewallL3FirewallRules(dst_net)["rules"]:
+        log.debug("  = MX L3 firewall rules unchanged")
+        return Counter(unchanged=1)
     db.appliance.updateNetworkApplianceFirewallL3FirewallRules(dst_net, rules=rules["rules"])
     log.info("  • MX L3 firewall rules synced")
+    return Counter(updated=1)
 
-def sync_group_policies(db, src_net, dst_net):
+@_stage("sync_group_policies")
+def sync_group_policies(db, src_net, dst_net, *, batcher=None):
+    """Create missing group policies (matched by name) and update those whose settings differ."""
     src_pols = db.networks.getNetworkGroupPolicies(src_net)
-    dst_names = {p["name"] for p in db.networks.getNetworkGroupPolicies(dst_net)}
+    idx = {p["name"]: p for p in db.networks.getNetworkGroupPolicies(dst_net)}
+    api = db.batch if batcher else db
+    outcome = Counter()
     for p in src_pols:
-        if p["name"] not in dst_names:
-            db.networks.createNetworkGroupPolicy(dst_net, **{k: v for k, v in p.items() if k not in {"groupPolicyId", "networkId"}})
-            log.info("  • Group policy '%s' created", p["name"])
+        name, body, have = p["name"], _policy_body(p), idx.get(p["name"])
+        if _matches(body, have):
+            log.debug("  = Group policy '%s' unchanged", name)
+            outcome["unchanged"] += 1
+            continue
+        if have is None:
+            verb, result = "created", api.networks.createNetworkGroupPolicy(dst_net, **body)
+        else:
+            verb, result = "updated", api.networks.updateNetworkGroupPolicy(dst_net, have["groupPolicyId"], **body)
+        if batcher:
+            batcher.add(result, "Group policy", f"'{name}'", verb)
+        else:
+            log.info("  • Group policy '%s' %s", name, verb)
+            outcome[verb] += 1
+    return outcome + batcher.flush() if batcher else outcome
 
 # ----------------------------
 # Full Network Validation Report
 # ----------------------------
 
-def validate_network(db, src_net, dst_net):
-    report_lines = ["Network Validation Report:\n"]
+class _SectionReport:
+    """Report lines and structured per-object results for one validation section."""
+
+    def __init__(self, heading):
+        self.name = heading.strip().rstrip(":")
+        self.lines = [heading]
+        self.results = []
+
+
+def _report(report, ok, msg, obj=None, diffs=(), status=None):
+    """Log *msg* and record it against *obj* as ok/mismatch (or an explicit *status*)."""
+    (log.info if ok else log.warning)(msg)
+    report.lines.append(msg)
+    report.results.append({"object": obj, "status": status or ("ok" if ok else "mismatch"),
+                           "message": msg, "diffs": list(diffs)})
+
+
+def _diff(src, dst, path=""):
+    """Field-level differences between two API bodies.
+
+    Returns ``{"path", "source", "destination"}`` dicts, e.g. path
+    ``dhcpOptions[1].value``. Dicts recurse by key and lists by position;
+    equal subtrees cost one comparison. A value missing on one side shows as
+    ``None``.
+    """
+    out = []
+
+    def walk(a, b, at):
+        if a == b:
+            return
+        if isinstance(a, dict) and isinstance(b, dict):
+            for key in [*a, *(k for k in b if k not in a)]:
+                walk(a.get(key), b.get(key), f"{at}.{key}" if at else str(key))
+        elif isinstance(a, list) and isinstance(b, list):
+            for i in range(max(len(a), len(b))):
+                walk(a[i] if i < len(a) else None, b[i] if i < len(b) else None, f"{at}[{i}]")
+        else:
+            out.append({"path": at or ".", "source": a, "destination": b})
 
-    # VLAN & DHCP validation
-    try:
-        src_vlans = db.appliance.getNetworkApplianceVlans(src_net)
-        dst_vlans = db.appliance.getNetworkApplianceVlans(dst_net)
-    except APIError as e:
-        msg = f"DHCP validation skipped: {e}"
-        log.warning(msg)
-        report_lines.append(msg)
-        src_vlans, dst_vlans = [], []
+    walk(src, dst, path)
+    return out
 
-    src_vlan_map = {v["id"]: v for v in src_vlans}
-    dst_vlan_map = {v["id"]: v for v in dst_vlans}
 
-    report_lines.append("VLANs and DHCP scopes:")
-    for vlan_id, src_vlan in src_vlan_map.items():
+def _diff_fields(src, dst, fields):
+    """Top-level *fields* that differ, and the deep diffs within them."""
+    mismatches = [f for f in fields if src.get(f) != dst.get(f)]
+    return mismatches, [d for f in mismatches for d in _diff(src.get(f), dst.get(f), f)]
+
+
+def _check_vlans(src_vlans, dst_vlans, report):
+    dst_vlan_map = {v["id"]: v for v in dst_vlans}
+    for src_vlan in src_vlans:
+        vlan_id = src_vlan["id"]
+        obj = f"VLAN {vlan_id} ({src_vlan.get('name')})"
         dst_vlan = dst_vlan_map.get(vlan_id)
         if not dst_vlan:
-            msg = f"✗ VLAN {vlan_id} ({src_vlan.get('name')}) missing in destination"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} missing in destination", obj, status="missing")
             continue
 
         fields = ["subnet", "applianceIp", "dhcpHandling", "dhcpLeaseTime", "dnsNameservers", "dhcpOptions"]
-        mismatches = [f for f in fields if src_vlan.get(f) != dst_vlan.get(f)]
-
+        mismatches, diffs = _diff_fields(_normalize_vlan(src_vlan), _normalize_vlan(dst_vlan), fields)
         if mismatches:
-            msg = f"✗ VLAN {vlan_id} ({src_vlan.get('name')}) DHCP mismatch: {', '.join(mismatches)}"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} DHCP mismatch: {', '.join(mismatches)}", obj, diffs)
         else:
-            msg = f"✓ VLAN {vlan_id} ({src_vlan.get('name')}) DHCP settings validated"
-            log.info(msg)
-            report_lines.append(msg)
+            _report(report, True, f"✓ {obj} DHCP settings validated", obj)
 
-    # Static routes validation
-    try:
-        src_routes = db.appliance.getNetworkApplianceStaticRoutes(src_net)
-        dst_routes = db.appliance.getNetworkApplianceStaticRoutes(dst_net)
-    except APIError as e:
-        msg = f"Static routes validation skipped: {e}"
-        log.warning(msg)
-        report_lines.append(msg)
-        src_routes, dst_routes = [], []
 
+def _check_static_routes(src_routes, dst_routes, report):
     dst_routes_map = {r["name"]: r for r in dst_routes}
-    report_lines.append("\nStatic Routes:")
     for r in src_routes:
+        obj = f"Static route '{r['name']}'"
         dst_r = dst_routes_map.get(r["name"])
         if not dst_r:
-            msg = f"✗ Static route '{r['name']}' missing in destination"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} missing in destination", obj, status="missing")
             continue
 
-        keys_to_check = ["subnet", "gatewayIp", "interface", "enabled"]
-        mismatches = [k for k in keys_to_check if r.get(k) != dst_r.get(k)]
+        mismatches, diffs = _diff_fields(_normalize_route(r), _normalize_route(dst_r),
+                                         ["subnet", "gatewayIp", "interface", "enabled"])
         if mismatches:
-            msg = f"✗ Static route '{r['name']}' mismatch: {', '.join(mismatches)}"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} mismatch: {', '.join(mismatches)}", obj, diffs)
         else:
-            msg = f"✓ Static route '{r['name']}' validated"
-            log.info(msg)
-            report_lines.append(msg)
+            _report(report, True, f"✓ {obj} validated", obj)
 
-    # Wireless SSIDs validation
-    report_lines.append("\nWireless SSIDs:")
-    try:
-        src_ssids = db.wireless.getNetworkWirelessSsids(src_net)
-        dst_ssids = db.wireless.getNetworkWirelessSsids(dst_net)
-    except APIError as e:
-        msg = f"SSID validation skipped: {e}"
-        log.warning(msg)
-        report_lines.append(msg)
-        src_ssids, dst_ssids = [], []
 
+def _check_ssids(src_ssids, dst_ssids, report):
     dst_ssids_map = {s["number"]: s for s in dst_ssids}
     for s in src_ssids:
         num = s["number"]
+        obj = f"SSID {num} ('{s.get('name')}')"
         dst_s = dst_ssids_map.get(num)
         if not dst_s:
-            msg = f"✗ SSID {num} ('{s.get('name')}') missing in destination"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} missing in destination", obj, status="missing")
             continue
 
         fields = ["name", "enabled", "authMode", "encryptionMode", "ssidNumber", "ipAssignmentMode"]
-        mismatches = [f for f in fields if s.get(f) != dst_s.get(f)]
+        mismatches, diffs = _diff_fields(s, dst_s, fields)
         if mismatches:
-            msg = f"✗ SSID {num} ('{s.get('name')}') mismatch: {', '.join(mismatches)}"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} mismatch: {', '.join(mismatches)}", obj, diffs)
         else:
-            msg = f"✓ SSID {num} ('{s.get('name')}') validated"
-            log.info(msg)
-            report_lines.append(msg)
+            _report(report, True, f"✓ {obj} validated", obj)
 
-    # MX L3 Firewall rules validation
-    report_lines.append("\nMX L3 Firewall Rules:")
-    try:
-        src_rules = db.appliance.getNetworkApplianceFirewallL3FirewallRules(src_net)["rules"]
-        dst_rules = db.appliance.getNetworkApplianceFirewallL3FirewallRules(dst_net)["rules"]
-    except APIError as e:
-        msg = f"MX L3 Firewall validation skipped: {e}"
-        log.warning(msg)
-        report_lines.append(msg)
-        src_rules, dst_rules = [], []
-
-    if len(src_rules) != len(dst_rules):
-        msg = f"✗ Firewall rule count mismatch: source={len(src_rules)}, destination={len(dst_rules)}"
-        log.warning(msg)
-        report_lines.append(msg)
-    else:
-        for i, (sr, dr) in enumerate(zip(src_rules, dst_rules)):
-            if sr != dr:
-                msg = f"✗ Firewall rule #{i+1} differs"
-                log.warning(msg)
-                report_lines.append(msg)
-            else:
-                msg = f"✓ Firewall rule #{i+1} matches"
-                log.info(msg)
-                report_lines.append(msg)
 
-    # Group Policies validation
-    report_lines.append("\nGroup Policies:")
-    try:
-        src_pols = db.networks.getNetworkGroupPolicies(src_net)
-        dst_pols = db.networks.getNetworkGroupPolicies(dst_net)
-    except APIError as e:
-        msg = f"Group policies validation skipped: {e}"
-        log.warning(msg)
-        report_lines.append(msg)
-        src_pols, dst_pols = [], []
+# MX L3 rules are matched on what they do; comment and syslog are compared
+# only between rules that match.
+_RULE_KEY_FIELDS = ("policy", "protocol", "srcCidr", "srcPort", "destCidr", "destPort")
+_RULE_NOTE_FIELDS = ("comment", "syslogEnabled")
+
+
+def _canonical_cidrs(value):
+    """Sorted, de-duplicated CIDR list: ``"10.0.0.1, Any"`` -> ``"10.0.0.1/32,any"``.
+
+    Entries that aren't addresses (``any``, ``VLAN(10).*``, FQDNs) are only
+    lower-cased.
+    """
+    items = set()
+    for part in str(value if value is not None else "any").split(","):
+        part = part.strip().lower()
+        try:
+            part = str(ipaddress.ip_network(part, strict=False))
+        except ValueError:
+            pass
+        items.add(part)
+    return ",".join(sorted(items))
+
+
+def _canonical_ports(value):
+    """Sorted, de-duplicated port list with ``80-80`` collapsed to ``80``."""
+    items = set()
+    for part in str(value if value is not None else "any").split(","):
+        lo, sep, hi = part.replace(" ", "").lower().partition("-")
+        items.add(lo if not sep or lo == hi else f"{lo}-{hi}")
+    return ",".join(sorted(items))
+
+
+def _rule_key(rule):
+    """Hashable canonical form of what an L3 rule matches and does."""
+    return (
+        str(rule.get("policy", "")).lower(),
+        str(rule.get("protocol") or "any").lower(),
+        _canonical_cidrs(rule.get("srcCidr")),
+        _canonical_ports(rule.get("srcPort")),
+        _canonical_cidrs(rule.get("destCidr")),
+        _canonical_ports(rule.get("destPort")),
+    )
+
+
+_DEFAULT_RULE_KEY = ("allow", "any", "any", "any", "any", "any")
+
+
+def _without_default_rule(rules):
+    """Drop the implicit trailing allow-any rule the API appends to every rule list."""
+    last = rules[-1] if rules else {}
+    if str(last.get("comment", "")).lower() == "default rule" and _rule_key(last) == _DEFAULT_RULE_KEY:
+        return rules[:-1]
+    return rules
+
+
+def _describe_rule(key):
+    policy, protocol, src, src_port, dst, dst_port = key
+    return f"{policy} {protocol} {src}:{src_port} → {dst}:{dst_port}"
 
+
+def _align_rules(src_rules, dst_rules):
+    """Align two L3 rule lists by their canonical keys.
+
+    Returns ``(matched, moved, removed, added)``: matched and moved are
+    ``(src_index, dst_index)`` pairs, removed are source indexes missing
+    from the destination and added are destination-only indexes. Rules are
+    aligned with difflib's longest-matching-block algorithm; a rule that
+    falls outside the alignment but exists on the other side is a move.
+    """
+    src_keys, dst_keys = [_rule_key(r) for r in src_rules], [_rule_key(r) for r in dst_rules]
+    matched, unmatched_src, unmatched_dst = [], [], []
+    for tag, i1, i2, j1, j2 in SequenceMatcher(None, src_keys, dst_keys, autojunk=False).get_opcodes():
+        if tag == "equal":
+            matched.extend(zip(range(i1, i2), range(j1, j2)))
+        else:
+            unmatched_src.extend(range(i1, i2))
+            unmatched_dst.extend(range(j1, j2))
+
+    spare = defaultdict(deque)
+    for j in unmatched_dst:
+        spare[dst_keys[j]].append(j)
+    moved, removed = [], []
+    for i in unmatched_src:
+        if spare[src_keys[i]]:
+            moved.append((i, spare[src_keys[i]].popleft()))
+        else:
+            removed.append(i)
+    added = sorted(j for left in spare.values() for j in left)
+    return matched, moved, removed, added
+
+
+def _check_l3_rules(src_rules, dst_rules, report):
+    src_rules, dst_rules = _without_default_rule(src_rules), _without_default_rule(dst_rules)
+    matched, moved, removed, added = _align_rules(src_rules, dst_rules)
+
+    results = []
+    for i, j in matched:
+        obj = f"Firewall rule #{i+1} ({_describe_rule(_rule_key(src_rules[i]))})"
+        mismatches, diffs = _diff_fields(src_rules[i], dst_rules[j], _RULE_NOTE_FIELDS)
+        if mismatches:
+            results.append((i, False, f"✗ {obj} differs: {', '.join(mismatches)}", obj, diffs, None))
+        else:
+            results.append((i, True, f"✓ {obj} matches", obj, (), None))
+    for i, j in moved:
+        obj = f"Firewall rule #{i+1} ({_describe_rule(_rule_key(src_rules[i]))})"
+        results.append((i, False, f"✗ {obj} moved to #{j+1} in destination", obj,
+                        [{"path": "position", "source": i + 1, "destination": j + 1}], "moved"))
+    for i in removed:
+        obj = f"Firewall rule #{i+1} ({_describe_rule(_rule_key(src_rules[i]))})"
+        results.append((i, False, f"✗ {obj} missing in destination", obj, _diff(src_rules[i], None), "missing"))
+    for _, ok, msg, obj, diffs, status in sorted(results, key=lambda r: r[0]):
+        _report(report, ok, msg, obj, diffs, status)
+
+    for j in added:
+        obj = f"Destination firewall rule #{j+1} ({_describe_rule(_rule_key(dst_rules[j]))})"
+        _report(report, False, f"✗ {obj} not in source", obj, _diff(None, dst_rules[j]), "extra")
+
+
+def _check_group_policies(src_pols, dst_pols, report):
     dst_pols_map = {p["name"]: p for p in dst_pols}
     for sp in src_pols:
+        obj = f"Group policy '{sp['name']}'"
         dp = dst_pols_map.get(sp["name"])
         if not dp:
-            msg = f"✗ Group policy '{sp['name']}' missing in destination"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} missing in destination", obj, status="missing")
             continue
 
-        keys_to_check = [k for k in sp if k not in {"groupPolicyId", "networkId"}]
-        mismatches = [k for k in keys_to_check if sp.get(k) != dp.get(k)]
+        mismatches, diffs = _diff_fields(sp, dp, [k for k in sp if k not in {"groupPolicyId", "networkId"}])
         if mismatches:
-            msg = f"✗ Group policy '{sp['name']}' mismatch: {', '.join(mismatches)}"
-            log.warning(msg)
-            report_lines.append(msg)
+            _report(report, False, f"✗ {obj} mismatch: {', '.join(mismatches)}", obj, diffs)
         else:
-            msg = f"✓ Group policy '{sp['name']}' validated"
-            log.info(msg)
-            report_lines.append(msg)
+            _report(report, True, f"✓ {obj} validated", obj)
+
+
+def _rules(body):
+    return body["rules"]
+
+
+def _as_is(body):
+    return body
+
+
+# Validation sections in report order:
+# (heading, skip label, API section, getter, extract, check)
+_VALIDATION_SECTIONS = (
+    ("VLANs and DHCP scopes:", "DHCP validation", "appliance", "getNetworkApplianceVlans", _as_is, _check_vlans),
+    ("\nStatic Routes:", "Static routes validation", "appliance", "getNetworkApplianceStaticRoutes", _as_is, _check_static_routes),
+    ("\nWireless SSIDs:", "SSID validation", "wireless", "getNetworkWirelessSsids", _as_is, _check_ssids),
+    ("\nMX L3 Firewall Rules:", "MX L3 Firewall validation", "appliance", "getNetworkApplianceFirewallL3FirewallRules", _rules, _check_l3_rules),
+    ("\nGroup Policies:", "Group policies validation", "networks", "getNetworkGroupPolicies", _as_is, _check_group_policies),
+)
+
+
+# Both sides of every section are fetched at once.
+VALIDATION_WORKERS = 2 * len(_VALIDATION_SECTIONS)
 
-    # Save report to file
-    report_path = f"network_validation_report_{dst_net}.txt"
-    with open(report_path, "w") as f:
-        f.write("\n".join(report_lines))
-    log.info("Validation report saved to %s", report_path)
+
+def _check_section(spec, src_body, dst_body, err):
+    """Compare one section's raw source/destination responses into a :class:`_SectionReport`."""
+    heading, skip_label, _, _, extract, check = spec
+    report = _SectionReport(heading)
+    if err is not None:
+        _report(report, False, f"{skip_label} skipped: {err}", status="skipped")
+    else:
+        check(extract(src_body), extract(dst_body), report)
+    return report
+
+
+# Statuses that do not fail validation; a section the network doesn't have
+# (e.g. VLANs on a single-LAN network) is skipped, not failed.
+_PASSING = frozenset({"ok", "skipped"})
+
+
+def _build_report(sections, src_net, dst_net):
+    """The structured report for per-section results given in ``_VALIDATION_SECTIONS`` order.
+
+    ``passed`` is true when no object failed (only ok and skipped results);
+    ``summary`` counts results by status (ok, mismatch, missing, skipped, and
+    for firewall rules moved and extra).
+    """
+    summary = Counter(r["status"] for sec in sections for r in sec.results)
+    return {
+        "source": src_net,
+        "destination": dst_net,
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "passed": set(summary) <= _PASSING,
+        "summary": dict(summary),
+        "sections": [{"name": sec.name, "results": sec.results} for sec in sections],
+    }
+
+
+def _junit_xml(report):
+    """Render *report* as JUnit XML: one test suite per section, one test case per object."""
+    suites = ET.Element("testsuites", name=f"network-validation {report['destination']}")
+    for sec in report["sections"]:
+        results = sec["results"]
+        suite = ET.SubElement(suites, "testsuite", name=sec["name"], tests=str(len(results)),
+                              failures=str(sum(r["status"] not in _PASSING for r in results)),
+                              skipped=str(sum(r["status"] == "skipped" for r in results)))
+        for r in results:
+            case = ET.SubElement(suite, "testcase", classname=f"validation.{report['destination']}",
+                                 name=r["object"] or sec["name"])
+            if r["status"] == "skipped":
+                ET.SubElement(case, "skipped", message=r["message"])
+            elif r["status"] != "ok":  # mismatch, missing, moved or extra
+                failure = ET.SubElement(case, "failure", message=r["message"], type=r["status"])
+                failure.text = "\n".join(f"{d['path']}: {json.dumps(d['source'], default=str)} → "
+                                         f"{json.dumps(d['destination'], default=str)}" for d in r["diffs"])
+    ET.indent(suites)
+    return ET.tostring(suites, encoding="unicode", xml_declaration=True)
+
+
+def _write_report(sections, src_net, dst_net):
+    """Write the text, JSON and JUnit-XML validation reports and return the structured one."""
+    base = f"network_validation_report_{dst_net}"
+    report = _build_report(sections, src_net, dst_net)
+    with open(f"{base}.txt", "w") as f:
+        f.write("\n".join(["Network Validation Report:\n", *(line for sec in sections for line in sec.lines)]))
+    with open(f"{base}.json", "w") as f:
+        json.dump(report, f, indent=2, default=str)
+    with open(f"{base}.xml", "w") as f:
+        f.write(_junit_xml(report))
+    log.info("Validation report saved to %s.txt (.json, .xml): %s", base,
+             ", ".join(f"{n} {status}" for status, n in report["summary"].items()) or "nothing to compare")
+    return report
+
+
+@_stage("validate_network")
+def validate_network(db, src_net, dst_net):
+    """Compare every validation section of *dst_net* against *src_net*.
+
+    Writes the text, JSON and JUnit-XML reports and returns the structured
+    report (see :func:`_build_report`).
+
+    All section GETs for both networks are in flight at once, and each
+    section is compared as soon as both of its responses are in, so the fetch
+    phase costs about one round trip of the slowest endpoint. Reads skip the
+    on-disk cache (``--cache-dir``), so the verdict never rests on a stored
+    answer.
+    """
+    sections = [None] * len(_VALIDATION_SECTIONS)
+    with _fresh_reads(), ThreadPoolExecutor(max_workers=VALIDATION_WORKERS, thread_name_prefix="validate") as pool:
+        submit = _submit_in_context(pool)
+        owner = {}
+        for i, (_, _, section, getter, _, _) in enumerate(_VALIDATION_SECTIONS):
+            fetch = getattr(getattr(db, section), getter)
+            pair = (submit(fetch, src_net), submit(fetch, dst_net))
+            owner.update({fut: (i, pair) for fut in pair})
+
+        for fut in as_completed(owner):
+            i, (src, dst) = owner[fut]
+            if sections[i] is None and src.done() and dst.done():
+                try:
+                    src_body, dst_body, err = src.result(), dst.result(), None
+                except APIError as e:
+                    src_body, dst_body, err = [], [], e
+                sections[i] = _check_section(_VALIDATION_SECTIONS[i], src_body, dst_body, err)
+    return _write_report(sections, src_net, dst_net)
 
 # ----------------------------
 # Main Cloning Logic
 # ----------------------------
 
-def clone_network(api_key, src_net_id, dst_org_id, *, dst_net_name=None, time_zone="America/Chicago", use_native=True, log_level="INFO"):
+def _wrap(db, rate, burst, cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL, cache_scopes=(), per_org_rate=False):
+    # Caches outermost so hits never spend a rate-limit token; instrumentation
+    # innermost so it times the API, not the limiter. Only reads about
+    # *cache_scopes* (the source networks) go to the on-disk cache. With
+    # *per_org_rate*, each organisation gets its own *rate* budget.
+    db = InstrumentedDashboard(db)
+    if rate and per_org_rate:
+        db = OrgRateLimitedDashboard(db, rate, burst)
+    elif rate:
+        db = RateLimitedDashboard(db, TokenBucket(rate, burst))
+    if cache_dir:
+        db = PersistentCachedDashboard(db, ResponseStore(cache_dir, cache_ttl), cache_scopes)
+    return CachedDashboard(db)
+
+
+def _dashboard(api_key, rate=DEFAULT_RATE, burst=None, cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL, cache_scopes=(),
+               per_org_rate=False):
+    # Concurrent workers can trip the per-org rate limit; let the SDK wait out
+    # 429s a few more times than its default before giving up.
+    db = meraki.DashboardAPI(api_key=api_key, print_console=False, suppress_logging=True,
+                             wait_on_rate_limit=True, maximum_retries=MAX_RETRIES)
+    return _wrap(db, rate, burst, cache_dir, cache_ttl, cache_scopes, per_org_rate)
+
+
+def clone_network(api_key, src_net_id, dst_org_id, *, dst_net_name=None, time_zone="America/Chicago", use_native=True, log_level="INFO",
+                  workers=DEFAULT_WORKERS, rate=DEFAULT_RATE, burst=None, dst_net_id=None, reconcile=False, action_batches=None,
+                  metrics_json=None, metrics_prom=None, cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL):
+    """Clone *src_net_id* into *dst_org_id* and return the destination network id.
+
+    Pass *dst_net_id* to sync into an existing network instead of creating
+    one; with *reconcile* only objects that differ are written. Set
+    *action_batches* to ``"sync"`` or ``"async"`` to push VLANs and group
+    policies as action batches. Per-stage call metrics are logged at the end
+    and, given *metrics_json* / *metrics_prom*, written to those files. With
+    *cache_dir*, source reads are kept on disk for *cache_ttl* seconds and
+    reused by later runs.
+    """
     setup_logging(log_level)
-    db = meraki.DashboardAPI(api_key=api_key, print_console=False, suppress_logging=True)
-    src_info = db.networks.getNetwork(src_net_id)
+    db = _dashboard(api_key, rate, burst, cache_dir, cache_ttl, [src_net_id])
+    with TRACER.span("clone_network", "clone", src_net=src_net_id):
+        src_info = db.networks.getNetwork(src_net_id)
+        dst_id = _clone_with(db, src_info, src_net_id, dst_org_id, dst_net_name=dst_net_name,
+                             time_zone=time_zone, use_native=use_native, workers=workers,
+                             dst_net_id=dst_net_id, reconcile=reconcile, action_batches=action_batches)
+    _log_session_stats(db, metrics_json, metrics_prom)
+    return dst_id
+
+
+def _clone_with(db, src_info, src_net_id, dst_org_id, *, dst_net_name, time_zone, use_native, workers,
+                dst_net_id=None, reconcile=False, action_batches=None):
+    """Clone an already-resolved source network over an existing session."""
     log.info("Source network '%s' (%s)", src_info["name"], src_net_id)
+    batcher = None
+    if action_batches:
+        batcher = ActionBatcher(db, dst_org_id, synchronous=action_batches == "sync")
+
+    if dst_net_id:
+        log.info("-- Syncing into existing network %s --", dst_net_id)
+        _granular_sync(db, src_info, src_net_id, dst_net_id, workers=workers, reconcile=reconcile, batcher=batcher)
+        return dst_net_id
 
     if use_native:
         try:
@@ -390,20 +1852,414 @@ def clone_network(api_key, src_net_id, dst_org_id, *, dst_net_name=None, time_zo
     )
     dst_id = dst_net["id"]
     log.info("-- Granular sync started --")
+    _granular_sync(db, src_info, src_net_id, dst_id, workers=workers, reconcile=reconcile, batcher=batcher)
+    return dst_id
 
+
+def _granular_sync(db, src_info, src_net_id, dst_id, *, workers, reconcile, batcher=None):
+    outcome = Counter()
     if "wireless" in src_info["productTypes"]:
-        sync_ssids(db, src_net_id, dst_id)
+        outcome += sync_ssids(db, src_net_id, dst_id, workers=workers, reconcile=reconcile)
 
     if "appliance" in src_info["productTypes"]:
-        sync_addressing(db, src_net_id, dst_id)
-        sync_l3_fw(db, src_net_id, dst_id)
+        outcome += sync_addressing(db, src_net_id, dst_id, reconcile=reconcile, batcher=batcher)
+        outcome += sync_l3_fw(db, src_net_id, dst_id, reconcile=reconcile)
 
-    sync_group_policies(db, src_net_id, dst_id)
+    outcome += sync_group_policies(db, src_net_id, dst_id, batcher=batcher)
+    log.info("Sync summary: %d created, %d updated, %d unchanged, %d failed",
+             outcome["created"], outcome["updated"], outcome["unchanged"], outcome["failed"])
     validate_network(db, src_net_id, dst_id)
 
     log.info("Granular sync complete ✓")
+
+# ----------------------------
+# Async pipeline (meraki.aio)
+# ----------------------------
+#
+# Mirrors the blocking pipeline on AsyncDashboardAPI. Independent objects are
+# pushed concurrently; the SDK's maximum_concurrent_requests caps how many of
+# them are actually in flight.
+
+_ASYNC_ERRORS = (APIError, AsyncAPIError)
+
+
+async def _upsert_async(src, dst, id_key, create_cb, update_cb, label):
+    idx = {d[id_key]: d for d in dst}
+
+    async def one(obj):
+        ident = obj[id_key]
+        try:
+            with TRACER.span(f"{label} {ident}", "object"):
+                if ident in idx:
+                    await update_cb(ident, obj)
+                    log.info("  • %s %s updated", label, ident)
+                else:
+                    await create_cb(obj)
+                    log.info("  • %s %s created", label, ident)
+        except _ASYNC_ERRORS as exc:
+            log.error("  ✗ %s %s – %s", label, ident, exc)
+
+    await asyncio.gather(*(one(obj) for obj in src))
+
+
+async def _clone_optional_async(getter, setter, src_net, dst_net, num, label):
+    try:
+        with TRACER.span(label, "object"):
+            body = await getter(src_net, num)
+            await setter(dst_net, num, **body)
+        log.info("    ↳ %s synced", label)
+    except _ASYNC_ERRORS:
+        pass
+
+
+async def _sync_ssid_async(db, s, src_net, dst_net):
+    num = s["number"]
+    core = _ssid_core(s)
+    try:
+        await db.wireless.updateNetworkWirelessSsid(dst_net, num, **core)
+        log.info("  • SSID %d '%s' core synced", num, core.get("name"))
+    except _ASYNC_ERRORS as exc:
+        log.error("  ✗ SSID %d core – %s", num, exc)
+        return
+
+    await asyncio.gather(*(
+        _clone_optional_async(getattr(db.wireless, f"getNetworkWirelessSsid{suffix}"),
+                              _ssid_setter(db.wireless, suffix, rules_only),
+                              src_net, dst_net, num, f"SSID {num} {label}")
+        for suffix, label, rules_only in _SSID_SUBSETTINGS
+    ))
+
+
+@_stage("sync_ssids")
+async def sync_ssids_async(db, src_net, dst_net):
+    ssids = await db.wireless.getNetworkWirelessSsids(src_net)
+    await asyncio.gather(*(_sync_ssid_async(db, s, src_net, dst_net) for s in ssids))
+
+
+@_stage("sync_addressing")
+async def sync_addressing_async(db, src_net, dst_net):
+    src_set, dst_set = await asyncio.gather(
+        db.appliance.getNetworkApplianceVlansSettings(src_net),
+        db.appliance.getNetworkApplianceVlansSettings(dst_net),
+    )
+
+    if src_set.get("vlansEnabled"):
+        if not dst_set.get("vlansEnabled"):
+            await db.appliance.updateNetworkApplianceVlansSettings(dst_net, vlansEnabled=True)
+        await _sync_vlans_async(db, src_net, dst_net)
+    else:
+        if dst_set.get("vlansEnabled"):
+            await db.appliance.updateNetworkApplianceVlansSettings(dst_net, vlansEnabled=False)
+        lan = await db.appliance.getNetworkApplianceSingleLan(src_net)
+        await db.appliance.updateNetworkApplianceSingleLan(dst_net, **{k: v for k, v in lan.items() if k != "networkId"})
+        log.info("  • Single-LAN settings mirrored")
+
+    # Routes point at VLAN subnets, so they go in only once the VLANs exist.
+    await _sync_static_routes_async(db, src_net, dst_net)
+
+
+async def _sync_vlans_async(db, src_net, dst_net):
+    src_vlans = await db.appliance.getNetworkApplianceVlans(src_net)
+    try:
+        dst_vlans = await db.appliance.getNetworkApplianceVlans(dst_net)
+    except _ASYNC_ERRORS as exc:
+        if exc.status != 404:
+            raise
+        dst_vlans = []
+
+    await _upsert_async(
+        src_vlans,
+        dst_vlans,
+        "id",
+        lambda vlan: db.appliance.createNetworkApplianceVlan(dst_net, **_vlan_body(vlan, include_id=True)),
+        lambda vid, vlan: db.appliance.updateNetworkApplianceVlan(dst_net, vid, **_vlan_body(vlan)),
+        "VLAN"
+    )
+
+
+@_stage("_sync_static_routes")
+async def _sync_static_routes_async(db, src_net, dst_net):
+    src_routes, dst_routes = await asyncio.gather(
+        db.appliance.getNetworkApplianceStaticRoutes(src_net),
+        db.appliance.getNetworkApplianceStaticRoutes(dst_net),
+    )
+    idx = {r["name"]: r for r in dst_routes}
+
+    async def one(r):
+        name = r["name"]
+        body = _route_body(r)
+        if name in idx:
+            await db.appliance.updateNetworkApplianceStaticRoute(dst_net, _route_id(idx[name]), **body)
+            log.info("  • Static route '%s' updated", name)
+        else:
+            await db.appliance.createNetworkApplianceStaticRoute(dst_net, **body)
+            log.info("  • Static route '%s' created", name)
+
+    await asyncio.gather(*(one(r) for r in src_routes))
+
+
+@_stage("sync_l3_fw")
+async def sync_l3_fw_async(db, src_net, dst_net):
+    rules = await db.appliance.getNetworkApplianceFirewallL3FirewallRules(src_net)
+    await db.appliance.updateNetworkApplianceFirewallL3FirewallRules(dst_net, rules=rules["rules"])
+    log.info("  • MX L3 firewall rules synced")
+
+
+@_stage("sync_group_policies")
+async def sync_group_policies_async(db, src_net, dst_net):
+    src_pols, dst_pols = await asyncio.gather(
+        db.networks.getNetworkGroupPolicies(src_net),
+        db.networks.getNetworkGroupPolicies(dst_net),
+    )
+    idx = {p["name"]: p for p in dst_pols}
+
+    async def one(p):
+        have = idx.get(p["name"])
+        if have is None:
+            await db.networks.createNetworkGroupPolicy(dst_net, **_policy_body(p))
+            log.info("  • Group policy '%s' created", p["name"])
+        else:
+            await db.networks.updateNetworkGroupPolicy(dst_net, have["groupPolicyId"], **_policy_body(p))
+            log.info("  • Group policy '%s' updated", p["name"])
+
+    await asyncio.gather(*(one(p) for p in src_pols if not _matches(_policy_body(p), idx.get(p["name"]))))
+
+
+@_stage("validate_network")
+async def validate_network_async(db, src_net, dst_net):
+    async def section(spec):
+        fetch_one = getattr(getattr(db, spec[2]), spec[3])
+        try:
+            src_body, dst_body = await asyncio.gather(fetch_one(src_net), fetch_one(dst_net))
+        except _ASYNC_ERRORS as e:
+            return _check_section(spec, [], [], e)
+        return _check_section(spec, src_body, dst_body, None)
+
+    with _fresh_reads():
+        sections = await asyncio.gather(*(section(spec) for spec in _VALIDATION_SECTIONS))
+    return _write_report(sections, src_net, dst_net)
+
+
+async def _clone_network_async(db, src_net_id, dst_org_id, *, dst_net_name, time_zone, use_native):
+    src_info = await db.networks.getNetwork(src_net_id)
+    log.info("Source network '%s' (%s)", src_info["name"], src_net_id)
+
+    if use_native:
+        try:
+            dst_net = await db.organizations.createOrganizationNetwork(
+                organizationId=src_info["organizationId"],
+                name=dst_net_name or f"Cloned: {src_info['name']}",
+                productTypes=src_info["productTypes"],
+                timeZone=time_zone,
+                copyFromNetworkId=src_net_id,
+            )
+            log.info("✓ Native clone complete (%s)", dst_net["id"])
+            await validate_network_async(db, src_net_id, dst_net["id"])
+            return dst_net["id"]
+        except _ASYNC_ERRORS as e:
+            log.warning("Native clone failed (%s); continuing with granular copy", e)
+
+    dst_net = await db.organizations.createOrganizationNetwork(
+        organizationId=dst_org_id,
+        name=dst_net_name or f"Cloned: {src_info['name']}",
+        productTypes=src_info["productTypes"],
+        timeZone=time_zone,
+    )
+    dst_id = dst_net["id"]
+    log.info("-- Granular sync started (async) --")
+
+    async def appliance():
+        await sync_addressing_async(db, src_net_id, dst_id)
+        await sync_l3_fw_async(db, src_net_id, dst_id)
+
+    branches = [sync_group_policies_async(db, src_net_id, dst_id)]
+    if "wireless" in src_info["productTypes"]:
+        branches.append(sync_ssids_async(db, src_net_id, dst_id))
+    if "appliance" in src_info["productTypes"]:
+        branches.append(appliance())
+    await asyncio.gather(*branches)
+
+    await validate_network_async(db, src_net_id, dst_id)
+    log.info("Granular sync complete ✓")
     return dst_id
 
+
+async def clone_network_async(api_key, src_net_id, dst_org_id, *, dst_net_name=None, time_zone="America/Chicago", use_native=True, db=None,
+                              rate=DEFAULT_RATE, burst=None, metrics_json=None, metrics_prom=None,
+                              cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL):
+    """Async counterpart of :func:`clone_network`.
+
+    Pass an open ``AsyncDashboardAPI`` (or a proxy around one) as *db* to
+    clone many networks concurrently from one event loop over a single
+    session; otherwise a rate-limited session is opened for this clone alone.
+    """
+    opts = dict(dst_net_name=dst_net_name, time_zone=time_zone, use_native=use_native)
+    if db is not None:
+        with TRACER.span("clone_network", "clone", src_net=src_net_id):
+            return await _clone_network_async(db, src_net_id, dst_org_id, **opts)
+    async with meraki.aio.AsyncDashboardAPI(api_key=api_key, print_console=False, suppress_logging=True,
+                                            wait_on_rate_limit=True, maximum_retries=MAX_RETRIES) as aio:
+        db = _wrap(aio, rate, burst, cache_dir, cache_ttl, [src_net_id])
+        with TRACER.span("clone_network", "clone", src_net=src_net_id):
+            dst_id = await _clone_network_async(db, src_net_id, dst_org_id, **opts)
+        _log_session_stats(db, metrics_json, metrics_prom)
+        return dst_id
+
+# ----------------------------
+# Bulk clone (manifest)
+# ----------------------------
+
+_MANIFEST_FIELDS = ("src_net", "dst_name", "time_zone", "dst_org", "dst_net")
+
+
+def load_manifest(path):
+    """Read clone jobs from a CSV (with header) or JSON list of objects.
+
+    Each job needs ``src_net``; ``dst_name``, ``time_zone`` and ``dst_org``
+    are optional and fall back to the CLI/default values. ``dst_net`` syncs
+    into an existing network (e.g. when re-running a migration).
+    """
+    with open(path, newline="") as fh:
+        if path.lower().endswith(".json"):
+            rows = json.load(fh)
+        else:
+            rows = list(csv.DictReader(fh))
+
+    jobs = []
+    for n, row in enumerate(rows, 1):
+        job = {k: (row.get(k) or "").strip() or None for k in _MANIFEST_FIELDS}
+        if not job["src_net"]:
+            raise ValueError(f"{path}: row {n} has no src_net")
+        jobs.append(job)
+    return jobs
+
+
+def _resolve_sources(db, src_ids):
+    """Look up source networks, one org-wide listing per source organisation.
+
+    A single getNetwork call discovers each org; its getOrganizationNetworks
+    listing then answers every other manifest row in that org. If the
+    listing fails, that org's rows are looked up one by one, so only rows
+    that really can't be read fail.
+    """
+    infos, listed = {}, set()
+    for net_id in src_ids:
+        if net_id in infos:
+            continue
+        try:
+            info = db.networks.getNetwork(net_id)
+        except APIError as exc:
+            log.error("  ✗ Source network %s – %s", net_id, exc)
+            continue
+        infos[net_id] = info
+        org_id = info["organizationId"]
+        if org_id in listed:
+            continue
+        listed.add(org_id)
+        _persist_scope(db, org_id)
+        try:
+            nets = db.organizations.getOrganizationNetworks(org_id, total_pages="all")
+        except APIError as exc:
+            log.warning("  ! Networks of org %s not listed (%s); looking its rows up one by one", org_id, exc)
+            continue
+        for net in nets:
+            infos.setdefault(net["id"], net)
+    return infos
+
+
+def _interleave(jobs, key):
+    """Job indexes reordered round-robin across *key* groups, manifest order within each."""
+    seen = Counter()
+    rank = []
+    for i, job in enumerate(jobs):
+        group = key(job)
+        rank.append((seen[group], i))
+        seen[group] += 1
+    return [i for _, i in sorted(rank)]
+
+
+def clone_networks(api_key, jobs, dst_org_id, *, time_zone="America/Chicago", use_native=True, log_level="INFO",
+                   workers=DEFAULT_WORKERS, parallel=DEFAULT_PARALLEL_CLONES, per_org=None, rate=DEFAULT_RATE, burst=None,
+                   reconcile=False, action_batches=None, metrics_json=None, metrics_prom=None,
+                   cache_dir=None, cache_ttl=DEFAULT_CACHE_TTL):
+    """Clone every job from :func:`load_manifest` over one shared session.
+
+    At most *parallel* networks are cloned at once, and at most *per_org*
+    (default: ``DEFAULT_PER_ORG_CLONES``, capped at *parallel*) of them may
+    write to the same destination organisation; jobs are started round-robin
+    across destination orgs. Each organisation gets its own *rate* budget,
+    like the Dashboard's own per-org limit. Returns one result dict per job,
+    in manifest order.
+    """
+    setup_logging(log_level)
+    db = _dashboard(api_key, rate, burst, cache_dir, cache_ttl, [job["src_net"] for job in jobs], per_org_rate=True)
+    infos = _resolve_sources(db, [job["src_net"] for job in jobs])
+    limiter = _find_proxy(db, OrgRateLimitedDashboard)
+    if limiter:
+        for net_id, info in infos.items():
+            limiter.assign(net_id, info["organizationId"])
+
+    def org_of(job):
+        return job["dst_org"] or dst_org_id
+
+    org_slots = {org: threading.BoundedSemaphore(min(per_org or DEFAULT_PER_ORG_CLONES, parallel))
+                 for org in map(org_of, jobs)}
+
+    def run(job):
+        org = org_of(job)
+        result = {"src_net": job["src_net"], "dst_name": job["dst_name"], "dst_org": org,
+                  "status": "failed", "dst_net": None, "error": None, "seconds": 0.0}
+        src_info = infos.get(job["src_net"])
+        if src_info is None:
+            result["error"] = "source network not found"
+            return result
+
+        with org_slots[org]:
+            started = time.monotonic()
+            token = _ORG.set(org)
+            try:
+                with TRACER.span("clone_network", "clone", src_net=job["src_net"]):
+                    result["dst_net"] = _clone_with(
+                        db, src_info, job["src_net"], org,
+                        dst_net_name=job["dst_name"], time_zone=job["time_zone"] or time_zone,
+                        use_native=use_native, workers=workers,
+                        dst_net_id=job["dst_net"], reconcile=reconcile, action_batches=action_batches,
+                    )
+                result["status"] = "ok"
+            except Exception as exc:  # one bad network must not sink the batch
+                log.error("  ✗ Clone of %s failed – %s", job["src_net"], exc)
+                result["error"] = str(exc)
+            finally:
+                _ORG.reset(token)
+            result["seconds"] = round(time.monotonic() - started, 1)
+        return result
+
+    order = _interleave(jobs, org_of)
+    results = [None] * len(jobs)
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="clone") as pool:
+        for i, result in zip(order, pool.map(run, [jobs[i] for i in order])):
+            results[i] = result
+    _log_session_stats(db, metrics_json, metrics_prom)
+    return results
+
+
+def print_results(results, csv_path=None):
+    cols = ("src_net", "dst_name", "dst_org", "status", "dst_net", "seconds", "error")
+    rows = [[str(r[c]) if r[c] is not None else "-" for c in cols] for r in results]
+    widths = [max([len(c), *(len(row[i]) for row in rows)]) for i, c in enumerate(cols)]
+    print("  ".join(c.ljust(w) for c, w in zip(cols, widths)))
+    print("  ".join("-" * w for w in widths))
+    for row in rows:
+        print("  ".join(v.ljust(w) for v, w in zip(row, widths)))
+    ok = sum(r["status"] == "ok" for r in results)
+    print(f"\n{ok}/{len(results)} networks cloned")
+
+    if csv_path:
+        with open(csv_path, "w", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=cols)
+            writer.writeheader()
+            writer.writerows(results)
+
 # ----------------------------
 # CLI Entry
 # ----------------------------
@@ -411,14 +2267,108 @@ def clone_network(api_key, src_net_id, dst_org_id, *, dst_net_name=None, time_zo
 def main():
     parser = argparse.ArgumentParser(description="Clone a Meraki network across orgs")
     parser.add_argument("--api-key", required=True, help="Your Meraki Dashboard API key")
-    parser.add_argument("--src-net", required=True, help="Source network ID")
-    parser.add_argument("--dst-org", required=True, help="Destination organization ID")
+    src = parser.add_mutually_exclusive_group(required=True)
+    src.add_argument("--src-net", help="Source network ID")
+    src.add_argument("--manifest", help="CSV/JSON of clone jobs (src_net, dst_name, time_zone, dst_org) for bulk mode")
+    parser.add_argument("--dst-org", required=True, help="Destination organization ID (default for manifest rows)")
     parser.add_argument("--dst-name", help="Destination network name")
+    parser.add_argument("--dst-net", help="Sync into this existing destination network instead of creating one")
+    parser.add_argument("--reconcile", action="store_true", help="Only write objects that differ from the destination")
     parser.add_argument("--time-zone", default="America/Chicago", help="Timezone for new network")
     parser.add_argument("--no-native", action="store_true", help="Disable native clone via copyFromNetworkId")
     parser.add_argument("--log-level", default="INFO", help="Log verbosity (DEBUG, INFO, WARNING, ERROR)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent API workers for per-SSID sync (1 = serial)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="Client-side request budget in req/s, per org in bulk mode (0 disables)")
+    parser.add_argument("--burst", type=float, help="Bucket size: requests allowed back-to-back before throttling (default: --rate)")
+    parser.add_argument("--action-batches", choices=("sync", "async"),
+                        help="Push VLANs and group policies as action batches (sync: 20/batch, async: 100/batch, polled)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Run the clone on the asyncio backend (meraki.aio)")
+    parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLEL_CLONES, help="Bulk mode: networks cloned at once")
+    parser.add_argument("--per-org", type=int,
+                        help=f"Bulk mode: max concurrent clones per destination org (default: {DEFAULT_PER_ORG_CLONES})")
+    parser.add_argument("--results", help="Bulk mode: also write the result table to this CSV file")
+    parser.add_argument("--metrics-json", help="Write per-stage/per-endpoint call metrics to this JSON file")
+    parser.add_argument("--metrics-prom", help="Write call metrics as a Prometheus textfile-collector file")
+    parser.add_argument("--cache-dir", help="Keep API reads in an SQLite cache in this directory and reuse them across runs")
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_CACHE_TTL,
+                        help=f"Seconds a --cache-dir entry stays valid (default: {DEFAULT_CACHE_TTL}, 0 = until invalidated)")
+    parser.add_argument("--cache-clear", action="store_true", help="Empty the --cache-dir cache before running")
+    parser.add_argument("--trace", help="Write trace spans to this Chrome trace JSON file (open in Perfetto)")
+    parser.add_argument("--trace-otlp", metavar="URL",
+                        help="Export trace spans to an OTLP/HTTP collector, e.g. http://localhost:4318/v1/traces")
     args = parser.parse_args()
 
+    if args.cache_clear:
+        if not args.cache_dir:
+            parser.error("--cache-clear needs --cache-dir")
+        setup_logging(args.log_level)
+        store = ResponseStore(args.cache_dir)
+        log.info("Cleared %d cached responses from %s", store.invalidate(), store.path)
+        store.close()
+    if args.trace or args.trace_otlp:
+        try:
+            TRACER.start(otlp_endpoint=args.trace_otlp)
+        except RuntimeError as exc:
+            parser.error(str(exc))
+    try:
+        _run_cli(parser, args)
+    finally:
+        if TRACER.enabled:
+            if args.trace:
+                TRACER.write(args.trace)
+            TRACER.shutdown()
+
+
+def _run_cli(parser, args):
+    if args.manifest:
+        if args.use_async:
+            parser.error("--async cannot be combined with --manifest")
+        results = clone_networks(
+            api_key=args.api_key,
+            jobs=load_manifest(args.manifest),
+            dst_org_id=args.dst_org,
+            time_zone=args.time_zone,
+            use_native=not args.no_native,
+            log_level=args.log_level,
+            workers=args.workers,
+            parallel=args.parallel,
+            per_org=args.per_org,
+            rate=args.rate,
+            burst=args.burst,
+            reconcile=args.reconcile,
+            action_batches=args.action_batches,
+            metrics_json=args.metrics_json,
+            metrics_prom=args.metrics_prom,
+            cache_dir=args.cache_dir,
+            cache_ttl=args.cache_ttl,
+        )
+        print_results(results, args.results)
+        if any(r["status"] != "ok" for r in results):
+            sys.exit(1)
+        return
+
+    if args.use_async:
+        if args.dst_net or args.reconcile or args.action_batches:
+            parser.error("--dst-net/--reconcile/--action-batches are not supported with --async")
+        setup_logging(args.log_level)
+        net_id = asyncio.run(clone_network_async(
+            api_key=args.api_key,
+            src_net_id=args.src_net,
+            dst_org_id=args.dst_org,
+            dst_net_name=args.dst_name,
+            time_zone=args.time_zone,
+            use_native=not args.no_native,
+            rate=args.rate,
+            burst=args.burst,
+            metrics_json=args.metrics_json,
+            metrics_prom=args.metrics_prom,
+            cache_dir=args.cache_dir,
+            cache_ttl=args.cache_ttl,
+        ))
+        print(f"✓ Network cloned to {net_id}")
+        return
+
     net_id = clone_network(
         api_key=args.api_key,
         src_net_id=args.src_net,
@@ -427,6 +2377,16 @@ def main():
         time_zone=args.time_zone,
         use_native=not args.no_native,
         log_level=args.log_level,
+        workers=args.workers,
+        rate=args.rate,
+        burst=args.burst,
+        dst_net_id=args.dst_net,
+        reconcile=args.reconcile,
+        action_batches=args.action_batches,
+        metrics_json=args.metrics_json,
+        metrics_prom=args.metrics_prom,
+        cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl,
     )
     print(f"✓ Network cloned to {net_id}")
 
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+benchmark.py
+Clone / backup / restore throughput benchmarks against meraki_simulator.
+
+Each scenario seeds a fresh simulator, does any setup untimed, then measures
+one run: wall-clock time, API request count (and how many were answered 429),
+requests/s, and peak Python memory from a separate tracemalloc run. Results
+are appended to a JSON Lines file and compared with the previous run of the
+same scenario under the same simulator settings.
+
+Usage
+  python benchmark.py --list
+  python benchmark.py                                   # every scenario
+  python benchmark.py clone-sync backup-fleet --latency 0.08 --repeat 3
+  python benchmark.py --org-rate 0 --client-rate 0      # no 429s, no script limiter
+  python benchmark.py --smart-flow                      # keep the SDK's own limiter on
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import pathlib
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from meraki_simulator import Simulator, add_simulator_args, install, simulator_from_args
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+CLONER = ROOT / "copy_net_from_org_to_other_org.py" / "copy_meraki_network.py"
+SWITCH_CLI = ROOT / "meraki-switch-config-cli.py" / "meraki-switch-config.py"
+DEFAULT_RESULTS = pathlib.Path(__file__).resolve().parent / "bench_results.jsonl"
+
+
+def _load(path: pathlib.Path, name: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+#
+# A scenario is (description, seed kwargs, setup). setup(ctx) runs untimed
+# and returns the zero-argument callable that is measured.
+
+Setup = Callable[[Dict[str, Any]], Callable[[], Any]]
+
+_CLONE_SEED = dict(orgs=2, networks=1, ssids=15, vlans=50, routes=100, l3_rules=20, group_policies=5)
+_FLEET_SEED = dict(orgs=1, networks=10, switches=50, ports=48)
+_RESTORE_SEED = dict(orgs=1, networks=1, switches=2, ports=48)
+
+
+def _client_rate(ctx: Dict[str, Any], default: float) -> Dict[str, Any]:
+    rate = ctx["args"].client_rate
+    return {"rate": default if rate is None else rate}
+
+
+def _clone(mode: str) -> Setup:
+    def setup(ctx: Dict[str, Any]) -> Callable[[], Any]:
+        cloner, inv = ctx["cloner"], ctx["inventory"]
+        src, dst_org = inv["networks"][0], inv["orgs"][1]
+        opts = dict(dst_net_name=f"Bench {mode}", use_native=False, **_client_rate(ctx, cloner.DEFAULT_RATE))
+        if mode == "async":
+            return lambda: asyncio.run(cloner.clone_network_async("sim", src, dst_org, **opts))
+        batches = "sync" if mode == "batches" else None
+        return lambda: cloner.clone_network("sim", src, dst_org, log_level="ERROR", action_batches=batches, **opts)
+
+    return setup
+
+
+def _backup(bulk: bool) -> Setup:
+    def setup(ctx: Dict[str, Any]) -> Callable[[], Any]:
+        cli, org = ctx["switch_cli"], ctx["inventory"]["orgs"][0]
+        db = cli.dashboard_from_key("sim", **_client_rate(ctx, cli.DEFAULT_RATE))
+        out = ctx["workdir"] / "backups"
+        if bulk:
+            return lambda: cli.backup_bulk(db, org, out, scope={"org": org})
+        return lambda: cli.backup_fleet(db, cli.list_switches(db, org_id=org), out, scope={"org": org})
+
+    return setup
+
+
+def _restore(action_batches: bool) -> Setup:
+    def setup(ctx: Dict[str, Any]) -> Callable[[], Any]:
+        cli, (source, target) = ctx["switch_cli"], ctx["inventory"]["switches"]
+        db = cli.dashboard_from_key("sim", **_client_rate(ctx, cli.DEFAULT_RATE))
+        cli.backup_switch(db, source, ctx["workdir"])
+        infile = ctx["workdir"] / f"{source}_backup.json"
+        return lambda: cli.restore_switch(db, target, infile, action_batches=action_batches, force=True)
+
+    return setup
+
+
+SCENARIOS: Dict[str, Tuple[str, Dict[str, int], Setup]] = {
+    "clone-sync": ("Clone 15 SSIDs + 50 VLANs + 100 routes (threaded)", _CLONE_SEED, _clone("sync")),
+    "clone-batches": ("Same clone with VLANs / group policies as action batches", _CLONE_SEED, _clone("batches")),
+    "clone-async": ("Same clone through meraki.aio", _CLONE_SEED, _clone("async")),
+    "backup-fleet": ("Back up 500 switches × 48 ports, one call per switch", _FLEET_SEED, _backup(False)),
+    "backup-bulk": ("Back up 500 switches × 48 ports from ports-by-switch pages", _FLEET_SEED, _backup(True)),
+    "restore": ("Restore 48 ports, per-port PUTs", _RESTORE_SEED, _restore(False)),
+    "restore-batches": ("Restore 48 ports as action batches", _RESTORE_SEED, _restore(True)),
+}
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_scenario(name: str, args: argparse.Namespace, modules: Dict[str, ModuleType], trace: bool = False) -> Dict[str, Any]:
+    """
+    Seed a fresh simulator, set up untimed, then measure one run of *name*.
+    With *trace* the run is under tracemalloc, which slows allocation-heavy
+    code several-fold, so its wall time is not comparable with untraced runs.
+    """
+    _, seed, setup = SCENARIOS[name]
+    sim: Simulator = simulator_from_args(args)
+    inventory = sim.seed(**seed)
+    error = None
+
+    with tempfile.TemporaryDirectory() as tmp, install(sim, smart_flow=args.smart_flow):
+        workdir = pathlib.Path(tmp)
+        cwd = os.getcwd()
+        os.chdir(workdir)  # the cloner writes its validation report to the cwd
+        quiet = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(quiet), contextlib.redirect_stderr(quiet):
+                ctx = {"args": args, "inventory": inventory, "workdir": workdir, **modules}
+                measured = setup(ctx)
+                sim.reset_stats()
+                if trace:
+                    tracemalloc.start()
+                started = time.perf_counter()
+                try:
+                    measured()
+                except (Exception, SystemExit) as exc:  # a failed run is still a result
+                    error = f"{type(exc).__name__}: {exc}"
+                wall = time.perf_counter() - started
+                peak = None
+                if trace:
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+
+    return {
+        "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "commit": _git_commit(),
+        "scenario": name,
+        "sim": {"latency": args.latency, "jitter": args.jitter, "org_rate": args.org_rate, "seed": args.seed,
+                "smart_flow": args.smart_flow},
+        "client_rate": args.client_rate,
+        "wall_s": round(wall, 3),
+        "requests": sim.stats["requests"],
+        "throttled": sim.stats["throttled"],
+        "rps": round(sim.stats["requests"] / wall, 2) if wall else None,
+        "peak_mem_mb": None if peak is None else round(peak / 2 ** 20, 2),
+        "error": error,
+    }
+
+
+def _previous(results: pathlib.Path, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Last stored result for the same scenario and simulator settings."""
+    if not results.exists():
+        return None
+    match = None
+    with results.open() as fh:
+        for line in fh:
+            old = json.loads(line)
+            same = all(old.get(k) == record[k] for k in ("scenario", "sim", "client_rate"))
+            if same and not old.get("error"):
+                match = old
+    return match
+
+
+def _delta(new: float, old: Optional[float]) -> str:
+    if not old:
+        return ""
+    return f" ({(new - old) / old:+.0%})"
+
+
+def print_result(record: Dict[str, Any], previous: Optional[Dict[str, Any]]) -> None:
+    prev = previous or {}
+    status = f"  ! {record['error']}" if record["error"] else ""
+    print(
+        f"{record['scenario']:<16} {record['wall_s']:>8.2f}s{_delta(record['wall_s'], prev.get('wall_s')):<8} "
+        f"{record['requests']:>6} req{_delta(record['requests'], prev.get('requests')):<8} "
+        f"{record['throttled']:>4} 429  {record['rps'] or 0:>7.1f} req/s  "
+        f"{record['peak_mem_mb'] or 0:>7.2f} MB{_delta(record['peak_mem_mb'] or 0, prev.get('peak_mem_mb'))}{status}"
+    )
+
+
+def get_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Benchmark clone / backup / restore against the API simulator.")
+    p.add_argument("scenarios", nargs="*", metavar="SCENARIO", help="Scenarios to run (default: all)")
+    p.add_argument("--list", action="store_true", help="List scenarios and exit")
+    p.add_argument("--repeat", type=int, default=1, help="Runs per scenario; the median wall time is reported (default: 1)")
+    p.add_argument(
+        "--client-rate",
+        type=float,
+        help="Override the scripts' client-side rate limit in req/s, 0 disables (default: each script's default)",
+    )
+    p.add_argument(
+        "--results",
+        type=pathlib.Path,
+        default=DEFAULT_RESULTS,
+        help=f"JSON Lines file results are appended to and compared against (default: {DEFAULT_RESULTS.name} next to this script)",
+    )
+    p.add_argument("--no-save", action="store_true", help="Compare with stored results but do not append")
+    p.add_argument(
+        "--no-memory",
+        action="store_true",
+        help="Skip the extra tracemalloc run that measures peak memory",
+    )
+    add_simulator_args(p)
+    args = p.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        p.error(f"unknown scenario(s): {', '.join(sorted(unknown))} (see --list)")
+    return args
+
+
+def main() -> None:  # pragma: no cover
+    args = get_args()
+    if args.list:
+        for name, (description, _, _) in SCENARIOS.items():
+            print(f"{name:<16} {description}")
+        return
+
+    modules = {"cloner": _load(CLONER, "copy_meraki_network"), "switch_cli": _load(SWITCH_CLI, "meraki_switch_config")}
+    # Keep the cloner's INFO logging out of the measurements.
+    modules["cloner"].setup_logging("ERROR")
+
+    print(f"[*] latency {args.latency}s ±{args.jitter}, org rate {args.org_rate or 'off'}, "
+          f"client rate {'script default' if args.client_rate is None else args.client_rate or 'off'}, "
+          f"SDK smart flow {'on' if args.smart_flow else 'off'}")
+    failed = 0
+    for name in args.scenarios or list(SCENARIOS):
+        runs = [run_scenario(name, args, modules) for _ in range(max(1, args.repeat))]
+        record = sorted(runs, key=lambda r: r["wall_s"])[len(runs) // 2]
+        if len(runs) > 1:
+            record["runs"] = len(runs)
+            record["wall_stdev_s"] = round(statistics.stdev(r["wall_s"] for r in runs), 3)
+        if not args.no_memory:
+            # Memory comes from a separate traced run so it cannot skew wall time.
+            record["peak_mem_mb"] = run_scenario(name, args, modules, trace=True)["peak_mem_mb"]
+        print_result(record, _previous(args.results, record))
+        failed += bool(record["error"])
+        if not args.no_save:
+            with args.results.open("a") as fh:
+                fh.write(json.dumps(record) + "\n")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
@@ -0,0 +1,970 @@
+#!/usr/bin/env python3
+"""
+meraki_simulator.py
+Offline stand-in for the Meraki Dashboard API, for benchmarking and
+regression-testing copy_meraki_network.py and meraki-switch-config.py
+without a live Dashboard.
+
+The simulator plugs in underneath the real ``meraki`` SDK as an httpx
+transport, so the SDK's own retry, 429 back-off and pagination code runs
+unchanged against it.
+
+Features
+- Seeded fake organisations, networks, switches (ports), SSIDs, VLANs,
+  static routes, L3 firewall rules and group policies
+- Latency injection (fixed + jitter) per request, sync and asyncio
+- Per-organisation rate limit answered with 429 + Retry-After
+- Link-header pagination (perPage / startingAfter) on org-level listings
+- Action batches (sync and polled async), configuration change log
+- Request counters per endpoint
+
+Usage
+  In-process:
+    sim = Simulator(latency=0.05, jitter=0.02)
+    inventory = sim.seed(networks=2, switches=10, vlans=50)
+    with install(sim):
+        db = meraki.DashboardAPI("any-key", suppress_logging=True)
+        db.switch.getDeviceSwitchPorts(inventory["switches"][0])
+
+  Run a script against a seeded simulator:
+    python meraki_simulator.py --switches 20 --latency 0.05 \
+      run ../meraki-switch-config-cli.py/meraki-switch-config.py \
+      --api-key x backup --org 100001
+
+  Print the seeded inventory (ids to pass to the scripts):
+    python meraki_simulator.py --networks 3 --switches 5
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import copy
+import json
+import random
+import re
+import runpy
+import sys
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import httpx
+    import meraki
+except ImportError:  # pragma: no cover
+    print("[!] Missing dependency: pip install meraki", file=sys.stderr)
+    sys.exit(1)
+
+
+BASE_URL = "https://api.meraki.com/api/v1"
+
+DEFAULT_LATENCY = 0.05  # seconds per request
+DEFAULT_JITTER = 0.02
+DEFAULT_ORG_RATE = 10.0  # Dashboard budget per organisation (req/s)
+DEFAULT_ORG_BURST = 20.0  # … plus a one-off burst of 10 on top
+
+Reply = Tuple[int, Any, Dict[str, str]]
+
+
+class SimulatorError(Exception):
+    """Raised by a handler to answer with an error status."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec="microseconds") + "Z"
+
+
+class _Bucket:
+    """Server-side token bucket: admit or reject, never wait."""
+
+    def __init__(self, rate: float, burst: float) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def admit(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+_ROUTES: List[Tuple[str, "re.Pattern[str]", str, str]] = []  # (method, regex, handler, template)
+
+
+def _route(method: str, pattern: str) -> Callable[[Callable[..., Reply]], Callable[..., Reply]]:
+    template = re.sub(r"\(\?P<(\w+)>[^)]*\)", r"{\1}", pattern)
+
+    def register(fn: Callable[..., Reply]) -> Callable[..., Reply]:
+        _ROUTES.append((method, re.compile(f"^{pattern}$"), fn.__name__, template))
+        return fn
+
+    return register
+
+
+_SSID_SUBS = ("trafficShaping/rules", "firewall/l3FirewallRules", "firewall/l7FirewallRules", "bonjourForwarding", "vpn")
+_DEFAULT_L3_RULE = {
+    "comment": "Default rule",
+    "policy": "allow",
+    "protocol": "Any",
+    "srcPort": "Any",
+    "srcCidr": "Any",
+    "destPort": "Any",
+    "destCidr": "Any",
+    "syslogEnabled": False,
+}
+
+
+class Simulator:
+    """
+    In-memory Dashboard. Everything lives in ``self.state`` and is guarded by
+    one lock; latency is slept outside it so concurrent clients overlap the
+    way they would against the real API.
+    """
+
+    def __init__(
+        self,
+        latency: float = DEFAULT_LATENCY,
+        jitter: float = DEFAULT_JITTER,
+        org_rate: Optional[float] = DEFAULT_ORG_RATE,
+        org_burst: Optional[float] = None,
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.org_rate = org_rate
+        self.org_burst = org_burst or (org_rate and org_rate * DEFAULT_ORG_BURST / DEFAULT_ORG_RATE)
+        self.rng = random.Random(seed)
+        self.state: Dict[str, Any] = {
+            "orgs": {},
+            "networks": {},
+            "net": {},
+            "devices": {},
+            "ports": {},
+            "changes": {},
+            "batches": {},
+        }
+        self.stats: Counter = Counter()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.RLock()
+        self._ids = Counter()
+
+    # -- seeding -------------------------------------------------------------
+
+    def _next(self, kind: str) -> int:
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def add_org(self, name: Optional[str] = None) -> str:
+        org_id = str(100000 + self._next("org"))
+        self.state["orgs"][org_id] = {"id": org_id, "name": name or f"Sim Org {org_id}"}
+        self.state["changes"][org_id] = []
+        return org_id
+
+    def add_network(
+        self,
+        org_id: str,
+        name: Optional[str] = None,
+        product_types: Optional[List[str]] = None,
+        ssids: int = 0,
+        vlans: int = 0,
+        routes: int = 0,
+        l3_rules: int = 0,
+        group_policies: int = 0,
+    ) -> str:
+        net_id = f"L_{org_id}{self._next('net'):04d}"
+        self.state["networks"][net_id] = {
+            "id": net_id,
+            "organizationId": org_id,
+            "name": name or f"Sim Network {net_id}",
+            "productTypes": product_types or ["appliance", "switch", "wireless"],
+            "timeZone": "America/Chicago",
+            "tags": [],
+        }
+        self.state["net"][net_id] = self._network_config(net_id, ssids, vlans, routes, l3_rules, group_policies)
+        return net_id
+
+    def _network_config(self, net_id: str, ssids: int, vlans: int, routes: int, l3_rules: int, policies: int) -> Dict[str, Any]:
+        rng = self.rng
+        cfg: Dict[str, Any] = {
+            "vlanSettings": {"vlansEnabled": vlans > 0},
+            "singleLan": {"subnet": "192.168.128.0/24", "applianceIp": "192.168.128.1"},
+            "vlans": {},
+            "staticRoutes": {},
+            "l3": [],
+            "ssids": [],
+            "ssidSub": {},
+            "groupPolicies": {},
+        }
+        for i in range(vlans):
+            vid = str(10 + i)
+            cfg["vlans"][vid] = {
+                "id": vid,
+                "networkId": net_id,
+                "name": f"VLAN {vid}",
+                "subnet": f"10.{(10 + i) // 256}.{(10 + i) % 256}.0/24",
+                "applianceIp": f"10.{(10 + i) // 256}.{(10 + i) % 256}.1",
+                "dhcpHandling": "Run a DHCP server",
+                "dhcpLeaseTime": rng.choice(["1 hour", "1 day", "1 week"]),
+                "dhcpBootOptionsEnabled": False,
+                "dhcpOptions": [],
+                "reservedIpRanges": [],
+                "fixedIpAssignments": {},
+                "dnsNameservers": "upstream_dns",
+            }
+        for i in range(routes):
+            rid = f"d7fa4948-7921-4dfa-af6b-{self._next('route'):012d}"
+            cfg["staticRoutes"][rid] = {
+                "id": rid,
+                "networkId": net_id,
+                "name": f"Route {i}",
+                "subnet": f"172.{16 + i // 256}.{i % 256}.0/24",
+                "gatewayIp": "10.0.10.254",
+                "enabled": True,
+                "fixedIpAssignments": {},
+                "reservedIpRanges": [],
+            }
+        for i in range(l3_rules):
+            cfg["l3"].append({
+                "comment": f"Rule {i}",
+                "policy": rng.choice(["allow", "deny"]),
+                "protocol": rng.choice(["tcp", "udp"]),
+                "srcPort": "Any",
+                "srcCidr": "Any",
+                "destPort": str(rng.randint(1, 65535)),
+                "destCidr": f"10.{i // 256}.{i % 256}.0/24",
+                "syslogEnabled": False,
+            })
+        for n in range(15):
+            enabled = n < ssids
+            ssid = {
+                "number": n,
+                "name": f"Sim SSID {n}" if enabled else f"Unconfigured SSID {n + 1}",
+                "enabled": enabled,
+                "splashPage": "None",
+                "ssidAdminAccessible": False,
+                "authMode": "psk" if enabled else "open",
+                "ipAssignmentMode": "NAT mode",
+                "minBitrate": 11,
+                "bandSelection": "Dual band operation",
+                "perClientBandwidthLimitUp": 0,
+                "perClientBandwidthLimitDown": 0,
+                "visible": True,
+                "availableOnAllAps": True,
+                "availabilityTags": [],
+            }
+            if enabled:
+                # Like the API, open SSIDs carry no PSK / encryption fields at all.
+                ssid.update(psk=f"sim-psk-{n}", encryptionMode="wpa", wpaEncryptionMode="WPA2 only")
+            cfg["ssids"].append(ssid)
+            cfg["ssidSub"][(n, "trafficShaping/rules")] = {"trafficShapingEnabled": False, "defaultRulesEnabled": True, "rules": []}
+            cfg["ssidSub"][(n, "firewall/l3FirewallRules")] = {"rules": []}
+            cfg["ssidSub"][(n, "firewall/l7FirewallRules")] = {"rules": []}
+            cfg["ssidSub"][(n, "bonjourForwarding")] = {"enabled": False, "rules": []}
+            cfg["ssidSub"][(n, "vpn")] = {"concentrator": {"networkId": None}, "splitTunnel": {"enabled": False}}
+        for i in range(policies):
+            gid = str(100 + i)
+            cfg["groupPolicies"][gid] = {
+                "groupPolicyId": gid,
+                "name": f"Sim Policy {i}",
+                "splashAuthSettings": "network default",
+                "bandwidth": {"settings": "custom", "bandwidthLimits": {"limitUp": 1000 * (i + 1), "limitDown": 5000 * (i + 1)}},
+                "vlanTagging": {"settings": "network default"},
+                "bonjourForwarding": {"settings": "network default", "rules": []},
+            }
+        return cfg
+
+    def add_switch(self, net_id: str, ports: int = 48, model: str = "MS225-48LP") -> str:
+        n = self._next("switch")
+        serial = f"Q2SW-{n // 10000:04d}-{n % 10000:04d}"
+        self.state["devices"][serial] = {
+            "serial": serial,
+            "name": f"sim-switch-{n}",
+            "model": model,
+            "networkId": net_id,
+            "productType": "switch",
+            "mac": f"e0:55:3d:{n >> 16 & 255:02x}:{n >> 8 & 255:02x}:{n & 255:02x}",
+            "configurationUpdatedAt": _now(),
+        }
+        rng = self.rng
+        self.state["ports"][serial] = [
+            {
+                "portId": str(p),
+                "name": f"Port {p}",
+                "tags": [],
+                "enabled": True,
+                "poeEnabled": True,
+                "type": "access" if p <= ports - 4 else "trunk",
+                "vlan": rng.choice([1, 10, 20, 30]),
+                "voiceVlan": None,
+                "allowedVlans": "all",
+                "isolationEnabled": False,
+                "rstpEnabled": True,
+                "stpGuard": "disabled",
+                "linkNegotiation": "Auto negotiate",
+                "accessPolicyType": "Open",
+            }
+            for p in range(1, ports + 1)
+        ]
+        return serial
+
+    def seed(
+        self,
+        orgs: int = 1,
+        networks: int = 1,
+        switches: int = 0,
+        ports: int = 48,
+        ssids: int = 0,
+        vlans: int = 0,
+        routes: int = 0,
+        l3_rules: int = 0,
+        group_policies: int = 0,
+    ) -> Dict[str, List[str]]:
+        """
+        Create *orgs* organisations, each with *networks* networks holding
+        *switches* switches and the given appliance / wireless config.
+        Returns {"orgs": [...], "networks": [...], "switches": [...]}.
+        """
+        inventory: Dict[str, List[str]] = {"orgs": [], "networks": [], "switches": []}
+        with self._lock:
+            for _ in range(orgs):
+                org_id = self.add_org()
+                inventory["orgs"].append(org_id)
+                for _ in range(networks):
+                    net_id = self.add_network(
+                        org_id, ssids=ssids, vlans=vlans, routes=routes, l3_rules=l3_rules, group_policies=group_policies
+                    )
+                    inventory["networks"].append(net_id)
+                    inventory["switches"] += [self.add_switch(net_id, ports) for _ in range(switches)]
+        return inventory
+
+    # -- request handling ----------------------------------------------------
+
+    def delay(self) -> float:
+        with self._lock:
+            return max(0.0, self.latency + self.rng.uniform(-self.jitter, self.jitter))
+
+    def _org_of(self, groups: Dict[str, str]) -> Optional[str]:
+        if "org" in groups:
+            return groups["org"]
+        net = groups.get("net")
+        if net is None and groups.get("serial") in self.state["devices"]:
+            net = self.state["devices"][groups["serial"]]["networkId"]
+        return self.state["networks"].get(net, {}).get("organizationId")
+
+    def _admit(self, org_id: Optional[str]) -> bool:
+        if not self.org_rate or org_id is None:
+            return True
+        with self._lock:
+            bucket = self._buckets.get(org_id)
+            if bucket is None:
+                bucket = self._buckets[org_id] = _Bucket(self.org_rate, self.org_burst)
+        return bucket.admit()
+
+    def _match(self, method: str, path: str) -> Tuple[Callable[..., Reply], Dict[str, str], str]:
+        for verb, pattern, name, template in _ROUTES:
+            m = pattern.match(path)
+            if m and verb == method:
+                return getattr(self, name), m.groupdict(), template
+        raise SimulatorError(404, f"No simulated endpoint for {method} {path}")
+
+    def handle(self, method: str, url: str, body: Any = None) -> Reply:
+        """Answer one API call. *url* may be absolute or an /api/v1 relative path."""
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path.split("/api/v1", 1)[-1]
+        query = urllib.parse.parse_qsl(parts.query)
+        try:
+            handler, groups, template = self._match(method, path)
+        except SimulatorError as exc:
+            self.stats["requests"] += 1
+            return exc.status, {"errors": [str(exc)]}, {}
+        self.stats["requests"] += 1
+        self.stats[f"{method} {template}"] += 1
+        if not self._admit(self._org_of(groups)):
+            self.stats["throttled"] += 1
+            return 429, {"errors": ["API rate limit exceeded for organization"]}, {"Retry-After": "1"}
+        try:
+            with self._lock:
+                return handler(groups, query, body, path=path)
+        except SimulatorError as exc:
+            return exc.status, {"errors": [str(exc)]}, {}
+
+    def reset_stats(self) -> None:
+        self.stats.clear()
+
+    # -- helpers -------------------------------------------------------------
+
+    def _net(self, net_id: str) -> Dict[str, Any]:
+        if net_id not in self.state["net"]:
+            raise SimulatorError(404, f"Network {net_id} not found")
+        return self.state["net"][net_id]
+
+    def _device(self, serial: str) -> Dict[str, Any]:
+        if serial not in self.state["devices"]:
+            raise SimulatorError(404, f"Device {serial} not found")
+        return self.state["devices"][serial]
+
+    def _org(self, org_id: str) -> Dict[str, Any]:
+        if org_id not in self.state["orgs"]:
+            raise SimulatorError(404, f"Organization {org_id} not found")
+        return self.state["orgs"][org_id]
+
+    def _change(self, net_id: Optional[str], page: str, label: str, old: Any, new: Any, org_id: Optional[str] = None) -> None:
+        org_id = org_id or self.state["networks"].get(net_id, {}).get("organizationId")
+        if org_id is None:
+            return
+        self.state["changes"][org_id].append({
+            "ts": _now(),
+            "adminName": "Simulator",
+            "adminEmail": "sim@example.com",
+            "page": page,
+            "label": label,
+            "networkId": net_id,
+            "oldValue": json.dumps(old),
+            "newValue": json.dumps(new),
+        })
+
+    @staticmethod
+    def _params(query: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+        params: Dict[str, List[str]] = {}
+        for key, value in query:
+            params.setdefault(key.rstrip("[]"), []).append(value)
+        return params
+
+    @staticmethod
+    def _page(
+        path: str,
+        query: List[Tuple[str, str]],
+        items: List[Dict[str, Any]],
+        key: Callable[[Dict[str, Any]], str],
+        per_page_default: int,
+        per_page_max: int,
+    ) -> Reply:
+        params = dict(query)
+        per_page = int(params.get("perPage", per_page_default))
+        if not 3 <= per_page <= per_page_max:
+            raise SimulatorError(400, f"perPage must be between 3 and {per_page_max}")
+        start = 0
+        if "startingAfter" in params:
+            keys = [key(i) for i in items]
+            after = params["startingAfter"]
+            start = keys.index(after) + 1 if after in keys else len(items)
+        page = items[start:start + per_page]
+        headers: Dict[str, str] = {}
+        if start + per_page < len(items):
+            rest = [(k, v) for k, v in query if k not in ("perPage", "startingAfter")]
+            rest.append(("perPage", str(per_page)))
+            token = urllib.parse.quote(key(page[-1]), safe="")
+            headers["Link"] = f'<{BASE_URL}{path}?{urllib.parse.urlencode(rest)}&startingAfter={token}>; rel=next'
+        return 200, page, headers
+
+    # -- organizations -------------------------------------------------------
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/networks")
+    def _get_org_networks(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        nets = [n for n in self.state["networks"].values() if n["organizationId"] == g["org"]]
+        return self._page(path, q, nets, lambda n: n["id"], 1000, 10000)
+
+    @_route("POST", r"/organizations/(?P<org>[^/]+)/networks")
+    def _create_network(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        body = body or {}
+        source = body.get("copyFromNetworkId")
+        if source is not None and source not in self.state["networks"]:
+            raise SimulatorError(400, f"copyFromNetworkId {source} not found")
+        if any(n["name"] == body.get("name") and n["organizationId"] == g["org"] for n in self.state["networks"].values()):
+            raise SimulatorError(400, "Name has already been taken")
+        net_id = self.add_network(g["org"], name=body.get("name"), product_types=body.get("productTypes"))
+        net = self.state["networks"][net_id]
+        net["timeZone"] = body.get("timeZone", net["timeZone"])
+        if source is not None:
+            cfg = copy.deepcopy(self.state["net"][source])
+            for vlan in cfg["vlans"].values():
+                vlan["networkId"] = net_id
+            for route in cfg["staticRoutes"].values():
+                route["networkId"] = net_id
+            self.state["net"][net_id] = cfg
+        self._change(net_id, "Networks", "Network created", None, net["name"])
+        return 201, copy.deepcopy(net), {}
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/devices")
+    def _get_org_devices(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        params = self._params(q)
+        nets = {n for n, v in self.state["networks"].items() if v["organizationId"] == g["org"]}
+        devices = [d for d in self.state["devices"].values() if d["networkId"] in nets]
+        if "productTypes" in params:
+            devices = [d for d in devices if d["productType"] in params["productTypes"]]
+        if "networkIds" in params:
+            devices = [d for d in devices if d["networkId"] in params["networkIds"]]
+        if "configurationUpdatedAfter" in params:
+            devices = [d for d in devices if d["configurationUpdatedAt"] > params["configurationUpdatedAfter"][0]]
+        return self._page(path, q, copy.deepcopy(devices), lambda d: d["serial"], 1000, 1000)
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/inventoryDevices")
+    def _get_org_inventory(self, g, q, body, path) -> Reply:
+        # The SDK's smart-flow limiter reads this to map serials to orgs.
+        self._org(g["org"])
+        nets = {n for n, v in self.state["networks"].items() if v["organizationId"] == g["org"]}
+        inventory = [
+            {k: d[k] for k in ("serial", "mac", "model", "networkId", "productType")}
+            for d in self.state["devices"].values()
+            if d["networkId"] in nets
+        ]
+        return self._page(path, q, inventory, lambda d: d["serial"], 1000, 1000)
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/switch/ports/bySwitch")
+    def _get_org_ports_by_switch(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        params = self._params(q)
+        nets = {n for n, v in self.state["networks"].items() if v["organizationId"] == g["org"]}
+        if "networkIds" in params:
+            nets &= set(params["networkIds"])
+        switches = [
+            {
+                "serial": d["serial"],
+                "name": d["name"],
+                "model": d["model"],
+                "mac": d["mac"],
+                "network": {"id": d["networkId"], "name": self.state["networks"][d["networkId"]]["name"]},
+            }
+            for d in self.state["devices"].values()
+            if d["productType"] == "switch" and d["networkId"] in nets
+        ]
+        status, page, headers = self._page(path, q, switches, lambda s: s["serial"], 50, 50)
+        # Copy ports for the returned page only; copying the whole org per page costs pages × fleet.
+        for sw in page:
+            sw["ports"] = copy.deepcopy(self.state["ports"][sw["serial"]])
+        return status, page, headers
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/configurationChanges")
+    def _get_config_changes(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        params = self._params(q)
+        changes = list(reversed(self.state["changes"][g["org"]]))  # newest first, like the API
+        if "t0" in params:
+            changes = [c for c in changes if c["ts"] >= params["t0"][0]]
+        if "networkId" in params:
+            changes = [c for c in changes if c["networkId"] == params["networkId"][0]]
+        return self._page(path, q, changes, lambda c: c["ts"], 5000, 100000)
+
+    @_route("POST", r"/organizations/(?P<org>[^/]+)/actionBatches")
+    def _create_action_batch(self, g, q, body, path) -> Reply:
+        self._org(g["org"])
+        body = body or {}
+        actions = body.get("actions") or []
+        synchronous = bool(body.get("synchronous"))
+        limit = 20 if synchronous else 100
+        if len(actions) > limit:
+            raise SimulatorError(400, f"{'Synchronous' if synchronous else 'Asynchronous'} batches are limited to {limit} actions")
+        batch_id = str(900000 + self._next("batch"))
+        status = {"completed": False, "failed": False, "errors": [], "createdResources": []}
+        if body.get("confirmed"):
+            status = self._run_actions(actions)
+        batch = {
+            "id": batch_id,
+            "organizationId": g["org"],
+            "confirmed": bool(body.get("confirmed")),
+            "synchronous": synchronous,
+            "status": status,
+            "actions": actions,
+        }
+        self.state["batches"][batch_id] = batch
+        reply = copy.deepcopy(batch)
+        if not synchronous:
+            reply["status"]["completed"] = reply["status"]["failed"] = False  # settles on the first poll
+        return 201, reply, {}
+
+    def _run_actions(self, actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        verbs = {"create": "POST", "update": "PUT", "destroy": "DELETE"}
+        plan = []
+        for action in actions:
+            method = verbs.get(action.get("operation"))
+            if method is None:
+                return {"completed": False, "failed": True, "errors": [f"Unknown operation {action.get('operation')}"], "createdResources": []}
+            try:
+                handler, groups, _ = self._match(method, action["resource"])
+                if "net" in groups:
+                    self._net(groups["net"])
+                if "serial" in groups:
+                    self._device(groups["serial"])
+            except SimulatorError as exc:
+                return {"completed": False, "failed": True, "errors": [str(exc)], "createdResources": []}
+            plan.append((handler, groups, action))
+
+        created = []
+        for handler, groups, action in plan:
+            try:
+                status, result, _ = handler(groups, [], action.get("body") or {}, path=action["resource"])
+            except SimulatorError as exc:
+                return {"completed": False, "failed": True, "errors": [str(exc)], "createdResources": created}
+            if action["operation"] == "create" and isinstance(result, dict):
+                created.append({"id": result.get("id") or result.get("groupPolicyId"), "uri": action["resource"]})
+        return {"completed": True, "failed": False, "errors": [], "createdResources": created}
+
+    @_route("GET", r"/organizations/(?P<org>[^/]+)/actionBatches/(?P<batch>[^/]+)")
+    def _get_action_batch(self, g, q, body, path) -> Reply:
+        batch = self.state["batches"].get(g["batch"])
+        if batch is None or batch["organizationId"] != g["org"]:
+            raise SimulatorError(404, f"Action batch {g['batch']} not found")
+        return 200, copy.deepcopy(batch), {}
+
+    # -- networks ------------------------------------------------------------
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)")
+    def _get_network(self, g, q, body, path) -> Reply:
+        self._net(g["net"])
+        return 200, copy.deepcopy(self.state["networks"][g["net"]]), {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/devices")
+    def _get_network_devices(self, g, q, body, path) -> Reply:
+        self._net(g["net"])
+        return 200, [copy.deepcopy(d) for d in self.state["devices"].values() if d["networkId"] == g["net"]], {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/groupPolicies")
+    def _get_group_policies(self, g, q, body, path) -> Reply:
+        return 200, copy.deepcopy(list(self._net(g["net"])["groupPolicies"].values())), {}
+
+    @_route("POST", r"/networks/(?P<net>[^/]+)/groupPolicies")
+    def _create_group_policy(self, g, q, body, path) -> Reply:
+        policies = self._net(g["net"])["groupPolicies"]
+        if any(p["name"] == body.get("name") for p in policies.values()):
+            raise SimulatorError(400, "Name has already been taken")
+        gid = str(100 + len(policies))
+        while gid in policies:
+            gid = str(int(gid) + 1)
+        policies[gid] = {**body, "groupPolicyId": gid}
+        self._change(g["net"], "Group policies", "Group policy created", None, body.get("name"))
+        return 201, copy.deepcopy(policies[gid]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/groupPolicies/(?P<gid>[^/]+)")
+    def _update_group_policy(self, g, q, body, path) -> Reply:
+        policies = self._net(g["net"])["groupPolicies"]
+        if g["gid"] not in policies:
+            raise SimulatorError(404, f"Group policy {g['gid']} not found")
+        old = copy.deepcopy(policies[g["gid"]])
+        policies[g["gid"]].update(body or {})
+        self._change(g["net"], "Group policies", "Group policy updated", old, policies[g["gid"]])
+        return 200, copy.deepcopy(policies[g["gid"]]), {}
+
+    # -- appliance -----------------------------------------------------------
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/appliance/vlans/settings")
+    def _get_vlan_settings(self, g, q, body, path) -> Reply:
+        return 200, copy.deepcopy(self._net(g["net"])["vlanSettings"]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/appliance/vlans/settings")
+    def _update_vlan_settings(self, g, q, body, path) -> Reply:
+        cfg = self._net(g["net"])
+        old = copy.deepcopy(cfg["vlanSettings"])
+        cfg["vlanSettings"].update(body or {})
+        self._change(g["net"], "Addressing & VLANs", "VLANs enabled", old, cfg["vlanSettings"])
+        return 200, copy.deepcopy(cfg["vlanSettings"]), {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/appliance/singleLan")
+    def _get_single_lan(self, g, q, body, path) -> Reply:
+        return 200, copy.deepcopy(self._net(g["net"])["singleLan"]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/appliance/singleLan")
+    def _update_single_lan(self, g, q, body, path) -> Reply:
+        cfg = self._net(g["net"])
+        old = copy.deepcopy(cfg["singleLan"])
+        cfg["singleLan"].update(body or {})
+        self._change(g["net"], "Addressing & VLANs", "Single LAN", old, cfg["singleLan"])
+        return 200, copy.deepcopy(cfg["singleLan"]), {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/appliance/vlans")
+    def _get_vlans(self, g, q, body, path) -> Reply:
+        cfg = self._net(g["net"])
+        if not cfg["vlanSettings"].get("vlansEnabled"):
+            raise SimulatorError(400, "VLANs are not enabled for this network")
+        return 200, copy.deepcopy(list(cfg["vlans"].values())), {}
+
+    @_route("POST", r"/networks/(?P<net>[^/]+)/appliance/vlans")
+    def _create_vlan(self, g, q, body, path) -> Reply:
+        cfg = self._net(g["net"])
+        vid = str((body or {}).get("id", ""))
+        if not vid or vid in cfg["vlans"]:
+            raise SimulatorError(400, f"VLAN id {vid!r} is missing or already exists")
+        cfg["vlans"][vid] = {**body, "id": vid, "networkId": g["net"]}
+        self._change(g["net"], "Addressing & VLANs", "VLAN created", None, cfg["vlans"][vid])
+        return 201, copy.deepcopy(cfg["vlans"][vid]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/appliance/vlans/(?P<vid>[^/]+)")
+    def _update_vlan(self, g, q, body, path) -> Reply:
+        vlans = self._net(g["net"])["vlans"]
+        if g["vid"] not in vlans:
+            raise SimulatorError(404, f"VLAN {g['vid']} not found")
+        old = copy.deepcopy(vlans[g["vid"]])
+        vlans[g["vid"]].update(body or {})
+        self._change(g["net"], "Addressing & VLANs", "VLAN updated", old, vlans[g["vid"]])
+        return 200, copy.deepcopy(vlans[g["vid"]]), {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/appliance/staticRoutes")
+    def _get_static_routes(self, g, q, body, path) -> Reply:
+        return 200, copy.deepcopy(list(self._net(g["net"])["staticRoutes"].values())), {}
+
+    @_route("POST", r"/networks/(?P<net>[^/]+)/appliance/staticRoutes")
+    def _create_static_route(self, g, q, body, path) -> Reply:
+        routes = self._net(g["net"])["staticRoutes"]
+        rid = f"d7fa4948-7921-4dfa-af6b-{self._next('route'):012d}"
+        routes[rid] = {**body, "id": rid, "networkId": g["net"]}
+        self._change(g["net"], "Static routes", "Static route created", None, routes[rid])
+        return 201, copy.deepcopy(routes[rid]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/appliance/staticRoutes/(?P<rid>[^/]+)")
+    def _update_static_route(self, g, q, body, path) -> Reply:
+        routes = self._net(g["net"])["staticRoutes"]
+        if g["rid"] not in routes:
+            raise SimulatorError(404, f"Static route {g['rid']} not found")
+        old = copy.deepcopy(routes[g["rid"]])
+        routes[g["rid"]].update(body or {})
+        self._change(g["net"], "Static routes", "Static route updated", old, routes[g["rid"]])
+        return 200, copy.deepcopy(routes[g["rid"]]), {}
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/appliance/firewall/l3FirewallRules")
+    def _get_l3_rules(self, g, q, body, path) -> Reply:
+        return 200, {"rules": copy.deepcopy(self._net(g["net"])["l3"]) + [dict(_DEFAULT_L3_RULE)]}, {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/appliance/firewall/l3FirewallRules")
+    def _update_l3_rules(self, g, q, body, path) -> Reply:
+        cfg = self._net(g["net"])
+        old = cfg["l3"]
+        cfg["l3"] = [r for r in (body or {}).get("rules", []) if r.get("comment") != _DEFAULT_L3_RULE["comment"]]
+        self._change(g["net"], "Firewall", "L3 firewall rules", old, cfg["l3"])
+        return 200, {"rules": copy.deepcopy(cfg["l3"]) + [dict(_DEFAULT_L3_RULE)]}, {}
+
+    # -- wireless ------------------------------------------------------------
+
+    @_route("GET", r"/networks/(?P<net>[^/]+)/wireless/ssids")
+    def _get_ssids(self, g, q, body, path) -> Reply:
+        return 200, copy.deepcopy(self._net(g["net"])["ssids"]), {}
+
+    @_route("PUT", r"/networks/(?P<net>[^/]+)/wireless/ssids/(?P<num>\d+)")
+    def _update_ssid(self, g, q, body, path) -> Reply:
+        ssids = self._net(g["net"])["ssids"]
+        num = int(g["num"])
+        if num >= len(ssids):
+            raise SimulatorError(404, f"SSID {num} not found")
+        old = copy.deepcopy(ssids[num])
+        ssids[num].update({k: v for k, v in (body or {}).items() if k != "number"})
+        self._change(g["net"], "SSIDs", f"SSID {num}", old, ssids[num])
+        return 200, copy.deepcopy(ssids[num]), {}
+
+    @_route("GET", rf"/networks/(?P<net>[^/]+)/wireless/ssids/(?P<num>\d+)/(?P<sub>{'|'.join(_SSID_SUBS)})")
+    def _get_ssid_sub(self, g, q, body, path) -> Reply:
+        subs = self._net(g["net"])["ssidSub"]
+        key = (int(g["num"]), g["sub"])
+        if key not in subs:
+            raise SimulatorError(404, f"SSID {g['num']} not found")
+        return 200, copy.deepcopy(subs[key]), {}
+
+    @_route("PUT", rf"/networks/(?P<net>[^/]+)/wireless/ssids/(?P<num>\d+)/(?P<sub>{'|'.join(_SSID_SUBS)})")
+    def _update_ssid_sub(self, g, q, body, path) -> Reply:
+        subs = self._net(g["net"])["ssidSub"]
+        key = (int(g["num"]), g["sub"])
+        if key not in subs:
+            raise SimulatorError(404, f"SSID {g['num']} not found")
+        old = copy.deepcopy(subs[key])
+        subs[key].update(body or {})
+        self._change(g["net"], "SSIDs", f"SSID {g['num']} {g['sub']}", old, subs[key])
+        return 200, copy.deepcopy(subs[key]), {}
+
+    # -- devices / switch ----------------------------------------------------
+
+    @_route("GET", r"/devices/(?P<serial>[^/]+)")
+    def _get_device(self, g, q, body, path) -> Reply:
+        dev = self._device(g["serial"])
+        # organizationId lets the SDK's smart-flow limiter map the serial to its org.
+        return 200, {**copy.deepcopy(dev), "organizationId": self._org_of(g)}, {}
+
+    @_route("PUT", r"/devices/(?P<serial>[^/]+)")
+    def _update_device(self, g, q, body, path) -> Reply:
+        dev = self._device(g["serial"])
+        old = copy.deepcopy(dev)
+        dev.update({k: v for k, v in (body or {}).items() if k in ("name", "tags", "address", "notes", "lat", "lng")})
+        dev["configurationUpdatedAt"] = _now()
+        self._change(dev["networkId"], "Devices", f"Device {g['serial']}", old, dev)
+        return 200, copy.deepcopy(dev), {}
+
+    @_route("GET", r"/devices/(?P<serial>[^/]+)/switch/ports")
+    def _get_switch_ports(self, g, q, body, path) -> Reply:
+        self._device(g["serial"])
+        return 200, copy.deepcopy(self.state["ports"][g["serial"]]), {}
+
+    @_route("PUT", r"/devices/(?P<serial>[^/]+)/switch/ports/(?P<port>[^/]+)")
+    def _update_switch_port(self, g, q, body, path) -> Reply:
+        dev = self._device(g["serial"])
+        port_id = urllib.parse.unquote(g["port"])
+        for port in self.state["ports"].get(g["serial"], []):
+            if port["portId"] == port_id:
+                old = copy.deepcopy(port)
+                port.update({k: v for k, v in (body or {}).items() if k != "portId"})
+                dev["configurationUpdatedAt"] = _now()
+                self._change(dev["networkId"], "Switch ports", f"{g['serial']} port {port_id}", old, port)
+                return 200, copy.deepcopy(port), {}
+        raise SimulatorError(404, f"Port {port_id} not found on {g['serial']}")
+
+
+# ---------------------------------------------------------------------------
+# httpx transport + SDK patching
+# ---------------------------------------------------------------------------
+
+class SimulatorTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """httpx transport that answers every request from a Simulator."""
+
+    def __init__(self, sim: Simulator) -> None:
+        self.sim = sim
+
+    def _reply(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content) if request.content else None
+        status, payload, headers = self.sim.handle(request.method, str(request.url), body)
+        content = b"" if payload is None else json.dumps(payload).encode()
+        return httpx.Response(
+            status,
+            headers={"Content-Type": "application/json", **headers},
+            content=content,
+            request=request,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        time.sleep(self.sim.delay())
+        return self._reply(request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(self.sim.delay())
+        return self._reply(request)
+
+
+@contextlib.contextmanager
+def install(sim: Simulator, smart_flow: bool = False) -> Iterator[Simulator]:
+    """
+    Route every meraki.DashboardAPI / meraki.aio.AsyncDashboardAPI created
+    inside the block (and used afterwards) to *sim* instead of the network.
+
+    The SDK's own per-org limiter (smart flow, ~9 req/s) is switched off on
+    those sessions unless *smart_flow* is set; left on, it would be what
+    every measurement measures.
+    """
+    from meraki.session.async_ import AsyncRestSession
+    from meraki.session.sync import RestSession
+
+    transport = SimulatorTransport(sim)
+    originals = (RestSession.__init__, AsyncRestSession.__init__)
+
+    def sync_init(self: Any, *args: Any, **kwargs: Any) -> None:
+        kwargs["smart_flow_enabled"] = smart_flow and kwargs.get("smart_flow_enabled", True)
+        originals[0](self, *args, **kwargs)
+        old = self._client
+        self._client = httpx.Client(transport=transport, headers=old.headers, timeout=old.timeout)
+        old.close()
+
+    def async_init(self: Any, *args: Any, **kwargs: Any) -> None:
+        kwargs["smart_flow_enabled"] = smart_flow and kwargs.get("smart_flow_enabled", True)
+        originals[1](self, *args, **kwargs)
+        old = self._client
+        self._client = httpx.AsyncClient(transport=transport, headers=old.headers, timeout=old.timeout)
+
+    RestSession.__init__ = sync_init
+    AsyncRestSession.__init__ = async_init
+    try:
+        yield sim
+    finally:
+        RestSession.__init__, AsyncRestSession.__init__ = originals
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def add_simulator_args(p: argparse.ArgumentParser) -> None:
+    """Latency / rate-limit / seed options shared with the benchmark harness."""
+    p.add_argument("--latency", type=float, default=DEFAULT_LATENCY, help=f"Seconds per request (default: {DEFAULT_LATENCY})")
+    p.add_argument("--jitter", type=float, default=DEFAULT_JITTER, help=f"± seconds of latency jitter (default: {DEFAULT_JITTER})")
+    p.add_argument(
+        "--org-rate",
+        type=float,
+        default=DEFAULT_ORG_RATE,
+        help=f"Per-org requests/s before answering 429, 0 disables (default: {DEFAULT_ORG_RATE:g})",
+    )
+    p.add_argument("--org-burst", type=float, help="Per-org burst allowance (default: twice --org-rate)")
+    p.add_argument("--seed", type=int, default=0, help="Random seed for generated data and jitter")
+    p.add_argument(
+        "--smart-flow",
+        action="store_true",
+        help="Keep the SDK's own per-org limiter (smart flow) on for the scripts' dashboards (default: off)",
+    )
+
+
+def simulator_from_args(args: argparse.Namespace) -> Simulator:
+    return Simulator(args.latency, args.jitter, args.org_rate or None, args.org_burst, args.seed)
+
+
+def get_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    argv = sys.argv[1:] if argv is None else argv
+    # Everything after "run SCRIPT" belongs to the script, even options that
+    # look like ours (--org, --workers, …), so split before argparse sees it.
+    own, script = (argv[:argv.index("run")], argv[argv.index("run") + 1:]) if "run" in argv else (argv, [])
+
+    p = argparse.ArgumentParser(
+        description="Offline Meraki Dashboard API simulator.",
+        usage="%(prog)s [options] [run SCRIPT [ARGS...]]",
+        epilog="Without 'run', print the seeded inventory as JSON.",
+    )
+    add_simulator_args(p)
+    p.add_argument("--orgs", type=int, default=1, help="Organisations to seed (default: 1)")
+    p.add_argument("--networks", type=int, default=1, help="Networks per organisation (default: 1)")
+    p.add_argument("--switches", type=int, default=0, help="Switches per network (default: 0)")
+    p.add_argument("--ports", type=int, default=48, help="Ports per switch (default: 48)")
+    p.add_argument("--ssids", type=int, default=0, help="Enabled SSIDs per network, max 15 (default: 0)")
+    p.add_argument("--vlans", type=int, default=0, help="VLANs per network (default: 0)")
+    p.add_argument("--routes", type=int, default=0, help="Static routes per network (default: 0)")
+    p.add_argument("--l3-rules", type=int, default=0, help="L3 firewall rules per network (default: 0)")
+    p.add_argument("--group-policies", type=int, default=0, help="Group policies per network (default: 0)")
+    args = p.parse_args(own)
+    if "run" in argv and not script:
+        p.error("run needs a SCRIPT to execute")
+    args.script, args.script_args = (script[0], script[1:]) if script else (None, [])
+    return args
+
+
+def main() -> None:  # pragma: no cover
+    args = get_args()
+    sim = simulator_from_args(args)
+    inventory = sim.seed(
+        args.orgs, args.networks, args.switches, args.ports, min(args.ssids, 15),
+        args.vlans, args.routes, args.l3_rules, args.group_policies,
+    )
+    if args.script is None:
+        print(json.dumps(inventory, indent=4))
+        return
+
+    print(f"[*] Simulating orgs {', '.join(inventory['orgs'])} "
+          f"({len(inventory['networks'])} networks, {len(inventory['switches'])} switches)", file=sys.stderr)
+    sys.argv = [args.script, *args.script_args]
+    started = time.perf_counter()
+    try:
+        with install(sim, smart_flow=args.smart_flow):
+            runpy.run_path(args.script, run_name="__main__")
+    finally:
+        elapsed = time.perf_counter() - started
+        print(f"[*] {sim.stats['requests']} requests ({sim.stats['throttled']} throttled) in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
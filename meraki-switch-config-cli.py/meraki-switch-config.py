@@ -5,28 +5,49 @@ Backup and restore Cisco Meraki switch **port** configurations (no config file).
 
 Features
 - Backup all port settings for a given switch serial to JSON
-- Restore those settings to another switch
+- Fleet backup of every switch in a network or org, in parallel, with an index
+- Incremental fleet backups driven by the org configuration change log
+- Optional content-addressed backup store (deduplicated, gzip/zstd compressed)
+- Restore those settings to another switch (per-port PUTs or action batches)
+- Fan one backup out to many target switches concurrently
 - Automatically renames the target switch to "<original_name>_restored"
 - API key via --api-key or MERAKI_DASHBOARD_API_KEY
+- Client-side token-bucket rate limiting (--rate / --burst, default 10 req/s)
 
 Usage
   Backup:
     python meraki_switch_config_cli.py --api-key $MERAKI_KEY backup --serial Q2XX-AAAA-BBBB
 
+  Fleet backup:
+    python meraki_switch_config_cli.py --api-key $MERAKI_KEY backup --org 123456 --workers 16
+
   Restore:
     python meraki_switch_config_cli.py --api-key $MERAKI_KEY restore \
       --serial Q2XX-CCCC-DDDD \
       --input backups/Q2XX-AAAA-BBBB_backup.json
+
+  Restore to many switches:
+    python meraki_switch_config_cli.py --api-key $MERAKI_KEY restore \
+      --serials Q2XX-CCCC-DDDD,Q2XX-EEEE-FFFF \
+      --input backups/Q2XX-AAAA-BBBB_backup.json
 """
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
+import itertools
 import json
 import os
 import pathlib
+import sqlite3
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     import meraki  # Meraki Dashboard SDK
@@ -34,24 +55,365 @@ except ImportError:  # pragma: no cover
     print("[!] Missing dependency: pip install meraki", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import zstandard  # optional: smaller, faster backup store objects
+except ImportError:  # pragma: no cover
+    zstandard = None
+
 
 # ---------------------------------------------------------------------------
 # Meraki helpers
 # ---------------------------------------------------------------------------
 
-def dashboard_from_key(api_key: str) -> "meraki.DashboardAPI":
-    """Return an authenticated Meraki DashboardAPI instance."""
-    return meraki.DashboardAPI(api_key, suppress_logging=True)
+DEFAULT_RATE = 10.0  # Dashboard API budget per organisation (req/s)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing *rate* requests/s with bursts of *burst*.
+    Callers reserve a token and sleep off any deficit, in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        self.rate = float(rate)
+        self.capacity = float(burst or rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self.max_wait = 0.0
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.calls += 1
+            if wait:
+                self.throttled += 1
+                self.wait_seconds += wait
+                self.max_wait = max(self.max_wait, wait)
+        if wait:
+            time.sleep(wait)
+
+
+class DashboardProxy:
+    """
+    Wrap a DashboardAPI so every endpoint call goes through ``_call``.
+    Subclasses add behaviour there; ``dashboard.batch`` passes through as-is.
+    """
+
+    _SECTIONS = frozenset({"organizations", "networks", "devices", "switch"})
+
+    def __init__(self, dashboard: Any) -> None:
+        self._db = dashboard
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._db, name)
+        if name in self._SECTIONS:
+            return _ProxySection(self, name, attr)
+        return attr
+
+    def _call(self, endpoint: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        return fn(*args, **kwargs)
+
+
+class _ProxySection:
+    def __init__(self, proxy: DashboardProxy, name: str, section: Any) -> None:
+        self._proxy = proxy
+        self._name = name
+        self._section = section
+
+    def __getattr__(self, name: str) -> Any:
+        fn = getattr(self._section, name)
+        if name.startswith("_") or not callable(fn):
+            return fn
+        proxy, endpoint = self._proxy, f"{self._name}.{name}"
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return proxy._call(endpoint, fn, args, kwargs)
+
+        call.__name__ = name
+        return call
+
+
+class RateLimitedDashboard(DashboardProxy):
+    """Hold each API call until the shared token bucket admits it."""
+
+    def __init__(self, dashboard: Any, bucket: TokenBucket) -> None:
+        super().__init__(dashboard)
+        self.bucket = bucket
+
+    def _call(self, endpoint: str, fn: Callable, args: tuple, kwargs: dict) -> Any:
+        self.bucket.acquire()
+        return fn(*args, **kwargs)
+
+
+def dashboard_from_key(api_key: str, rate: float = DEFAULT_RATE, burst: Optional[float] = None) -> "meraki.DashboardAPI":
+    """
+    Return an authenticated Meraki DashboardAPI instance, wrapped in a
+    client-side rate limiter unless *rate* is 0.
+    """
+    dashboard = meraki.DashboardAPI(api_key, suppress_logging=True)
+    return RateLimitedDashboard(dashboard, TokenBucket(rate, burst)) if rate else dashboard
+
+
+def print_rate_stats(dashboard: Any) -> None:
+    if isinstance(dashboard, RateLimitedDashboard):
+        b = dashboard.bucket
+        print(f"[*] Rate limiter: {b.calls} calls, {b.throttled} throttled, "
+              f"{b.wait_seconds:.1f}s waiting (max {b.max_wait:.2f}s)")
 
 
 # ---------------------------------------------------------------------------
 # Backup / Restore functions
 # ---------------------------------------------------------------------------
 
-def backup_switch(dashboard: "meraki.DashboardAPI", serial: str, out_dir: pathlib.Path) -> None:
+DEFAULT_BACKUP_WORKERS = 8
+
+
+def _utc_timestamp() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds") + "Z"
+
+
+BACKUP_FORMATS = ("json", "jsonl", "cas")
+_COMPACT = (",", ":")
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed backup store
+# ---------------------------------------------------------------------------
+#
+#   <store>/store.sqlite3   the whole store in one file, every body compressed:
+#       objects     hash → port config, or a switch's port → hash list;
+#                   each stored once
+#       manifests   (serial, timestamp) → metadata + hash of the port list
+#       runs        timestamp → that run's index.json
+#   <store>/index.json      the newest run's index, as for the other formats
+#
+# Objects are named by the SHA-256 of their canonical JSON, so an unchanged
+# port (or switch) is stored once no matter how many nightly runs reference
+# it. A manifest is addressed as <store>/<serial>@<timestamp>; plain
+# <store>/<serial> is that switch's newest one, found by lookup rather than
+# kept as a copy. Manifests written by cas-manifest-v1 (one file per object
+# under objects/, plain JSON manifests under manifests/) can still be restored.
+
+CAS_FORMAT = "cas-manifest-v2"
+CAS_CODEC = "zstd" if zstandard else "gzip"
+CAS_FILE = "store.sqlite3"
+
+
+def _canonical(obj: Any) -> bytes:
+    return json.dumps(obj, sort_keys=True, separators=_COMPACT).encode()
+
+
+def _compress(raw: bytes) -> Tuple[str, bytes]:
+    return CAS_CODEC, zstandard.ZstdCompressor().compress(raw) if CAS_CODEC == "zstd" else gzip.compress(raw)
+
+
+def _decompress(codec: str, data: bytes, what: Any) -> Any:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError(f"{what} needs the optional 'zstandard' package")
+        return json.loads(zstandard.ZstdDecompressor().decompress(data))
+    return json.loads(gzip.decompress(data))
+
+
+def cas_open(store: pathlib.Path) -> sqlite3.Connection:
+    """Open (creating if needed) the store file. Concurrent writers wait for each other."""
+    store.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(store / CAS_FILE), timeout=60, check_same_thread=False)
+    with conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS objects "
+                     "(hash BLOB PRIMARY KEY, codec TEXT NOT NULL, body BLOB NOT NULL) WITHOUT ROWID")
+        conn.execute("CREATE TABLE IF NOT EXISTS manifests (serial TEXT NOT NULL, stamp TEXT NOT NULL, "
+                     "codec TEXT NOT NULL, body BLOB NOT NULL, PRIMARY KEY (serial, stamp)) WITHOUT ROWID")
+        conn.execute("CREATE TABLE IF NOT EXISTS runs "
+                     "(stamp TEXT PRIMARY KEY, codec TEXT NOT NULL, body BLOB NOT NULL) WITHOUT ROWID")
+    return conn
+
+
+def cas_put(conn: sqlite3.Connection, objs: Iterable[Any]) -> List[str]:
+    """Store each of *objs* (if not already present) and return their hashes."""
+    rows = {}
+    digests = []
+    for obj in objs:
+        raw = _canonical(obj)
+        digest = hashlib.sha256(raw).digest()
+        rows.setdefault(digest, (digest, *_compress(raw)))
+        digests.append(digest.hex())
+    conn.executemany("INSERT OR IGNORE INTO objects VALUES (?, ?, ?)", rows.values())
+    return digests
+
+
+def _legacy_object(store: pathlib.Path, digest: str) -> Any:
+    """Read an object that cas-manifest-v1 wrote as its own file under objects/."""
+    for codec, suffix in (("gzip", ".json.gz"), ("zstd", ".json.zst")):
+        path = store / "objects" / digest[:2] / f"{digest}{suffix}"
+        if path.exists():
+            return _decompress(codec, path.read_bytes(), path)
+    raise KeyError(f"object {digest} not found in store {store}")
+
+
+def _legacy_store(manifest: pathlib.Path) -> pathlib.Path:
+    """The store holding a cas-manifest-v1 file, <store>/manifests/<serial>/<file>."""
+    for parent in manifest.resolve().parents:
+        if parent.name == "manifests":
+            return parent.parent
+    raise ValueError(f"{manifest} is not inside a store's manifests/ directory")
+
+
+def cas_get(store: pathlib.Path, digests: Iterable[str]) -> Iterator[Any]:
+    """Yield the objects for *digests* in order, reading the store lazily."""
+    conn = cas_open(store) if (store / CAS_FILE).exists() else None
+    try:
+        for digest in digests:
+            row = conn and conn.execute(
+                "SELECT codec, body FROM objects WHERE hash = ?", (bytes.fromhex(digest),)
+            ).fetchone()
+            yield _legacy_object(store, digest) if row is None else _decompress(*row, digest)
+    finally:
+        if conn is not None:
+            conn.close()
+
+
+def _stamp(timestamp: str) -> str:
+    return timestamp.replace("-", "").replace(":", "")
+
+
+def write_cas_manifest(store: pathlib.Path, metadata: Dict[str, Any], ports: Iterable[Dict[str, Any]]) -> pathlib.Path:
+    """Store each port as an object plus this run's manifest; return the manifest's address."""
+    serial, stamp = metadata["source_serial"], _stamp(metadata["timestamp"])
+    ports = list(ports)
+    conn = cas_open(store)
+    try:
+        with conn:
+            listing = [{"portId": port.get("portId"), "hash": h} for port, h in zip(ports, cas_put(conn, ports))]
+            manifest = {"format": CAS_FORMAT, "metadata": metadata, "ports": cas_put(conn, [listing])[0]}
+            conn.execute(
+                "INSERT OR REPLACE INTO manifests VALUES (?, ?, ?, ?)", (serial, stamp, *_compress(_canonical(manifest)))
+            )
+    finally:
+        conn.close()
+    return store / f"{serial}@{stamp}"
+
+
+def read_cas_manifest(ref: pathlib.Path) -> Optional[Dict[str, Any]]:
+    """
+    Return the manifest addressed by *ref* (<store>/<serial>[@<timestamp>];
+    a timestamp prefix picks the newest match), or None if *ref* is not a
+    store address. Raises FileNotFoundError when the store has no such
+    manifest.
+    """
+    store = ref.parent
+    if ref.exists() or not (store / CAS_FILE).is_file():
+        return None
+    serial, _, stamp = ref.name.partition("@")
+    conn = cas_open(store)
+    try:
+        row = conn.execute(
+            "SELECT codec, body FROM manifests WHERE serial = ? AND stamp LIKE ? ORDER BY stamp DESC LIMIT 1",
+            (serial, f"{stamp}%"),
+        ).fetchone()
+    finally:
+        conn.close()
+    if row is None:
+        raise FileNotFoundError(f"no manifest {ref.name} in store {store}")
+    return _decompress(*row, ref)
+
+
+def record_cas_run(store: pathlib.Path, index: Dict[str, Any]) -> None:
+    """Keep a store run's index in the store as history."""
+    conn = cas_open(store)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO runs VALUES (?, ?, ?)", (_stamp(index["timestamp"]), *_compress(_canonical(index)))
+            )
+    finally:
+        conn.close()
+
+
+def write_backup(
+    dev: Dict[str, Any],
+    ports: Iterable[Dict[str, Any]],
+    out_dir: pathlib.Path,
+    fmt: str = "json",
+) -> pathlib.Path:
+    """
+    Write one switch's ports to <out_dir>/<serial>_backup.<fmt> and return the path.
+
+    ``json`` is the original pretty-printed document. ``jsonl`` streams a
+    {"metadata": …} header line followed by one compact {"port": …} line per
+    port, so *ports* may be any iterable and is never held in memory.
+    ``cas`` treats *out_dir* as a content-addressed store and returns the
+    address of the run's manifest in it.
+    """
+    serial = dev["serial"]
+    metadata = {
+        "timestamp": _utc_timestamp(),
+        "source_serial": serial,
+        "model": dev.get("model"),
+        "name": dev.get("name"),
+    }
+
+    if fmt == "cas":
+        return write_cas_manifest(out_dir, metadata, ports)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    outfile = out_dir / f"{serial}_backup.{fmt}"
+    with outfile.open("w") as fh:
+        if fmt == "jsonl":
+            fh.write(json.dumps({"metadata": metadata}, separators=_COMPACT) + "\n")
+            for port in ports:
+                fh.write(json.dumps({"port": port}, separators=_COMPACT) + "\n")
+        else:
+            json.dump({"metadata": metadata, "ports": list(ports)}, fh, indent=4)
+    return outfile
+
+
+def load_backup(infile: pathlib.Path) -> Tuple[Dict[str, Any], Iterable[Dict[str, Any]]]:
+    """
+    Return (metadata, ports) from a backup file. For ``.jsonl`` backups and
+    store manifests the ports are a lazy iterator read from disk.
+    """
+    if infile.suffix != ".jsonl":
+        data = read_cas_manifest(infile)
+        if data is not None:
+            # v2 stores the port list as an object too
+            store = infile.parent
+            listing = next(cas_get(store, [data["ports"]]))
+            return data["metadata"], cas_get(store, [p["hash"] for p in listing])
+        with infile.open() as fh:
+            data = json.load(fh)
+        if data.get("format") == "cas-manifest-v1":
+            store = _legacy_store(infile)
+            return data["metadata"], cas_get(store, [p["hash"] for p in data["ports"]])
+        return data.get("metadata", {}), data.get("ports", [])
+
+    fh = infile.open()
+    header = json.loads(fh.readline() or "{}")
+
+    def ports() -> Iterator[Dict[str, Any]]:
+        with fh:
+            for line in fh:
+                if line.strip():
+                    record = json.loads(line)
+                    if "port" in record:
+                        yield record["port"]
+
+    return header.get("metadata", {}), ports()
+
+
+def backup_switch(dashboard: "meraki.DashboardAPI", serial: str, out_dir: pathlib.Path, fmt: str = "json") -> None:
     """
     Back up all port settings for *serial* to JSON in *out_dir*.
-    Output file: <out_dir>/<serial>_backup.json
+    Output file: <out_dir>/<serial>_backup.json (or .jsonl; with ``cas`` a
+    manifest in the store at <out_dir>, addressed as <out_dir>/<serial>@<timestamp>)
     """
     try:
         dev = dashboard.devices.getDevice(serial)
@@ -60,79 +422,597 @@ def backup_switch(dashboard: "meraki.DashboardAPI", serial: str, out_dir: pathli
         sys.exit(1)
 
     ports = dashboard.switch.getDeviceSwitchPorts(serial)
+    outfile = write_backup({**dev, "serial": serial}, ports, out_dir, fmt)
+    print(f"[✓] Backup saved → {outfile}")
 
-    payload: Dict[str, Any] = {
-        "metadata": {
-            "timestamp": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-            "source_serial": serial,
-            "model": dev.get("model"),
-            "name": dev.get("name"),
-        },
-        "ports": ports,
-    }
 
+def list_switches(
+    dashboard: "meraki.DashboardAPI",
+    network_id: Optional[str] = None,
+    org_id: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Enumerate the switches of a network or a whole organisation in one listing."""
+    if org_id:
+        return dashboard.organizations.getOrganizationDevices(org_id, total_pages="all", productTypes=["switch"])
+    devices = dashboard.networks.getNetworkDevices(network_id)
+    return [
+        d for d in devices
+        if d.get("productType") == "switch" or str(d.get("model", "")).startswith("MS")
+    ]
+
+
+def backup_fleet(
+    dashboard: "meraki.DashboardAPI",
+    devices: List[Dict[str, Any]],
+    out_dir: pathlib.Path,
+    workers: int = DEFAULT_BACKUP_WORKERS,
+    scope: Optional[Dict[str, Any]] = None,
+    fmt: str = "json",
+    carried: Iterable[Dict[str, Any]] = (),
+) -> int:
+    """
+    Back up every switch in *devices* through a bounded thread pool, one file
+    per switch plus <out_dir>/index.json. Device details come from the
+    listing, so each switch costs a single getDeviceSwitchPorts call.
+    *carried* index entries (unchanged switches) are kept in the index as-is.
+    Returns the number of switches that failed.
+    """
+
+    def one(dev: Dict[str, Any]) -> Dict[str, Any]:
+        entry = {k: dev.get(k) for k in ("serial", "name", "model", "networkId")}
+        try:
+            ports = dashboard.switch.getDeviceSwitchPorts(dev["serial"])
+            entry["file"] = str(write_backup(dev, ports, out_dir, fmt).relative_to(out_dir))
+            entry["ports"] = len(ports)
+        except meraki.APIError as exc:
+            entry["error"] = str(exc)
+            print(f"  x {dev['serial']}: {exc}", file=sys.stderr)
+        return entry
+
+    print(f"[*] Backing up {len(devices)} switches with {workers} workers…")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        entries = list(pool.map(one, devices))
+    return write_index(list(carried) + entries, out_dir, scope)
+
+
+def write_index(entries: List[Dict[str, Any]], out_dir: pathlib.Path, scope: Optional[Dict[str, Any]] = None) -> int:
+    """Write <out_dir>/index.json for a fleet backup and return the failure count."""
     out_dir.mkdir(parents=True, exist_ok=True)
-    outfile = out_dir / f"{serial}_backup.json"
-    with outfile.open("w") as fh:
-        json.dump(payload, fh, indent=4)
-    print(f"[✓] Backup saved → {outfile}")
+    index = {"timestamp": _utc_timestamp(), "scope": scope or {}, "switches": entries}
+    with (out_dir / "index.json").open("w") as fh:
+        json.dump(index, fh, indent=4)
+    if (out_dir / CAS_FILE).is_file():
+        record_cas_run(out_dir, index)
+
+    failed = sum("error" in e for e in entries)
+    print(f"[✓] Backed up {len(entries) - failed}/{len(entries)} switches → {out_dir} (index.json)")
+    return failed
+
+
+BULK_PAGE_SIZE = 50  # API maximum for getOrganizationSwitchPortsBySwitch
 
 
-def restore_switch(dashboard: "meraki.DashboardAPI", target_serial: str, infile: pathlib.Path) -> None:
+def iter_ports_by_switch(
+    dashboard: "meraki.DashboardAPI",
+    org_id: str,
+    network_ids: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
     """
-    Restore port settings from *infile* onto *target_serial*.
-    Also renames the target switch to "<original_name>_restored" when available.
+    Yield one {serial, name, model, network, ports} record per switch from the
+    org-wide ports-by-switch endpoint. The SDK is switched to its page
+    iterator for the duration, so only one page is held in memory at a time.
+    """
+    session = dashboard._session
+    previous = session.use_iterator_for_get_pages
+    session.use_iterator_for_get_pages = True
+    filters: Dict[str, Any] = {"networkIds": network_ids} if network_ids else {}
+    try:
+        yield from dashboard.switch.getOrganizationSwitchPortsBySwitch(
+            org_id, total_pages="all", perPage=BULK_PAGE_SIZE, **filters
+        )
+    finally:
+        session.use_iterator_for_get_pages = previous
+
+
+def backup_bulk(
+    dashboard: "meraki.DashboardAPI",
+    org_id: str,
+    out_dir: pathlib.Path,
+    network_ids: Optional[List[str]] = None,
+    scope: Optional[Dict[str, Any]] = None,
+    fmt: str = "json",
+    carried: Iterable[Dict[str, Any]] = (),
+) -> int:
     """
-    if not infile.exists():
+    Back up every switch in *org_id* (optionally limited to *network_ids*)
+    from the paginated org-level endpoint, writing each switch's file as its
+    page arrives. Request count scales with pages (50 switches each), not
+    with devices. Returns the number of failures.
+    """
+    print(f"[*] Bulk backup of org {org_id} ({BULK_PAGE_SIZE} switches per request)…")
+    entries: List[Dict[str, Any]] = list(carried)
+    try:
+        for sw in iter_ports_by_switch(dashboard, org_id, network_ids):
+            dev = {**sw, "networkId": (sw.get("network") or {}).get("id")}
+            entry = {k: dev.get(k) for k in ("serial", "name", "model", "networkId")}
+            entry["file"] = str(write_backup(dev, sw.get("ports", []), out_dir, fmt).relative_to(out_dir))
+            entry["ports"] = len(sw.get("ports", []))
+            entries.append(entry)
+    except meraki.APIError as exc:
+        print(f"[!!] Bulk listing failed after {len(entries)} switches: {exc}", file=sys.stderr)
+        entries.append({"serial": None, "error": str(exc)})
+    return write_index(entries, out_dir, scope)
+
+
+# ---------------------------------------------------------------------------
+# Incremental backup
+# ---------------------------------------------------------------------------
+#
+# <out_dir>/.backup-state.json records the scope, the high-water mark of the
+# last run and when the last full pass happened. The next run asks the org
+# configuration change log which networks changed since the mark and only
+# re-reads switches in those networks (plus new or previously failed ones);
+# everything else is carried over from the previous index.json.
+
+STATE_FILE = ".backup-state.json"
+DEFAULT_FULL_EVERY_DAYS = 7
+CHANGELOG_OVERLAP = 300  # seconds re-read before the mark to absorb clock skew
+
+
+def _parse_timestamp(ts: str) -> datetime:
+    return datetime.strptime(ts, "%Y-%m-%dT%H:%M:%SZ")
+
+
+def load_backup_state(out_dir: pathlib.Path, scope: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the previous run's state and index entries if they match *scope*."""
+    try:
+        state = json.loads((out_dir / STATE_FILE).read_text())
+        index = json.loads((out_dir / "index.json").read_text())
+    except (OSError, ValueError):
+        return None
+    if state.get("scope") != scope or index.get("scope") != scope:
+        return None
+    state["switches"] = {e["serial"]: e for e in index.get("switches", []) if e.get("serial")}
+    # A failed bulk listing leaves switches out of the index entirely.
+    state["incomplete"] = any(not e.get("serial") for e in index.get("switches", []))
+    return state
+
+
+def changed_networks(dashboard: "meraki.DashboardAPI", org_id: str, since: str, network_id: Optional[str] = None) -> set:
+    """Network ids with configuration changes in *org_id* since *since*."""
+    t0 = _parse_timestamp(since) - timedelta(seconds=CHANGELOG_OVERLAP)
+    filters: Dict[str, Any] = {"networkId": network_id} if network_id else {}
+    changes = dashboard.organizations.getOrganizationConfigurationChanges(
+        org_id, total_pages="all", t0=t0.isoformat(timespec="seconds") + "Z", **filters
+    )
+    return {c["networkId"] for c in changes if c.get("networkId")}
+
+
+def backup_incremental(
+    dashboard: "meraki.DashboardAPI",
+    out_dir: pathlib.Path,
+    network_id: Optional[str] = None,
+    org_id: Optional[str] = None,
+    workers: int = DEFAULT_BACKUP_WORKERS,
+    fmt: str = "json",
+    bulk: bool = False,
+    full_every: float = DEFAULT_FULL_EVERY_DAYS,
+) -> int:
+    """
+    Back up a network or org, re-reading only switches the change log says
+    were touched since the last run. Falls back to a full pass when there is
+    no usable state or the last full pass is older than *full_every* days.
+    Returns the number of failures.
+    """
+    scope = {"network": network_id} if network_id else {"org": org_id}
+    list_org = org_id
+    org_id = org_id or dashboard.networks.getNetwork(network_id)["organizationId"]
+    started = _utc_timestamp()
+    state = load_backup_state(out_dir, scope)
+
+    full = state is None or state["incomplete"] or (
+        _parse_timestamp(started) - _parse_timestamp(state["lastFull"])
+    ).total_seconds() >= full_every * 86400
+    if full:
+        print("[*] Incremental backup: no recent full pass, backing up everything")
+        if bulk:
+            failed = backup_bulk(dashboard, org_id, out_dir, [network_id] if network_id else None, scope, fmt)
+        else:
+            devices = list_switches(dashboard, network_id=network_id, org_id=list_org)
+            failed = backup_fleet(dashboard, devices, out_dir, workers, scope, fmt)
+    else:
+        changed = changed_networks(dashboard, org_id, state["highWater"], network_id)
+        previous = state["switches"]
+        retry = {s for s, e in previous.items() if "error" in e}
+        print(f"[*] Incremental backup since {state['highWater']}: {len(changed)} changed networks")
+        devices = list_switches(dashboard, network_id=network_id, org_id=list_org)
+        if bulk:
+            # Previously failed and newly added switches are re-read along with their networks;
+            # adding a switch doesn't always show up in the change log.
+            current = {d["serial"] for d in devices}
+            unseen = {d.get("networkId") for d in devices if d["serial"] not in previous}
+            nets = (changed | unseen | {previous[s].get("networkId") for s in retry}) - {None}
+            carried = [e for s, e in previous.items() if s in current and e.get("networkId") not in nets]
+            if nets:
+                failed = backup_bulk(dashboard, org_id, out_dir, sorted(nets), scope, fmt, carried)
+            else:
+                failed = write_index(carried, out_dir, scope)
+        else:
+            todo = [
+                d for d in devices
+                if d.get("networkId") in changed or d["serial"] not in previous or d["serial"] in retry
+            ]
+            skip = {d["serial"] for d in devices} - {d["serial"] for d in todo}
+            carried = [previous[s] for s in sorted(skip)]
+            print(f"[*] {len(todo)} switches changed, {len(carried)} unchanged")
+            failed = backup_fleet(dashboard, todo, out_dir, workers, scope, fmt, carried)
+
+    new_state = {
+        "scope": scope,
+        "highWater": started,
+        "lastFull": started if full else state["lastFull"],
+    }
+    (out_dir / STATE_FILE).write_text(json.dumps(new_state, indent=4))
+    return failed
+
+
+# Only send keys that Meraki allows on updateDeviceSwitchPort
+ALLOWED_PORT_KEYS = frozenset({
+    "name",
+    "tags",
+    "enabled",
+    "type",
+    "vlan",
+    "voiceVlan",
+    "allowedVlans",
+    "poeEnabled",
+    "isolationEnabled",
+    "rstpEnabled",
+    "stpGuard",
+    "linkNegotiation",
+})
+
+# Action batch limits: synchronous batches run at most 20 actions, async ones
+# 100, and an org may have only a few async batches pending at once.
+ACTION_BATCH_SYNC_LIMIT = 20
+ACTION_BATCH_ASYNC_LIMIT = 100
+ACTION_BATCH_MAX_PENDING = 5
+ACTION_BATCH_POLL_SECONDS = 2.0
+
+
+def org_id_for_serial(dashboard: "meraki.DashboardAPI", serial: str) -> str:
+    """Resolve the organisation a device belongs to (device → network → org)."""
+    dev = dashboard.devices.getDevice(serial)
+    return dashboard.networks.getNetwork(dev["networkId"])["organizationId"]
+
+
+def run_action_batches(
+    dashboard: "meraki.DashboardAPI",
+    org_id: str,
+    actions: Iterable[Dict[str, Any]],
+    synchronous: bool = True,
+) -> List[Optional[str]]:
+    """
+    Submit *actions* as confirmed action batches and wait for them to finish.
+    *actions* is consumed one batch at a time. Returns one entry per action:
+    None if it was applied, else the error of the batch it belonged to
+    (batches are atomic, so they fail as a whole).
+    """
+    size = ACTION_BATCH_SYNC_LIMIT if synchronous else ACTION_BATCH_ASYNC_LIMIT
+    actions = iter(actions)
+    chunks = iter(lambda: list(itertools.islice(actions, size)), [])
+    results: List[Optional[str]] = []
+    pending: List[Tuple[int, int, str]] = []  # (offset, count, batch id)
+
+    def settle(offset: int, count: int, status: Dict[str, Any]) -> None:
+        if status.get("failed") or not status.get("completed"):
+            error = "; ".join(map(str, status.get("errors") or [])) or "action batch failed"
+            results[offset:offset + count] = [error] * count
+
+    def wait_for(offset: int, count: int, batch_id: str) -> None:
+        while True:
+            status = dashboard.organizations.getOrganizationActionBatch(org_id, batch_id)["status"]
+            if status.get("completed") or status.get("failed"):
+                settle(offset, count, status)
+                return
+            time.sleep(ACTION_BATCH_POLL_SECONDS)
+
+    for chunk in chunks:
+        offset = len(results)
+        results += [None] * len(chunk)
+        if len(pending) >= ACTION_BATCH_MAX_PENDING:
+            wait_for(*pending.pop(0))
+        try:
+            batch = dashboard.organizations.createOrganizationActionBatch(
+                org_id, actions=chunk, confirmed=True, synchronous=synchronous
+            )
+        except meraki.APIError as exc:
+            results[offset:offset + len(chunk)] = [str(exc)] * len(chunk)
+            continue
+        status = batch.get("status", {})
+        if status.get("completed") or status.get("failed"):
+            settle(offset, len(chunk), status)
+        else:
+            pending.append((offset, len(chunk), batch["id"]))
+
+    for item in pending:
+        wait_for(*item)
+    return results
+
+
+DEFAULT_RESTORE_WORKERS = 8
+
+PortBody = Tuple[str, Dict[str, Any]]
+
+
+def _port_value(value: Any) -> Any:
+    # Dashboard does not guarantee the order of tag lists.
+    return sorted(value, key=str) if isinstance(value, list) else value
+
+
+def plan_ports(
+    bodies: Iterable[PortBody],
+    current: Dict[str, Dict[str, Any]],
+) -> List[Tuple[str, Dict[str, Any], Optional[Dict[str, Tuple[Any, Any]]]]]:
+    """
+    Diff each (port_id, body) against the target's *current* ports (keyed by
+    portId). Returns (port_id, body, changes) for ports that need a PUT, where
+    changes maps key → (current, desired), or is None if the target lacks
+    the port.
+    """
+    plan = []
+    for port_id, body in bodies:
+        have = current.get(str(port_id))
+        if have is None:
+            plan.append((port_id, body, None))
+            continue
+        changes = {
+            k: (have.get(k), v) for k, v in body.items() if _port_value(have.get(k)) != _port_value(v)
+        }
+        if changes:
+            plan.append((port_id, body, changes))
+    return plan
+
+
+def print_plan(
+    plan: List[Tuple[str, Dict[str, Any], Optional[Dict[str, Tuple[Any, Any]]]]],
+    total: int,
+    tag: str = "",
+) -> None:
+    for port_id, _, changes in plan:
+        if changes is None:
+            print(f"  + {tag}Port {port_id}: not present on target")
+            continue
+        diff = ", ".join(f"{k}: {old!r} → {new!r}" for k, (old, new) in sorted(changes.items()))
+        print(f"  ~ {tag}Port {port_id}: {diff}")
+    print(f"[*] {tag}Plan: {len(plan)} to change, {total - len(plan)} unchanged")
+
+
+def put_ports(
+    dashboard: "meraki.DashboardAPI",
+    serial: str,
+    bodies: Iterable[PortBody],
+    workers: int = DEFAULT_RESTORE_WORKERS,
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    PUT each (port_id, body) through a bounded thread pool, reading *bodies*
+    only as fast as the workers drain them. Yields (port_id, error) per port
+    in input order as soon as it is known; error is None on success.
+    """
+
+    def one(item: PortBody) -> Tuple[str, Optional[str]]:
+        port_id, body = item
+        try:
+            dashboard.switch.updateDeviceSwitchPort(serial, port_id, **body)
+        except meraki.APIError as exc:
+            return port_id, str(exc)
+        return port_id, None
+
+    workers = max(1, workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for item in bodies:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(pool.submit(one, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_backup_bodies(infile: pathlib.Path) -> Tuple[Dict[str, Any], Iterator[PortBody]]:
+    """
+    Open *infile* and return (metadata, iterator of (port_id, allowed-keys
+    body)). Ports are read lazily for ``.jsonl`` backups and store manifests.
+    """
+    try:
+        metadata, ports = load_backup(infile)
+    except FileNotFoundError:
         print(f"[!] Backup file not found: {infile}", file=sys.stderr)
         sys.exit(1)
 
-    with infile.open() as fh:
-        data = json.load(fh)
+    ports = iter(ports)
+    first = next(ports, None)
+    if first is None:
+        print("[!] No 'ports' key in backup JSON", file=sys.stderr)
+        sys.exit(1)
+
+    bodies = (
+        (port["portId"], {k: port[k] for k in ALLOWED_PORT_KEYS if k in port and port[k] is not None})
+        for port in itertools.chain([first], ports)
+    )
+    return metadata, bodies
+
 
-    # Rename the target switch first (if original name is available)
-    original_name = data.get("metadata", {}).get("name")
+def apply_backup(
+    dashboard: "meraki.DashboardAPI",
+    target_serial: str,
+    metadata: Dict[str, Any],
+    bodies: Iterable[PortBody],
+    source: str,
+    action_batches: bool = False,
+    synchronous: bool = True,
+    org_id: Optional[str] = None,
+    workers: int = DEFAULT_RESTORE_WORKERS,
+    force: bool = False,
+    plan_only: bool = False,
+    tag: str = "",
+) -> Dict[str, int]:
+    """
+    Apply port *bodies* to *target_serial* (see restore_switch). *bodies* is
+    read once: only the planned changes are held in memory, and with *force*
+    ports are streamed straight to the API. *tag* prefixes per-port lines so
+    concurrent targets stay readable. Returns {"ports", "changed", "failed"}
+    counts.
+    """
+    result = {"ports": 0, "changed": 0, "failed": 0}
+
+    def counted(items: Iterable[PortBody]) -> Iterator[PortBody]:
+        for item in items:
+            result["ports"] += 1
+            yield item
+
+    bodies = counted(bodies)
+    if plan_only or not force:
+        print(f"[*] Planning restore of {source} onto {target_serial}…")
+        current = {str(p["portId"]): p for p in dashboard.switch.getDeviceSwitchPorts(target_serial)}
+        plan = plan_ports(bodies, current)
+        print_plan(plan, result["ports"], tag)
+        bodies = [(port_id, body) for port_id, body, _ in plan]
+        result["changed"] = len(bodies)
+    if plan_only:
+        return result
+
+    # Rename the target switch (if original name is available and it differs)
+    original_name = metadata.get("name")
     if original_name:
         restored_name = f"{original_name}_restored"
         try:
-            dashboard.devices.updateDevice(target_serial, name=restored_name)
-            print(f"[*] Switch renamed to '{restored_name}'")
+            if dashboard.devices.getDevice(target_serial).get("name") != restored_name:
+                dashboard.devices.updateDevice(target_serial, name=restored_name)
+                print(f"[*] Switch {target_serial} renamed to '{restored_name}'")
         except meraki.APIError as exc:
-            print(f"[!] Failed to rename switch: {exc}", file=sys.stderr)
+            print(f"[!] Failed to rename switch {target_serial}: {exc}", file=sys.stderr)
 
-    ports: list[Dict[str, Any]] = data.get("ports", [])
-    if not ports:
-        print("[!] No 'ports' key in backup JSON", file=sys.stderr)
-        sys.exit(1)
+    if force:
+        print(f"[*] Restoring every port from {source} onto {target_serial}…")
+    elif bodies:
+        print(f"[*] Restoring {len(bodies)} ports from {source} onto {target_serial}…")
+    else:
+        print(f"[✓] {target_serial} already matches the backup, nothing to restore")
+        return result
 
-    print(f"[*] Restoring configuration of {len(ports)} ports onto {target_serial}…")
-
-    # Only send keys that Meraki allows on updateDeviceSwitchPort
-    allowed_keys = {
-        "name",
-        "tags",
-        "enabled",
-        "type",
-        "vlan",
-        "voiceVlan",
-        "allowedVlans",
-        "poeEnabled",
-        "isolationEnabled",
-        "rstpEnabled",
-        "stpGuard",
-        "linkNegotiation",
-    }
+    outcomes: Iterable[Tuple[str, Optional[str]]]
+    if action_batches:
+        org_id = org_id or org_id_for_serial(dashboard, target_serial)
+        port_ids: List[str] = []
+
+        def actions() -> Iterator[Dict[str, Any]]:
+            for port_id, body in bodies:
+                port_ids.append(port_id)
+                yield dashboard.batch.switch.updateDeviceSwitchPort(target_serial, port_id, **body)
+
+        errors = run_action_batches(dashboard, org_id, actions(), synchronous)
+        outcomes = zip(port_ids, errors)
+    else:
+        outcomes = put_ports(dashboard, target_serial, bodies, workers)
+
+    pushed = 0
+    for port_id, error in outcomes:
+        pushed += 1
+        if error is None:
+            print(f"  • {tag}Port {port_id}: OK")
+        else:
+            result["failed"] += 1
+            print(f"  x {tag}Port {port_id}: {error}", file=sys.stderr)
+    result["changed"] = pushed
+
+    if result["failed"]:
+        print(f"[!] Restore of {target_serial} finished with {result['failed']}/{pushed} ports failed", file=sys.stderr)
+    else:
+        print(f"[✓] Restore of {target_serial} complete")
+    return result
+
+
+def restore_switch(
+    dashboard: "meraki.DashboardAPI",
+    target_serial: str,
+    infile: pathlib.Path,
+    action_batches: bool = False,
+    synchronous: bool = True,
+    org_id: Optional[str] = None,
+    workers: int = DEFAULT_RESTORE_WORKERS,
+    force: bool = False,
+    plan_only: bool = False,
+) -> int:
+    """
+    Restore port settings from *infile* onto *target_serial*.
+    Also renames the target switch to "<original_name>_restored" when available.
+    The target's current ports are read once and only ports that differ from
+    the backup are pushed (every port with *force*); *plan_only* prints the
+    plan and stops. With *action_batches*, port updates are submitted as
+    Dashboard action batches (atomic per batch); otherwise ports are PUT by
+    *workers* threads. Returns the number of ports that failed.
+    """
+    metadata, bodies = read_backup_bodies(infile)
+    result = apply_backup(
+        dashboard, target_serial, metadata, bodies, infile.name,
+        action_batches, synchronous, org_id, workers, force, plan_only,
+    )
+    return result["failed"]
+
+
+DEFAULT_RESTORE_TARGETS = 4
+
+
+def read_serials(value: Optional[str] = None, path: Optional[pathlib.Path] = None) -> List[str]:
+    """Target serials from a comma-separated list and/or a file (one per line, # comments)."""
+    serials = [s.strip() for s in (value or "").split(",") if s.strip()]
+    if path:
+        for line in path.read_text().splitlines():
+            line = line.split("#", 1)[0].strip()
+            if line:
+                serials.append(line)
+    return list(dict.fromkeys(serials))
 
-    for port in ports:
-        port_id = port["portId"]
-        body = {k: port[k] for k in allowed_keys if k in port and port[k] is not None}
+
+def restore_many(
+    dashboard: "meraki.DashboardAPI",
+    targets: List[str],
+    infile: pathlib.Path,
+    parallel: int = DEFAULT_RESTORE_TARGETS,
+    **options: Any,
+) -> int:
+    """
+    Load *infile* once and apply it to every serial in *targets*, *parallel*
+    switches at a time under the dashboard's shared rate limiter. Prints a
+    per-switch summary table and returns the number of targets that failed.
+    """
+    metadata, lazy = read_backup_bodies(infile)
+    bodies = list(lazy)  # shared by every target
+    print(f"[*] Restoring {infile.name} onto {len(targets)} switches, {parallel} at a time…")
+
+    def one(serial: str) -> Dict[str, Any]:
         try:
-            dashboard.switch.updateDeviceSwitchPort(target_serial, port_id, **body)
-            print(f"  • Port {port_id}: OK")
+            result: Dict[str, Any] = apply_backup(
+                dashboard, serial, metadata, bodies, infile.name, tag=f"{serial} ", **options
+            )
         except meraki.APIError as exc:
-            print(f"  x Port {port_id}: {exc}", file=sys.stderr)
+            print(f"  x {serial}: {exc}", file=sys.stderr)
+            result = {"ports": len(bodies), "changed": 0, "failed": 0, "error": str(exc)}
+        return {"serial": serial, **result}
 
-    print("[✓] Restore complete")
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as pool:
+        results = list(pool.map(one, targets))
+
+    width = max([len("Serial"), *(len(r["serial"]) for r in results)])
+    print(f"\n{'Serial':<{width}}  Ports  Changed  Failed  Status")
+    failed = 0
+    for r in results:
+        status = "ERROR" if "error" in r else "FAILED" if r["failed"] else "OK"
+        failed += status != "OK"
+        print(f"{r['serial']:<{width}}  {r['ports']:>5}  {r['changed']:>7}  {r['failed']:>6}  {status}")
+    print(f"[{'!' if failed else '✓'}] {len(results) - failed}/{len(results)} switches restored")
+    return failed
 
 
 # ---------------------------------------------------------------------------
@@ -151,11 +1031,57 @@ def get_args() -> argparse.Namespace:
         help="Meraki Dashboard API key (falls back to env MERAKI_DASHBOARD_API_KEY)",
     )
 
+    p.add_argument(
+        "--rate",
+        type=float,
+        default=DEFAULT_RATE,
+        help=f"Client-side request budget in req/s, 0 disables (default: {DEFAULT_RATE:g})",
+    )
+    p.add_argument(
+        "--burst",
+        type=float,
+        help="Requests allowed back-to-back before throttling (default: --rate)",
+    )
+
     sp = p.add_subparsers(dest="command", required=True, metavar="{backup,restore}")
 
     # backup
     p_b = sp.add_parser("backup", help="Back up a switch’s port configuration")
-    p_b.add_argument("--serial", required=True, help="Switch serial to back up")
+    target = p_b.add_mutually_exclusive_group(required=True)
+    target.add_argument("--serial", help="Switch serial to back up")
+    target.add_argument("--network", help="Back up every switch in this network")
+    target.add_argument("--org", help="Back up every switch in this organisation")
+    p_b.add_argument(
+        "--format",
+        dest="fmt",
+        choices=BACKUP_FORMATS,
+        default="json",
+        help="json: one pretty-printed document; jsonl: streamed header + one line per port; "
+        "cas: deduplicated, compressed store in --out-dir, one SQLite file holding every run (default: json)",
+    )
+    p_b.add_argument(
+        "--bulk",
+        action="store_true",
+        help="With --network/--org: read ports from the org-wide ports-by-switch endpoint (50 switches per request)",
+    )
+    p_b.add_argument(
+        "--incremental",
+        action="store_true",
+        help="With --network/--org: only re-read switches in networks the change log shows as changed since the last run",
+    )
+    p_b.add_argument(
+        "--full-every",
+        type=float,
+        default=DEFAULT_FULL_EVERY_DAYS,
+        metavar="DAYS",
+        help=f"With --incremental: force a full pass when the last one is this old (default: {DEFAULT_FULL_EVERY_DAYS})",
+    )
+    p_b.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_BACKUP_WORKERS,
+        help=f"Concurrent switches for --network/--org backups (default: {DEFAULT_BACKUP_WORKERS})",
+    )
     p_b.add_argument(
         "--out-dir",
         type=pathlib.Path,
@@ -165,8 +1091,44 @@ def get_args() -> argparse.Namespace:
 
     # restore
     p_r = sp.add_parser("restore", help="Restore config from a backup JSON")
-    p_r.add_argument("--serial", required=True, help="Target switch serial")
-    p_r.add_argument("--input", type=pathlib.Path, required=True, help="Backup JSON path")
+    targets = p_r.add_mutually_exclusive_group(required=True)
+    targets.add_argument("--serial", help="Target switch serial")
+    targets.add_argument("--serials", help="Comma-separated target serials (backup is loaded once)")
+    targets.add_argument("--serials-file", type=pathlib.Path, help="File of target serials, one per line")
+    p_r.add_argument("--input", type=pathlib.Path, required=True, help="Backup path (.json, .jsonl) or store address (<store>/<serial>[@<timestamp>])")
+    p_r.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_RESTORE_WORKERS,
+        help=f"Concurrent port updates when not using action batches (default: {DEFAULT_RESTORE_WORKERS})",
+    )
+    p_r.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_RESTORE_TARGETS,
+        help=f"With --serials/--serials-file: switches restored concurrently (default: {DEFAULT_RESTORE_TARGETS})",
+    )
+    p_r.add_argument(
+        "--plan",
+        action="store_true",
+        help="Only print which ports differ from the target; make no changes",
+    )
+    p_r.add_argument(
+        "--force",
+        action="store_true",
+        help="Push every port from the backup without diffing against the target",
+    )
+    p_r.add_argument(
+        "--action-batches",
+        action="store_true",
+        help="Submit port updates as Dashboard action batches instead of one PUT per port",
+    )
+    p_r.add_argument(
+        "--async-batches",
+        action="store_true",
+        help="With --action-batches: use asynchronous batches (100 actions each, polled)",
+    )
+    p_r.add_argument("--org-id", help="Organisation of the target switch (looked up when omitted)")
 
     return p.parse_args()
 
@@ -182,16 +1144,63 @@ def main() -> None:  # pragma: no cover
         )
         sys.exit(1)
 
-    dashboard = dashboard_from_key(api_key)
+    dashboard = dashboard_from_key(api_key, args.rate, args.burst)
 
-    if args.command == "backup":
-        backup_switch(dashboard, args.serial, args.out_dir)
+    if args.command == "backup" and args.serial:
+        backup_switch(dashboard, args.serial, args.out_dir, args.fmt)
+    elif args.command == "backup":
+        scope = {"network": args.network} if args.network else {"org": args.org}
+        if args.incremental:
+            failed = backup_incremental(
+                dashboard, args.out_dir, args.network, args.org, args.workers, args.fmt, args.bulk, args.full_every
+            )
+        elif args.bulk:
+            org_id = args.org or dashboard.networks.getNetwork(args.network)["organizationId"]
+            network_ids = [args.network] if args.network else None
+            failed = backup_bulk(dashboard, org_id, args.out_dir, network_ids, scope, args.fmt)
+        else:
+            devices = list_switches(dashboard, network_id=args.network, org_id=args.org)
+            failed = backup_fleet(dashboard, devices, args.out_dir, args.workers, scope, args.fmt)
+        if failed:
+            print_rate_stats(dashboard)
+            sys.exit(1)
+    elif args.command == "restore" and not args.serial:
+        failed = restore_many(
+            dashboard,
+            read_serials(args.serials, args.serials_file),
+            args.input,
+            args.parallel,
+            action_batches=args.action_batches,
+            synchronous=not args.async_batches,
+            org_id=args.org_id,
+            workers=args.workers,
+            force=args.force,
+            plan_only=args.plan,
+        )
+        if failed:
+            print_rate_stats(dashboard)
+            sys.exit(1)
     elif args.command == "restore":
-        restore_switch(dashboard, args.serial, args.input)
+        failed = restore_switch(
+            dashboard,
+            args.serial,
+            args.input,
+            action_batches=args.action_batches,
+            synchronous=not args.async_batches,
+            org_id=args.org_id,
+            workers=args.workers,
+            force=args.force,
+            plan_only=args.plan,
+        )
+        if failed:
+            print_rate_stats(dashboard)
+            sys.exit(1)
     else:  # pragma: no cover
         print("[!] Unknown command", file=sys.stderr)
         sys.exit(1)
 
+    print_rate_stats(dashboard)
+
 
 if __name__ == "__main__":  # pragma: no cover
     main()
@@ -0,0 +1,39 @@
+"""Shared fixtures: the scripts (loaded by path, as benchmark.py does) and a
+zero-latency simulator installed under the meraki SDK."""
+import importlib.util
+import pathlib
+import sys
+
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "meraki-api-simulator.py"))
+
+import meraki_simulator  # noqa: E402
+
+
+def _load(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def cloner():
+    return _load(ROOT / "copy_net_from_org_to_other_org.py" / "copy_meraki_network.py", "copy_meraki_network")
+
+
+@pytest.fixture(scope="session")
+def switch_cli():
+    return _load(ROOT / "meraki-switch-config-cli.py" / "meraki-switch-config.py", "meraki_switch_config")
+
+
+@pytest.fixture
+def sim(tmp_path, monkeypatch):
+    """A fresh simulator with no latency or rate limit; the cwd is a temp dir
+    because the cloner writes its validation reports there."""
+    monkeypatch.chdir(tmp_path)
+    simulator = meraki_simulator.Simulator(latency=0, jitter=0, org_rate=None)
+    with meraki_simulator.install(simulator):
+        yield simulator
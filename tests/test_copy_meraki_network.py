@@ -0,0 +1,291 @@
+"""Tests for copy_meraki_network.py against the API simulator."""
+import asyncio
+import json
+import pathlib
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+import meraki_simulator
+import pytest
+
+
+def test_metrics_table_without_calls(cloner):
+    lines = cloner.CallMetrics().table()
+    assert len(lines) == 2
+    assert lines[0].split()[:2] == ["stage", "endpoint"]
+
+
+def test_print_results_empty(cloner, capsys, tmp_path):
+    cloner.print_results([], tmp_path / "results.csv")
+    out = capsys.readouterr().out
+    assert out.splitlines()[0].split() == ["src_net", "dst_name", "dst_org", "status", "dst_net", "seconds", "error"]
+    assert "0/0 networks cloned" in out
+    assert (tmp_path / "results.csv").read_text().startswith("src_net,")
+
+
+def _junit_failures(path):
+    root = ET.parse(path).getroot()
+    return sum(int(suite.get("failures")) for suite in root.iter("testsuite"))
+
+
+def test_skipped_section_passes_json_and_junit(cloner, sim):
+    inv = sim.seed(orgs=2, networks=1, routes=2, l3_rules=3, group_policies=1)
+    src, dst_org = inv["networks"][0], inv["orgs"][1]
+    dst = cloner.clone_network("sim", src, dst_org, use_native=False, rate=0, log_level="ERROR")
+
+    report = json.loads(pathlib.Path(f"network_validation_report_{dst}.json").read_text())
+    assert report["summary"].get("skipped") == 1  # single-LAN source: no VLANs to compare
+    assert report["passed"] is True
+    assert _junit_failures(f"network_validation_report_{dst}.xml") == 0
+
+    route = next(iter(sim.state["net"][dst]["staticRoutes"].values()))
+    route["gatewayIp"] = "10.0.10.253"
+    report = cloner.validate_network(cloner._dashboard("sim", rate=0), src, dst)
+    assert report["passed"] is False
+    assert _junit_failures(f"network_validation_report_{dst}.xml") == 1
+
+
+def _writes(sim):
+    return sum(n for key, n in sim.stats.items() if key.split()[0] in ("POST", "PUT", "DELETE"))
+
+
+def test_disk_cache_sees_destination_drift(cloner, sim, tmp_path):
+    inv = sim.seed(orgs=2, networks=1, vlans=3, routes=2, l3_rules=3, group_policies=2)
+    src, dst_org = inv["networks"][0], inv["orgs"][1]
+    opts = dict(use_native=False, rate=0, log_level="ERROR", cache_dir=tmp_path / "cache")
+    dst = cloner.clone_network("sim", src, dst_org, **opts)
+    cloner.clone_network("sim", src, dst_org, dst_net_id=dst, reconcile=True, **opts)
+
+    cfg = sim.state["net"][dst]
+    route = next(iter(cfg["staticRoutes"].values()))
+    route["gatewayIp"] = "10.0.10.253"
+    cfg["l3"].pop()
+    sim.reset_stats()
+    cloner.clone_network("sim", src, dst_org, dst_net_id=dst, reconcile=True, **opts)
+
+    assert _writes(sim) == 2
+    assert route["gatewayIp"] == "10.0.10.254"
+    # Destination routes are read for the sync and again for validation; the
+    # source comes from disk.
+    assert sim.stats["GET /networks/{net}/appliance/staticRoutes"] == 2
+    assert sim.stats["GET /networks/{net}"] == 0
+    report = json.loads(pathlib.Path(f"network_validation_report_{dst}.json").read_text())
+    assert report["passed"] is True
+
+
+def test_action_batch_polls_bypass_caches(cloner, sim, tmp_path):
+    org = sim.seed()["orgs"][0]
+    sim.state["batches"]["1"] = {"id": "1", "organizationId": org, "status": {"completed": False, "failed": False}}
+    db = cloner._dashboard("sim", rate=0, cache_dir=tmp_path / "cache", cache_scopes=[org])
+
+    assert db.organizations.getOrganizationActionBatch(org, "1")["status"]["completed"] is False
+    sim.state["batches"]["1"]["status"]["completed"] = True
+    assert db.organizations.getOrganizationActionBatch(org, "1")["status"]["completed"] is True
+    assert sim.stats["GET /organizations/{org}/actionBatches/{batch}"] == 2
+
+
+def test_clone_with_async_action_batches(cloner, sim):
+    inv = sim.seed(orgs=2, networks=1, vlans=4, group_policies=3)
+    src, dst_org = inv["networks"][0], inv["orgs"][1]
+    dst = cloner.clone_network("sim", src, dst_org, use_native=False, rate=0, log_level="ERROR", action_batches="async")
+    assert len(sim.state["net"][dst]["vlans"]) == 4
+    assert len(sim.state["net"][dst]["groupPolicies"]) == 3
+    assert sim.stats["GET /organizations/{org}/actionBatches/{batch}"] == 2
+
+
+def test_clone_network_async(cloner, sim):
+    inv = sim.seed(orgs=2, networks=1, vlans=3, routes=2, l3_rules=3, group_policies=2, ssids=2)
+    src, dst_org = inv["networks"][0], inv["orgs"][1]
+    dst = asyncio.run(cloner.clone_network_async("sim", src, dst_org, use_native=False, rate=0))
+
+    report = json.loads(pathlib.Path(f"network_validation_report_{dst}.json").read_text())
+    assert report["passed"] is True
+    assert set(report["summary"]) == {"ok"}
+    source, clone = sim.state["net"][src], sim.state["net"][dst]
+    for kind in ("vlans", "staticRoutes", "groupPolicies"):
+        assert len(clone[kind]) == len(source[kind]), kind
+    assert clone["l3"] == source["l3"]
+    assert [s["name"] for s in clone["ssids"]] == [s["name"] for s in source["ssids"]]
+
+
+@pytest.mark.parametrize("action_batches", [None, "sync"])
+def test_reconcile_updates_drifted_objects_only(cloner, sim, action_batches):
+    inv = sim.seed(orgs=2, networks=1, vlans=2, routes=3, l3_rules=2, group_policies=2)
+    src, dst_org = inv["networks"][0], inv["orgs"][1]
+    opts = dict(use_native=False, rate=0, log_level="ERROR", action_batches=action_batches)
+    dst = cloner.clone_network("sim", src, dst_org, **opts)
+
+    sim.reset_stats()
+    cloner.clone_network("sim", src, dst_org, dst_net_id=dst, reconcile=True, **opts)
+    assert _writes(sim) == 0
+
+    cfg = sim.state["net"][dst]
+    route_id, route = next(iter(cfg["staticRoutes"].items()))
+    route["gatewayIp"] = "10.0.10.253"
+    policy = next(iter(cfg["groupPolicies"].values()))
+    policy["bandwidth"]["bandwidthLimits"]["limitUp"] = 1
+    sim.reset_stats()
+    cloner.clone_network("sim", src, dst_org, dst_net_id=dst, reconcile=True, **opts)
+
+    assert sim.stats[f"PUT /networks/{{net}}/appliance/staticRoutes/{{rid}}"] == 1
+    assert route["gatewayIp"] == "10.0.10.254"
+    assert policy["bandwidth"]["bandwidthLimits"]["limitUp"] == 1000
+    assert len(cfg["groupPolicies"]) == 2
+
+
+def _jobs(cloner, *src_nets):
+    return [dict(dict.fromkeys(cloner._MANIFEST_FIELDS), src_net=net) for net in src_nets]
+
+
+def test_bulk_rate_budget_is_per_org(cloner, sim):
+    (org_a, org_b), (net_a, net_b) = (lambda inv: (inv["orgs"], inv["networks"]))(sim.seed(orgs=2))
+    db = cloner._dashboard("sim", rate=50, per_org_rate=True)
+    limiter = cloner._find_proxy(db, cloner.OrgRateLimitedDashboard)
+    limiter.assign(net_a, org_a)
+
+    db.networks.getNetwork(net_a)
+    db.organizations.getOrganizationNetworks(org_b)
+    token = cloner._ORG.set(org_b)
+    try:
+        db.networks.getNetwork(net_b)  # unassigned: charged to the clone's org
+    finally:
+        cloner._ORG.reset(token)
+    assert {org: bucket.calls for org, bucket in limiter.budgets()} == {org_a: 1, org_b: 2}
+
+
+def test_bulk_default_per_org_cap(cloner, sim, monkeypatch):
+    inv = sim.seed(orgs=1, networks=6)
+    lock, active, peak = threading.Lock(), [0], [0]
+
+    def fake_clone(db, src_info, src_net_id, dst_org_id, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return f"N_{src_net_id}"
+
+    monkeypatch.setattr(cloner, "_clone_with", fake_clone)
+    results = cloner.clone_networks("sim", _jobs(cloner, *inv["networks"]), inv["orgs"][0],
+                                    parallel=4, rate=0, log_level="ERROR")
+    assert [r["dst_net"] for r in results] == [f"N_{net}" for net in inv["networks"]]
+    assert peak[0] == cloner.DEFAULT_PER_ORG_CLONES < 4
+
+
+def test_bulk_org_listing_failure_only_fails_its_rows(cloner, sim, monkeypatch):
+    inv = sim.seed(orgs=2, networks=2)
+    bad_org = inv["orgs"][0]
+    listing = sim._get_org_networks
+
+    def get_org_networks(g, q, body, path):
+        if g["org"] == bad_org:
+            raise meraki_simulator.SimulatorError(403, "Forbidden")
+        return listing(g, q, body, path)
+
+    monkeypatch.setattr(sim, "_get_org_networks", get_org_networks)
+    results = cloner.clone_networks("sim", _jobs(cloner, *inv["networks"], "L_missing"), inv["orgs"][1],
+                                    use_native=False, rate=0, log_level="ERROR")
+    assert [r["status"] for r in results] == ["ok"] * 4 + ["failed"]
+    assert results[-1]["error"] == "source network not found"
+
+
+def _rule(dst_port="any", dst="any", *, policy="allow", comment="", syslog=False):
+    return {"policy": policy, "protocol": "tcp", "srcCidr": "any", "srcPort": "any",
+            "destCidr": dst, "destPort": dst_port, "comment": comment, "syslogEnabled": syslog}
+
+
+def _l3_results(cloner, src, dst):
+    report = cloner._SectionReport("L3 firewall rules:")
+    cloner._check_l3_rules(src, dst, report)
+    return report.results
+
+
+_RULES = [_rule("22"), _rule("80"), _rule("443"), _rule("8080")]
+
+
+@pytest.mark.parametrize("dst, statuses, aligned", [
+    ([*_RULES[:2], _rule("25"), *_RULES[2:]], ["ok"] * 4 + ["extra"], ([(0, 0), (1, 1), (2, 3), (3, 4)], [], [], [2])),
+    ([_RULES[0], *_RULES[2:]], ["ok", "missing", "ok", "ok"], ([(0, 0), (2, 1), (3, 2)], [], [1], [])),
+    ([_RULES[3], *_RULES[:3]], ["ok", "ok", "ok", "moved"], ([(0, 1), (1, 2), (2, 3)], [(3, 0)], [], [])),
+], ids=["insert", "delete", "move"])
+def test_l3_rules_insert_delete_move(cloner, dst, statuses, aligned):
+    assert cloner._align_rules(_RULES, dst) == aligned
+    assert [r["status"] for r in _l3_results(cloner, _RULES, dst)] == statuses
+
+
+def test_l3_duplicate_rules_are_counted(cloner):
+    # One copy of a duplicated rule matches; which one is up to the alignment.
+    results = _l3_results(cloner, [_rule("22"), _rule("22"), _rule("80")], [_rule("22"), _rule("80")])
+    assert sorted(r["status"] for r in results) == ["missing", "ok", "ok"]
+    results = _l3_results(cloner, [_rule("22"), _rule("80")], [_rule("22"), _rule("22"), _rule("80")])
+    assert sorted(r["status"] for r in results) == ["extra", "ok", "ok"]
+
+
+def test_l3_equivalent_rule_spellings_match(cloner):
+    src = [_rule("80-80", "10.0.0.1"), _rule("8000-8080, 443", "10.0.0.2,10.0.0.1")]
+    dst = [_rule("80", "10.0.0.1/32"), _rule("443,8000-8080", "10.0.0.1/32, 10.0.0.2/32")]
+    assert [r["status"] for r in _l3_results(cloner, src, dst)] == ["ok", "ok"]
+    assert cloner._rule_key(_rule("80-81")) != cloner._rule_key(_rule("80"))
+    assert cloner._rule_key(_rule(dst="10.0.0.0/24")) != cloner._rule_key(_rule(dst="10.0.0.1"))
+
+
+def test_l3_default_rule_is_dropped(cloner):
+    default = {"comment": "Default rule", "policy": "allow", "protocol": "Any", "srcCidr": "Any",
+               "srcPort": "Any", "destCidr": "Any", "destPort": "Any", "syslogEnabled": False}
+    assert cloner._without_default_rule([_rule("22"), default]) == [_rule("22")]
+    assert [r["status"] for r in _l3_results(cloner, [_rule("22")], [_rule("22"), default])] == ["ok"]
+    # An allow-any rule the user added is a real rule, not the default.
+    own = {**default, "comment": "allow the rest"}
+    assert cloner._without_default_rule([_rule("22"), own]) == [_rule("22"), own]
+
+
+@pytest.mark.parametrize("field, change", [("comment", {"comment": "ssh"}), ("syslogEnabled", {"syslog": True})])
+def test_l3_note_only_mismatch_on_matched_rule(cloner, field, change):
+    results = _l3_results(cloner, [_rule("22"), _rule("80")], [_rule("22", **change), _rule("80")])
+    assert [r["status"] for r in results] == ["mismatch", "ok"]
+    assert [d["path"] for d in results[0]["diffs"]] == [field]
+
+
+_VLAN = {"id": 10, "name": "Data", "subnet": "10.0.10.0/24", "applianceIp": "10.0.10.1"}
+
+
+@pytest.mark.parametrize("src, dst", [
+    ({"dnsNameservers": "8.8.8.8, 1.1.1.1"}, {"dnsNameservers": "8.8.8.8\n1.1.1.1"}),
+    ({"dnsNameservers": "Upstream_DNS "}, {"dnsNameservers": "upstream_dns"}),
+    ({"dhcpOptions": [{"code": "66", "type": "Text", "value": "tftp"}, {"code": 42, "type": "ip", "value": "10.0.0.5"}]},
+     {"dhcpOptions": [{"code": "42", "type": "ip", "value": "10.0.0.5"}, {"code": 66, "type": "text", "value": "tftp"}]}),
+    ({"dhcpLeaseTime": "1 day", "dhcpOptions": [], "reservedIpRanges": []}, {}),
+    ({"subnet": "10.0.10.7/24", "applianceIp": " 10.0.10.1"}, {}),
+    ({"dhcpHandling": "Do not respond to DHCP requests", "dhcpLeaseTime": "4 hours", "dnsNameservers": "opendns"},
+     {"dhcpHandling": "Do not respond to DHCP requests", "dhcpOptions": [{"code": "3", "type": "ip", "value": "1.1.1.1"}]}),
+    ({"dhcpHandling": "Relay DHCP to another server", "dhcpRelayServerIps": ["10.0.0.9", "10.0.0.8"],
+      "reservedIpRanges": [{"start": "10.0.10.2", "end": "10.0.10.9"}]},
+     {"dhcpHandling": "Relay DHCP to another server", "dhcpRelayServerIps": ["10.0.0.8", "10.0.0.9"]}),
+    ({"dhcpRelayServerIps": ["10.0.0.8"]}, {}),
+], ids=["dns-separators", "dns-keyword", "dhcp-options", "defaults", "addresses", "dhcp-off", "relay", "server"])
+def test_normalize_vlan_equivalent(cloner, src, dst):
+    assert cloner._matches({**_VLAN, **src}, {**_VLAN, **dst}, cloner._normalize_vlan)
+
+
+@pytest.mark.parametrize("src, dst", [
+    ({"dnsNameservers": "8.8.8.8, 1.1.1.1"}, {"dnsNameservers": "1.1.1.1\n8.8.8.8"}),
+    ({"dhcpOptions": [{"code": "66", "type": "text", "value": "tftp"}]},
+     {"dhcpOptions": [{"code": "66", "type": "text", "value": "tftp2"}]}),
+    ({"dhcpLeaseTime": "4 hours"}, {}),
+    ({"subnet": "10.0.20.0/24"}, {}),
+    ({"dhcpHandling": "Relay DHCP to another server", "dhcpRelayServerIps": ["10.0.0.8"]},
+     {"dhcpHandling": "Relay DHCP to another server", "dhcpRelayServerIps": ["10.0.0.9"]}),
+], ids=["dns-order", "dhcp-option-value", "lease-time", "subnet", "relay-servers"])
+def test_normalize_vlan_real_difference(cloner, src, dst):
+    assert not cloner._matches({**_VLAN, **src}, {**_VLAN, **dst}, cloner._normalize_vlan)
+
+
+def test_normalize_route(cloner):
+    route = {"name": "Lab", "subnet": "10.1.0.0/16", "gatewayIp": "10.0.10.254"}
+    current = {"id": "r1", "networkId": "N_1", "name": "Lab ", "subnet": "10.1.0.1/16", "gatewayIp": "10.0.10.254",
+               "enabled": True, "fixedIpAssignments": {}, "reservedIpRanges": []}
+    assert cloner._matches(route, current, cloner._normalize_route)
+    assert not cloner._matches(route, {**current, "gatewayIp": "10.0.10.253"}, cloner._normalize_route)
+    assert not cloner._matches(route, {**current, "enabled": False}, cloner._normalize_route)
@@ -0,0 +1,130 @@
+"""Tests for meraki-switch-config.py against the API simulator."""
+import json
+import pathlib
+import tempfile
+
+import pytest
+
+
+@pytest.fixture
+def switches(sim):
+    return sim.seed(switches=2, ports=8)["switches"]
+
+
+@pytest.fixture
+def db(switch_cli, switches):
+    return switch_cli.dashboard_from_key("sim", rate=0)
+
+
+def test_restore_many_without_targets(switch_cli, db, switches, tmp_path, capsys):
+    switch_cli.backup_switch(db, switches[0], tmp_path)
+    assert switch_cli.restore_many(db, [], tmp_path / f"{switches[0]}_backup.json") == 0
+    assert "0/0 switches restored" in capsys.readouterr().out
+
+
+def test_restore_json_backup_from_shallow_directory(switch_cli, db, switches, sim):
+    source, target = switches
+    shallow = pathlib.Path(tempfile.gettempdir())  # e.g. /tmp: fewer than three parents
+    switch_cli.backup_switch(db, source, shallow)
+    infile = shallow / f"{source}_backup.json"
+    try:
+        sim.state["ports"][target][0]["vlan"] = 999
+        assert switch_cli.restore_switch(db, target, infile) == 0
+    finally:
+        infile.unlink()
+    assert sim.state["ports"][target][0]["vlan"] == sim.state["ports"][source][0]["vlan"]
+
+
+def test_repeat_restore_makes_no_writes(switch_cli, db, switches, sim, tmp_path):
+    source, target = switches
+    switch_cli.backup_switch(db, source, tmp_path)
+    infile = tmp_path / f"{source}_backup.json"
+    sim.state["ports"][target][0]["vlan"] = 999
+    assert switch_cli.restore_switch(db, target, infile) == 0
+    assert sim.state["devices"][target]["name"] == f"{sim.state['devices'][source]['name']}_restored"
+
+    sim.reset_stats()
+    assert switch_cli.restore_switch(db, target, infile) == 0
+    assert [k for k in sim.stats if not k.startswith("GET ") and k != "requests"] == []
+
+
+@pytest.mark.parametrize("action_batches", [False, True])
+@pytest.mark.parametrize("force", [False, True])
+def test_jsonl_restore_reads_lazily(switch_cli, db, switches, sim, tmp_path, force, action_batches):
+    source, target = switches
+    switch_cli.backup_switch(db, source, tmp_path, fmt="jsonl")
+    infile = tmp_path / f"{source}_backup.jsonl"
+
+    metadata, bodies = switch_cli.read_backup_bodies(infile)
+    assert metadata["source_serial"] == source
+    assert not isinstance(bodies, list)
+    assert next(bodies)[0] == "1"
+
+    for port in sim.state["ports"][target]:
+        port["vlan"] = 999
+    result = switch_cli.apply_backup(db, target, metadata, switch_cli.read_backup_bodies(infile)[1], infile.name,
+                                     action_batches=action_batches, force=force)
+    assert result == {"ports": 8, "changed": 8, "failed": 0}
+    assert [p["vlan"] for p in sim.state["ports"][target]] == [p["vlan"] for p in sim.state["ports"][source]]
+
+
+def _disk_usage(path):
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+def test_cas_store_round_trip_dedup_and_size(switch_cli, db, switches, sim, tmp_path, monkeypatch):
+    source, target = switches
+    store = tmp_path / "store"
+    devices = [sim.state["devices"][s] for s in switches]
+    now = ["2026-01-01T00:00:00Z"]
+    monkeypatch.setattr(switch_cli, "_utc_timestamp", lambda: now[0])
+    assert switch_cli.backup_fleet(db, devices, store, fmt="cas") == 0
+    conn = switch_cli.cas_open(store)
+    objects = conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+    size = _disk_usage(store)
+
+    now[0] = "2026-01-02T00:00:00Z"
+    sim.state["ports"][source][0]["vlan"] = 999
+    assert switch_cli.backup_fleet(db, devices, store, fmt="cas") == 0
+    # One changed port and its switch's port list are the only new objects.
+    assert conn.execute("SELECT COUNT(*) FROM objects").fetchone()[0] == objects + 2
+    assert conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0] == 4
+    assert conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 2
+    conn.close()
+    assert sorted(p.name for p in store.iterdir()) == ["index.json", "store.sqlite3"]
+
+    json_dir = tmp_path / "json"
+    switch_cli.backup_fleet(db, devices, json_dir)
+    assert _disk_usage(store) - size < _disk_usage(json_dir)
+
+    _, ports = switch_cli.load_backup(store / f"{source}@20260101")
+    assert next(ports)["vlan"] != 999
+    assert switch_cli.restore_switch(db, target, store / source) == 0
+    assert [p["vlan"] for p in sim.state["ports"][target]] == [p["vlan"] for p in sim.state["ports"][source]]
+
+    with pytest.raises(FileNotFoundError):
+        switch_cli.load_backup(store / "Q2XX-NONE-NONE")
+
+
+def test_bulk_backup_pages_carry_each_switchs_ports(switch_cli, sim, tmp_path):
+    inventory = sim.seed(networks=2, switches=30, ports=4)
+    db = switch_cli.dashboard_from_key("sim", rate=0)
+    assert switch_cli.backup_bulk(db, inventory["orgs"][0], tmp_path) == 0
+    assert sim.stats["GET /organizations/{org}/switch/ports/bySwitch"] == 2
+    for serial in inventory["switches"]:
+        _, ports = switch_cli.load_backup(tmp_path / f"{serial}_backup.json")
+        assert ports == sim.state["ports"][serial]
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_incremental_backup_picks_up_added_switch(switch_cli, sim, tmp_path, bulk):
+    inventory = sim.seed(networks=2, switches=2, ports=4)
+    org, net = inventory["orgs"][0], inventory["networks"][0]
+    db = switch_cli.dashboard_from_key("sim", rate=0)
+    assert switch_cli.backup_incremental(db, tmp_path, org_id=org, bulk=bulk) == 0
+
+    added = sim.add_switch(net, ports=4)  # claiming a switch leaves no configuration change
+    assert switch_cli.backup_incremental(db, tmp_path, org_id=org, bulk=bulk) == 0
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert sorted(e["serial"] for e in index["switches"]) == sorted(inventory["switches"] + [added])
+    assert (tmp_path / f"{added}_backup.json").exists()